@@ -0,0 +1,199 @@
+"""Startup benchmarks, tracking a baseline.
+
+Each target is a statement importing (part of) yadism, executed in a fresh
+interpreter, recording the import time and the number of loaded modules.
+The heavy dependencies loaded by each target are listed as well, since they
+are expected to be imported only on first use.
+
+Usage::
+
+    python benchmarks/performance/startup.py            # compare with baseline
+    python benchmarks/performance/startup.py --update   # store new baseline
+
+The comparison fails (i.e. it exits with a non-zero status) if any target
+exceeds its baseline by more than the threshold in the number of loaded
+modules, while the regressions in time (which depends on the machine) are only
+reported.
+"""
+
+import argparse
+import json
+import pathlib
+import subprocess
+import sys
+
+import rich.console
+import rich.table
+
+here = pathlib.Path(__file__).parent
+baseline_path = here / "startup.json"
+"""Default location of the baseline"""
+
+threshold = 0.25
+"""Default tolerated relative increase of each metric"""
+
+repeat = 5
+"""Default number of runs of each target (the fastest one is kept)"""
+
+metrics = ("time", "modules")
+"""Recorded metrics"""
+
+strict_metrics = ("modules",)
+"""Deterministic metrics, whose regressions fail the comparison"""
+
+heavy = ("eko", "pandas", "rich", "LeProHQ", "adani", "numba", "scipy")
+"""Dependencies expected to be loaded only on first use"""
+
+targets = {
+    "yadism": "import yadism",
+    "output": "from yadism.output import Output",
+    "runner": "from yadism import Runner",
+}
+"""Benchmark targets, as import statements"""
+
+probe = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps(dict(time=elapsed, modules=len(sys.modules), heavy=heavy)))
+"""
+
+
+def run_target(name):
+    """Run a single target, in a fresh interpreter.
+
+    Parameters
+    ----------
+    name : str
+        target name
+
+    Returns
+    -------
+    dict
+        metrics, and loaded heavy dependencies
+    """
+    code = probe.format(statement=targets[name], heavy=heavy)
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    return json.loads(out.stdout.splitlines()[-1])
+
+
+def run(names, repeat=repeat):
+    """Run targets, several times each.
+
+    Parameters
+    ----------
+    names : list(str)
+        targets names
+    repeat : int
+        number of runs of each target, only the fastest is kept
+
+    Returns
+    -------
+    dict
+        metrics, by target
+    """
+    return {
+        name: min(
+            (run_target(name) for _ in range(repeat)),
+            key=lambda metrics: metrics["time"],
+        )
+        for name in names
+    }
+
+
+def compare(results, baseline, threshold=threshold):
+    """Compare the results with the baseline.
+
+    Parameters
+    ----------
+    results : dict
+        metrics, by target
+    baseline : dict
+        baseline metrics, by target
+    threshold : float
+        tolerated relative increase
+
+    Returns
+    -------
+    list(tuple(str, str, float, float))
+        regressions, as target, metric, baseline, and new value
+    """
+    regressions = []
+    for name, values in results.items():
+        if name not in baseline:
+            continue
+        for metric in metrics:
+            reference = baseline[name][metric]
+            if values[metric] > reference * (1.0 + threshold):
+                regressions.append((name, metric, reference, values[metric]))
+    return regressions
+
+
+def table(results, baseline):
+    """Render the results, relative to the baseline."""
+    tab = rich.table.Table(title="Startup")
+    tab.add_column("target")
+    for metric in metrics:
+        tab.add_column(metric, justify="right")
+    tab.add_column("heavy dependencies")
+    for name, values in results.items():
+        cells = []
+        for metric in metrics:
+            cell = f"{values[metric]:.4g}"
+            if name in baseline and baseline[name][metric] > 0:
+                cell += f" ({values[metric] / baseline[name][metric]:.2f}x)"
+            cells.append(cell)
+        tab.add_row(name, *cells, ", ".join(values["heavy"]))
+    return tab
+
+
+def main(argv=None):
+    """Command line interface."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("targets", nargs="*", help="targets to run (default: all)")
+    parser.add_argument("--baseline", type=pathlib.Path, default=baseline_path)
+    parser.add_argument("--threshold", type=float, default=threshold)
+    parser.add_argument("--repeat", type=int, default=repeat)
+    parser.add_argument(
+        "--update", action="store_true", help="store the results as new baseline"
+    )
+    args = parser.parse_args(argv)
+    names = args.targets if len(args.targets) > 0 else list(targets)
+    for name in names:
+        if name not in targets:
+            parser.error(f"unknown target '{name}'")
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    results = run(names, args.repeat)
+
+    console = rich.console.Console()
+    console.print(table(results, baseline))
+    if args.update:
+        baseline.update(results)
+        args.baseline.write_text(
+            json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        console.print(f"Baseline written to {args.baseline}")
+        return 0
+
+    failed = False
+    for name, metric, reference, value in compare(results, baseline, args.threshold):
+        if metric in strict_metrics:
+            failed = True
+            color = "red"
+        else:
+            color = "yellow"
+        console.print(
+            f"[{color}]{name}: {metric} regressed from {reference:.4g} to {value:.4g}"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,399 @@
+"""Performance benchmarks, tracking a baseline.
+
+Each case is a variation of a base calculation, changing a single feature at
+a time (one-hot strategy).
+Every case runs in a fresh process, recording the wall time of the
+calculation (including the application of a toy PDF), the number of QUADPACK
+calls and of integration subintervals, and the peak memory of the process.
+
+Usage::
+
+    python benchmarks/performance/suite.py             # compare with baseline
+    python benchmarks/performance/suite.py --update    # store new baseline
+    python benchmarks/performance/suite.py pto2 tmc3   # only some cases
+
+The times are compared relative to the ``base`` case (which is always run),
+such that the baseline can be compared across machines.
+The comparison fails (i.e. it exits with a non-zero status) if any case
+exceeds its baseline by more than the threshold in any metric; the normalized
+time has its own (looser) threshold, since it is affected by the noise of the
+machine, and single metrics can be only reported with ``--report-only``::
+
+    python benchmarks/performance/suite.py --time-threshold 1.0
+    python benchmarks/performance/suite.py --report-only time peak_memory
+
+The machine the baseline was recorded on is stored in the baseline itself
+(see :func:`provenance`).
+"""
+
+import argparse
+import concurrent.futures
+import copy
+import json
+import multiprocessing
+import pathlib
+import platform
+import resource
+import sys
+import time
+
+import numpy as np
+import rich.console
+import rich.table
+from banana import toy
+from banana.data.theories import default_card as theory_card
+from eko import interpolation
+
+import yadism
+from yadism import log, profiling
+from yadism.esf import conv
+from yadmark.data.observables import default_card as observables_card
+
+here = pathlib.Path(__file__).parent
+baseline_path = here / "baseline.json"
+"""Default location of the baseline"""
+
+threshold = 0.25
+"""Default tolerated relative increase of each metric"""
+
+time_threshold = 0.5
+"""Default tolerated relative increase of the normalized time"""
+
+repeat = 3
+"""Default number of runs of each case (the fastest one is kept)"""
+
+metrics = ("time", "quad_calls", "subintervals", "peak_memory")
+"""Recorded metrics"""
+
+provenance_key = "_provenance"
+"""Baseline entry describing the machine it was recorded on"""
+
+reference_case = "base"
+"""Case the times are normalized to"""
+
+base_theory = dict(
+    theory_card,
+    PTO=1,
+    FNS="ZM-VFNS",
+    NfFF=4,
+    TMC=0,
+    RenScaleVar=False,
+    FactScaleVar=False,
+)
+"""Theory of the base case"""
+
+kinematics = [
+    dict(x=x, Q2=Q2, y=0.5) for Q2 in [4.0, 40.0] for x in [1e-3, 1e-2, 0.1, 0.4]
+]
+"""Kinematic points of all cases"""
+
+base_observables = dict(
+    observables_card,
+    prDIS="NC",
+    interpolation_xgrid=interpolation.make_grid(10, 10).tolist(),
+    observables={"F2_total": kinematics, "FL_total": kinematics},
+)
+"""Observables of the base case"""
+
+
+def xgrid(size):
+    """Logarithmic grid, with about ``size`` points."""
+    return interpolation.make_grid(size // 2, size // 2).tolist()
+
+
+def polarized():
+    """Polarized observables."""
+    return dict(observables={"g1_total": kinematics, "gL_total": kinematics})
+
+
+def nnlo(engine="quad"):
+    """Many convolution points on a denser grid, dominated by the convolutions."""
+    points = [dict(x=x, Q2=40.0, y=0.5) for x in np.geomspace(1e-4, 0.9, 50)]
+    return dict(
+        interpolation_xgrid=xgrid(50),
+        convolution_engine=engine,
+        observables={"F2_total": points, "FL_total": points},
+    )
+
+
+def mixed():
+    """Structure functions, together with a cross section combining them."""
+    observables = dict(base_observables["observables"], XSHERANC=kinematics)
+    return dict(observables=observables)
+
+
+cases = {
+    "base": ({}, {}),
+    "pto0": (dict(PTO=0), {}),
+    "pto2": (dict(PTO=2), {}),
+    "pto3": (dict(PTO=3), {}),
+    "ffns": (dict(FNS="FFNS", NfFF=3), {}),
+    "fonll": (dict(FNS="FONLL-FFNS", NfFF=4), {}),
+    "tmc1": (dict(TMC=1), {}),
+    "tmc2": (dict(TMC=2), {}),
+    "tmc3": (dict(TMC=3), {}),
+    "sv": (dict(RenScaleVar=True, FactScaleVar=True, XIR=2.0, XIF=0.5), {}),
+    "cc": ({}, dict(prDIS="CC")),
+    "xs": ({}, dict(observables={"XSHERANC": kinematics})),
+    "mixed": ({}, mixed()),
+    "polarized": ({}, polarized()),
+    "xgrid50": ({}, dict(interpolation_xgrid=xgrid(50))),
+    "xgrid100": ({}, dict(interpolation_xgrid=xgrid(100))),
+    "fixed": ({}, dict(convolution_engine="fixed")),
+    "nnlo": (dict(PTO=2), nnlo()),
+    "nnlo_fixed": (dict(PTO=2), nnlo("fixed")),
+    "moments": ({}, dict(convolution_engine="moments")),
+    "nnlo_moments": (dict(PTO=2), nnlo("moments")),
+}
+"""Benchmark cases, as updates of the base theory and observables"""
+
+
+def run_case(name):
+    """Run a single case, in the current process.
+
+    Parameters
+    ----------
+    name : str
+        case name
+
+    Returns
+    -------
+    dict
+        metrics
+    """
+    theory_update, observables_update = cases[name]
+    theory = dict(copy.deepcopy(base_theory), **theory_update)
+    observables = dict(copy.deepcopy(base_observables), **observables_update)
+
+    quad = conv.scipy.integrate.quad
+    quad_calls = 0
+
+    def counted_quad(*args, **kwargs):
+        nonlocal quad_calls
+        quad_calls += 1
+        return quad(*args, **kwargs)
+
+    log.silent_mode = True
+    conv.scipy.integrate.quad = counted_quad
+    profile = profiling.Profile()
+    start = time.perf_counter()
+    with profiling.activate(profile):
+        runner = yadism.Runner(theory, observables)
+        out = runner.get_result()
+        out.apply_pdf_alphas_alphaqed_xir_xif(
+            toy.mkPDF("", 0),
+            lambda _muR: 0.118,
+            lambda _muR: 1.0 / 137.0,
+            theory["XIR"],
+            theory["XIF"],
+        )
+    elapsed = time.perf_counter() - start
+    conv.scipy.integrate.quad = quad
+
+    return dict(
+        time=elapsed,
+        quad_calls=quad_calls,
+        subintervals=sum(entry[2] for entry in profile.entries.values()),
+        # kilobytes on Linux
+        peak_memory=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    )
+
+
+def provenance():
+    """Describe the machine and the environment of the current run.
+
+    Returns
+    -------
+    dict
+        description, stored in the baseline under :attr:`provenance_key`
+    """
+    return dict(
+        machine=platform.machine(),
+        processor=platform.processor(),
+        cpus=multiprocessing.cpu_count(),
+        system=platform.platform(),
+        python=platform.python_version(),
+        yadism=yadism.__version__,
+        date=time.strftime("%Y-%m-%d"),
+    )
+
+
+def run(names, repeat=repeat):
+    """Run cases, each in a fresh process.
+
+    Parameters
+    ----------
+    names : list(str)
+        cases names
+    repeat : int
+        number of runs of each case, only the fastest is kept
+
+    Returns
+    -------
+    dict
+        metrics, by case
+    """
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for name in names:
+        runs = []
+        for _ in range(repeat):
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=1, mp_context=context
+            ) as executor:
+                runs.append(executor.submit(run_case, name).result())
+        results[name] = min(runs, key=lambda metrics: metrics["time"])
+    return results
+
+
+def normalize(results):
+    """Express the times relative to the reference case.
+
+    Parameters
+    ----------
+    results : dict
+        metrics, by case (including :attr:`reference_case`)
+
+    Returns
+    -------
+    dict
+        metrics, by case, with relative times
+    """
+    reference = results[reference_case]["time"]
+    return {
+        name: dict(values, time=values["time"] / reference)
+        for name, values in results.items()
+        if name != provenance_key
+    }
+
+
+def compare(results, baseline, threshold=threshold, time_threshold=time_threshold):
+    """Compare the results with the baseline.
+
+    The times are compared relative to :attr:`reference_case`, since the
+    absolute ones depend on the machine.
+
+    Parameters
+    ----------
+    results : dict
+        metrics, by case
+    baseline : dict
+        baseline metrics, by case
+    threshold : float
+        tolerated relative increase
+    time_threshold : float
+        tolerated relative increase of the normalized time
+
+    Returns
+    -------
+    list(tuple(str, str, float, float))
+        regressions, as case, metric, baseline, and new value
+    """
+    results = normalize(results)
+    baseline = normalize(baseline)
+    regressions = []
+    for name, values in results.items():
+        if name not in baseline:
+            continue
+        for metric in metrics:
+            reference = baseline[name][metric]
+            tolerance = time_threshold if metric == "time" else threshold
+            if values[metric] > reference * (1.0 + tolerance):
+                regressions.append((name, metric, reference, values[metric]))
+    return regressions
+
+
+def table(results, baseline):
+    """Render the results, relative to the baseline.
+
+    The times are shown in seconds, and compared to the baseline relative to
+    :attr:`reference_case`.
+    """
+    norm_results = normalize(results)
+    norm_baseline = normalize(baseline) if reference_case in baseline else {}
+    tab = rich.table.Table(title="Performance")
+    tab.add_column("case")
+    for metric in metrics:
+        tab.add_column(metric, justify="right")
+    for name, values in results.items():
+        cells = []
+        for metric in metrics:
+            cell = f"{values[metric]:.4g}"
+            if name in norm_baseline and norm_baseline[name][metric] > 0:
+                ratio = norm_results[name][metric] / norm_baseline[name][metric]
+                cell += f" ({ratio:.2f}x)"
+            cells.append(cell)
+        tab.add_row(name, *cells)
+    return tab
+
+
+def main(argv=None):
+    """Command line interface."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cases", nargs="*", help="cases to run (default: all)")
+    parser.add_argument("--baseline", type=pathlib.Path, default=baseline_path)
+    parser.add_argument("--threshold", type=float, default=threshold)
+    parser.add_argument("--time-threshold", type=float, default=time_threshold)
+    parser.add_argument(
+        "--report-only",
+        nargs="+",
+        choices=metrics,
+        default=[],
+        metavar="METRIC",
+        help="metrics whose regressions are reported, without failing",
+    )
+    parser.add_argument("--repeat", type=int, default=repeat)
+    parser.add_argument(
+        "--update", action="store_true", help="store the results as new baseline"
+    )
+    args = parser.parse_args(argv)
+    names = args.cases if len(args.cases) > 0 else list(cases)
+    for name in names:
+        if name not in cases:
+            parser.error(f"unknown case '{name}'")
+    # the times are normalized to the reference case
+    if reference_case not in names:
+        names.insert(0, reference_case)
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    results = run(names, args.repeat)
+
+    console = rich.console.Console()
+    if provenance_key in baseline:
+        recorded = baseline[provenance_key]
+        console.print(
+            "Baseline recorded on "
+            + ", ".join(f"{key}: {value}" for key, value in recorded.items())
+        )
+    console.print(table(results, baseline))
+    if args.update:
+        baseline.update(results)
+        baseline[provenance_key] = provenance()
+        args.baseline.write_text(
+            json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        console.print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if reference_case not in baseline:
+        console.print(f"[red]Baseline without the '{reference_case}' case")
+        return 1
+    failed = False
+    for name, metric, reference, value in compare(
+        results, baseline, args.threshold, args.time_threshold
+    ):
+        if metric not in args.report_only:
+            failed = True
+            color = "red"
+        else:
+            color = "yellow"
+        console.print(
+            f"[{color}]{name}: {metric} regressed from {reference:.4g} to {value:.4g}"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
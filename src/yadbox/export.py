@@ -1,11 +1,14 @@
 """Export predictions to PineAPPL."""
 
+import concurrent.futures
 import json
+import pathlib
 
 import numpy as np
 
 import yadism
 from yadism import observable_name
+from yadism.output import Output
 
 
 def dump_pineappl_to_file(output, filename, obsname):
@@ -86,6 +89,12 @@ def dump_pineappl_to_file(output, filename, obsname):
     on = observable_name.ObservableName(obsname)
     is_xs = on.kind in observable_name.xs
 
+    # index and normalization of each order
+    order_map = {
+        o: (j, ((1.0 / (4.0 * np.pi)) ** o[0]) * ((-1.0) ** o[2]) * ((-1.0) ** o[3]))
+        for j, o in enumerate(first_esf_result.orders)
+    }
+
     # add each ESF as a bin
     for bin_, obs in enumerate(output[obsname]):
         x = obs.x
@@ -97,21 +106,15 @@ def dump_pineappl_to_file(output, filename, obsname):
 
         # add all orders
         for o, (v, _e) in obs.orders.items():
-            order_index = list(first_esf_result.orders.keys()).index(o)
-            prefactor = (
-                ((1.0 / (4.0 * np.pi)) ** o[0]) * ((-1.0) ** o[2]) * ((-1.0) ** o[3])
-            )
-            # add for each pid/lumi
-            for pid_index, pid_values in enumerate(v):
-                pid_values = prefactor * pid_values
-                # grid is empty? skip
-                if not any(np.array(pid_values) != 0):
-                    continue
+            order_index, prefactor = order_map[o]
+            values = prefactor * np.asarray(v)
+            # add for each non-empty pid/lumi
+            for pid_index in np.flatnonzero(np.any(values != 0, axis=1)):
                 subgrid = pineappl.subgrid.ImportSubgridV1(
-                    array=pid_values[np.newaxis, :],
+                    array=values[pid_index][np.newaxis, :],
                     node_values=[[Q2], interpolation_xgrid],
                 )
-                grid.set_subgrid(order_index, bin_, pid_index, subgrid.into())
+                grid.set_subgrid(order_index, bin_, int(pid_index), subgrid.into())
     # set the correct observables
     normalizations = [1.0] * bins
     bin_configs = pineappl.boc.BinsWithFillLimits.from_limits_and_normalizations(
@@ -140,3 +143,72 @@ def dump_pineappl_to_file(output, filename, obsname):
     # dump file
     grid.optimize()
     grid.write_lz4(filename)
+
+
+def dump_pineappl_to_folder(output, folder, obsnames=None, workers=None):
+    """Write several observables on separate PineAPPL grid files.
+
+    Each observable is written to ``<folder>/<obsname>.pineappl.lz4``, and
+    the grids are filled and written concurrently on a process pool.
+
+    Parameters
+    ----------
+    output : yadism.output.Output
+        output to export
+    folder : os.PathLike
+        output folder
+    obsnames : list(str) or None
+        observables to be dumped (default: all the non-empty ones)
+    workers : int or None
+        number of processes (default: :func:`yadism.runner.default_workers`,
+        i.e. ``YADISM_WORKERS``)
+
+    Returns
+    -------
+    dict
+        paths of the grid files, by observable
+
+    """
+    folder = pathlib.Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    if obsnames is None:
+        obsnames = [
+            name
+            for name, points in output.items()
+            if observable_name.ObservableName.is_valid(name)
+            and points is not None
+            and len(points) > 0
+        ]
+    if workers is None:
+        from yadism import runner  # pylint: disable=import-outside-toplevel
+
+        workers = runner.default_workers()
+
+    # the workers only receive the observable they have to export
+    common = {
+        key: value
+        for key, value in output.items()
+        if not observable_name.ObservableName.is_valid(key)
+    }
+    jobs = {}
+    for obsname in obsnames:
+        single = Output(common)
+        single.theory = output.theory
+        single.observables = output.observables
+        single[obsname] = list(output[obsname])
+        jobs[obsname] = (single, folder / f"{obsname}.pineappl.lz4")
+
+    if workers <= 1 or len(jobs) <= 1:
+        for obsname, (single, path) in jobs.items():
+            dump_pineappl_to_file(single, path, obsname)
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(workers, len(jobs))
+        ) as executor:
+            futures = [
+                executor.submit(dump_pineappl_to_file, single, path, obsname)
+                for obsname, (single, path) in jobs.items()
+            ]
+            for future in futures:
+                future.result()
+    return {obsname: path for obsname, (_single, path) in jobs.items()}
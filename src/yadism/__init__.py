@@ -1,12 +1,34 @@
-"""Yet Another DIS Module."""
+"""Yet Another DIS Module.
+
+The submodules (and :class:`Runner`) are only imported on first access, in
+order to keep ``import yadism`` cheap, e.g. for worker processes and for
+helpers only loading stored outputs.
+"""
+
+import importlib
+import typing
 
 from . import version
-from .runner import Runner
+
+if typing.TYPE_CHECKING:
+    from .runner import Runner
 
 __version__ = version.__version__
 
 
-def run_yadism(theory: dict, observables: dict):
+def __getattr__(name):
+    """Import :class:`Runner` and the submodules on first access."""
+    if name == "Runner":
+        return importlib.import_module(".runner", __name__).Runner
+    try:
+        return importlib.import_module(f".{name}", __name__)
+    except ModuleNotFoundError as err:
+        if err.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+
+
+def run_yadism(theory: dict, observables: dict, cache_dir=None):
     r"""Call yadism runner.
 
     Get the theory and observables description and computes the
@@ -19,6 +41,8 @@ def run_yadism(theory: dict, observables: dict):
     observables: dict
         Dictionary containing the DIS parameters such as
         process description and kinematic specifications
+    cache_dir: os.PathLike or None
+        persistent cache folder, see :class:`Runner`
 
     Returns
     -------
@@ -27,5 +51,7 @@ def run_yadism(theory: dict, observables: dict):
         grids
 
     """
-    runner = Runner(theory, observables)
+    from .runner import Runner  # pylint: disable=import-outside-toplevel
+
+    runner = Runner(theory, observables, cache_dir=cache_dir)
     return runner.get_result()
@@ -0,0 +1,236 @@
+"""Persistent, content-addressed, on-disk cache.
+
+Entries are identified by the hash of their inputs (see :func:`key`), and
+stored as plain NumPy files in subfolders of a cache folder. The cache folder
+is either passed explicitly, or read from the ``YADISM_CACHE_DIR`` environment
+variable; if none is given the cache is not used at all.
+
+Since writes are atomic, the same folder can be shared by several concurrent
+processes.
+
+The entries are invalidated by any change of the package version.
+In source and editable checkouts the version is only a placeholder, so the
+hash of the package sources is used instead (see :func:`code_version`), and
+any edit of them invalidates the whole cache.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import zipfile
+
+import numpy as np
+
+from . import version
+
+logger = logging.getLogger(__name__)
+
+default_cache_dir = os.environ.get("YADISM_CACHE_DIR")
+"""Default cache folder (if any)"""
+
+placeholder_version = "0.0.0"
+"""Version of source and editable checkouts (see :mod:`yadism.version`)"""
+
+
+@functools.cache
+def code_version():
+    """Identify the code computing the entries.
+
+    Released packages are identified by their version, while checkouts (where
+    the version is just :attr:`placeholder_version`) by the hash of their
+    sources, which is computed once per process.
+
+    Returns
+    -------
+    str
+        version, or hexadecimal digest of the sources
+    """
+    if version.__version__ != placeholder_version:
+        return version.__version__
+    root = pathlib.Path(__file__).parent
+    digest = hashlib.sha256()
+    for path in sorted(root.rglob("*.py")):
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _jsonable(obj):
+    """Convert NumPy objects for JSON serialization."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not hashable")
+
+
+def key(*parts, versioned=True):
+    """Compute the content address of an entry.
+
+    The address depends on the code as well (see :func:`code_version`),
+    unless ``versioned`` is false.
+
+    Parameters
+    ----------
+    parts : any
+        JSON serializable inputs identifying the entry (NumPy arrays are
+        accepted as well)
+    versioned : bool
+        whether to include the code version in the address
+
+    Returns
+    -------
+    str
+        hexadecimal digest
+    """
+    if versioned:
+        parts = (code_version(), *parts)
+    payload = json.dumps(list(parts), sort_keys=True, default=_jsonable)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def resolve(cache_dir=None):
+    """Determine the cache folder.
+
+    Parameters
+    ----------
+    cache_dir : os.PathLike or None
+        explicit folder, falls back on :attr:`default_cache_dir`
+
+    Returns
+    -------
+    pathlib.Path or None
+        cache folder, if any
+    """
+    if cache_dir is None:
+        cache_dir = default_cache_dir
+    if cache_dir is None:
+        return None
+    return pathlib.Path(cache_dir)
+
+
+def _read(path):
+    """Read a NumPy file, ignoring missing or corrupted entries."""
+    if not path.exists():
+        return None
+    try:
+        content = np.load(path, allow_pickle=False)
+        if isinstance(content, np.lib.npyio.NpzFile):
+            with content:
+                return dict(content)
+        return content
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        logger.warning("Ignoring corrupted cache entry %s", path)
+        return None
+
+
+def _write(path, writer, content):
+    """Atomically write a NumPy file.
+
+    The file is first written to a temporary file in the same folder, and
+    then moved in place, such that concurrent readers never see a partial
+    entry.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fo:
+            writer(fo, content)
+        os.replace(tmp, path)
+    except BaseException:
+        pathlib.Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def load(cache_dir, kind, digest):
+    """Load an array from the cache.
+
+    Parameters
+    ----------
+    cache_dir : pathlib.Path or None
+        cache folder
+    kind : str
+        subfolder, i.e. kind of entry
+    digest : str
+        entry address, see :func:`key`
+
+    Returns
+    -------
+    np.ndarray or None
+        cached array, if available
+    """
+    if cache_dir is None:
+        return None
+    return _read(cache_dir / kind / f"{digest}.npy")
+
+
+def save(cache_dir, kind, digest, array):
+    """Store an array in the cache.
+
+    Parameters
+    ----------
+    cache_dir : pathlib.Path or None
+        cache folder
+    kind : str
+        subfolder, i.e. kind of entry
+    digest : str
+        entry address, see :func:`key`
+    array : np.ndarray
+        array to store
+    """
+    if cache_dir is None:
+        return
+    _write(
+        cache_dir / kind / f"{digest}.npy",
+        lambda fo, array: np.save(fo, array, allow_pickle=False),
+        np.asarray(array),
+    )
+
+
+def load_arrays(cache_dir, kind, digest):
+    """Load a collection of arrays from the cache.
+
+    Parameters
+    ----------
+    cache_dir : pathlib.Path or None
+        cache folder
+    kind : str
+        subfolder, i.e. kind of entry
+    digest : str
+        entry address, see :func:`key`
+
+    Returns
+    -------
+    dict or None
+        cached arrays, if available
+    """
+    if cache_dir is None:
+        return None
+    return _read(cache_dir / kind / f"{digest}.npz")
+
+
+def save_arrays(cache_dir, kind, digest, arrays):
+    """Store a collection of arrays in the cache.
+
+    Parameters
+    ----------
+    cache_dir : pathlib.Path or None
+        cache folder
+    kind : str
+        subfolder, i.e. kind of entry
+    digest : str
+        entry address, see :func:`key`
+    arrays : dict
+        arrays to store, by name
+    """
+    if cache_dir is None:
+        return
+    _write(
+        cache_dir / kind / f"{digest}.npz",
+        lambda fo, arrays: np.savez(fo, **arrays),
+        arrays,
+    )
@@ -0,0 +1,187 @@
+"""Unweighted partonic channels, for the electroweak reweighting.
+
+The electroweak parameters (the weak mixing angle, the boson masses, the
+projectile polarization, ...) only enter the structure functions through the
+weights of the partonic channels (see
+:mod:`yadism.coefficient_functions.kernels`), and the normalization of the
+cross sections.
+The convolutions of the channels, i.e. the expensive part of the calculation,
+do not depend on them.
+
+If a channels folder is given to the runner (see
+:class:`yadism.runner.Runner`), the unweighted convolutions of all the
+channels are stored, per structure function and kinematic point, and they are
+reused by any later run with the same runcards, up to the electroweak
+parameters (see :func:`reweight`).
+The entries are stored with :mod:`yadism.cache`, in the ``channels``
+subfolder.
+"""
+
+import pathlib
+
+import numpy as np
+
+from . import cache
+
+ew_theory = ("SIN2TW", "MZ", "MW", "GF")
+"""Electroweak parameters of the theory runcard"""
+
+ew_observables = ("PolarizationDIS", "PropagatorCorrection")
+"""Electroweak parameters of the observables runcard"""
+
+
+def reference(theory, observables):
+    """Compute the address of the runcards, up to the electroweak parameters.
+
+    Parameters
+    ----------
+    theory : dict
+        theory runcard
+    observables : dict
+        observables runcard
+
+    Returns
+    -------
+    str
+        address, see :func:`yadism.cache.key`
+    """
+    theory = {
+        k: v for k, v in theory.items() if k not in (*ew_theory, "ID", "Comments")
+    }
+    settings = {
+        k: v
+        for k, v in observables.items()
+        if k not in (*ew_observables, "observables")
+    }
+    return cache.key("channels", theory, settings)
+
+
+class Channels:
+    """Stored unweighted convolutions of the partonic channels.
+
+    Each entry contains all the channels of a structure function at a single
+    kinematic point, identified by their labels (see
+    :meth:`yadism.coefficient_functions.Combiner.collect_elems`), and each
+    channel its raw orders, as ``(order, values, errors)``.
+
+    Parameters
+    ----------
+    path : os.PathLike
+        channels folder
+    digest : str
+        runcards address (see :func:`reference`)
+    strict : bool
+        whether the missing channels should be reported, instead of computed
+    """
+
+    def __init__(self, path, digest, strict=False):
+        self.path = pathlib.Path(path)
+        self.digest = digest
+        self.strict = strict
+
+    def key(self, esf):
+        """Compute the address of the entry of a structure function."""
+        return cache.key(self.digest, esf.info.obs_name.name, esf.x, esf.Q2)
+
+    def load(self, esf):
+        """Load the channels stored for a structure function.
+
+        Parameters
+        ----------
+        esf : EvaluatedStructureFunction
+            structure function at a kinematic point
+
+        Returns
+        -------
+        dict
+            raw orders, by channel label (empty if none is stored)
+        """
+        arrays = cache.load_arrays(self.path, "channels", self.key(esf))
+        if arrays is None:
+            return {}
+        channels = {}
+        for name, orders in arrays.items():
+            if not name.endswith(":orders"):
+                continue
+            label = name.removesuffix(":orders")
+            channels[label] = [
+                (int(o), val, err) for o, (val, err) in zip(orders, arrays[label])
+            ]
+        return channels
+
+    def save(self, esf, channels):
+        """Store the channels of a structure function.
+
+        Parameters
+        ----------
+        esf : EvaluatedStructureFunction
+            structure function at a kinematic point
+        channels : dict
+            raw orders, by channel label
+        """
+        size = len(esf.info.configs.interpolator.xgrid)
+        arrays = {}
+        for label, raw in channels.items():
+            arrays[f"{label}:orders"] = np.array([o for o, _, _ in raw], dtype=int)
+            arrays[label] = np.array(
+                [(val, err) for _, val, err in raw], dtype=float
+            ).reshape(-1, 2, size)
+        cache.save_arrays(self.path, "channels", self.key(esf), arrays)
+
+    def missing(self, esf, label):
+        """Report a channel which is not stored.
+
+        Raises
+        ------
+        KeyError
+            if only the stored channels can be used
+        """
+        if self.strict:
+            raise KeyError(f"Channel '{label}' of {esf} not stored in '{self.path}'")
+
+
+def reweight(theory, observables, channels_dir, updates, **kwargs):
+    """Compute the output for new electroweak parameters, from stored channels.
+
+    The runcards are the ones used to store the channels, and they are only
+    updated in the electroweak parameters, so no partonic channel has to be
+    convolved again.
+
+    Parameters
+    ----------
+    theory : dict
+        theory runcard
+    observables : dict
+        observables runcard
+    channels_dir : os.PathLike
+        channels folder
+    updates : dict
+        new values of the parameters, either in :attr:`ew_theory` or in
+        :attr:`ew_observables`
+    kwargs : dict
+        further arguments of :meth:`yadism.runner.Runner.get_result` (e.g.
+        ``workers``)
+
+    Returns
+    -------
+    Output
+        output for the new parameters
+
+    Raises
+    ------
+    ValueError
+        if any of the updated parameters is not an electroweak one
+    KeyError
+        if any of the required channels is not stored
+    """
+    from .runner import Runner  # pylint: disable=import-outside-toplevel
+
+    unknown = set(updates) - set(ew_theory) - set(ew_observables)
+    if len(unknown) > 0:
+        raise ValueError(f"Not electroweak parameters: {', '.join(sorted(unknown))}")
+    theory = dict(theory, **{k: v for k, v in updates.items() if k in ew_theory})
+    observables = dict(
+        observables, **{k: v for k, v in updates.items() if k in ew_observables}
+    )
+    runner = Runner(theory, observables, channels_dir=channels_dir, channels_only=True)
+    return runner.get_result(**kwargs)
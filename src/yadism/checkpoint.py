@@ -0,0 +1,153 @@
+"""Checkpoints of a running calculation.
+
+The results already computed are periodically flushed on disk, such that an
+interrupted run can be resumed from the same runcards, only computing the
+missing points.
+
+Each flush is stored as a new chunk per observable, i.e. a NumPy archive with
+the same ``values`` and ``errors`` layout of :meth:`yadism.output.Output.dump_tar`
+(point, order, flavor, interpolation), together with the indices and kinematics
+of the points it contains.
+"""
+
+import logging
+import pathlib
+import time
+
+import numpy as np
+import yaml
+
+from . import cache
+from .esf.result import ESFResult, EXSResult
+
+logger = logging.getLogger(__name__)
+
+flush_interval = 60.0
+"""Minimum time (in seconds) between two flushes"""
+
+
+class Checkpoint:
+    """Checkpoint folder of a single calculation.
+
+    Parameters
+    ----------
+    path : os.PathLike
+        checkpoint folder
+    digest : str
+        runcards address (see :func:`yadism.cache.key`, without the code
+        version), in order to avoid resuming a different calculation
+
+    Raises
+    ------
+    ValueError
+        if the folder contains the checkpoint of a different calculation, or
+        of a different version of the code (see :func:`yadism.cache.code_version`)
+    """
+
+    def __init__(self, path, digest):
+        self.path = pathlib.Path(path)
+        self.digest = digest
+        self.pending = {}
+        self.last_flush = time.time()
+
+        code = cache.code_version()
+        metadata = self.path / "metadata.yaml"
+        if metadata.exists():
+            stored = yaml.safe_load(metadata.read_text(encoding="utf-8"))
+            if stored["digest"] != digest:
+                raise ValueError(
+                    f"'{self.path}' contains the checkpoint of different runcards"
+                )
+            if stored.get("code") != code:
+                raise ValueError(
+                    f"'{self.path}' contains a checkpoint computed by a different "
+                    f"version of the code ({stored.get('code')}, now {code}): "
+                    "remove it to compute all the points again"
+                )
+        else:
+            self.path.mkdir(parents=True, exist_ok=True)
+            metadata.write_text(
+                yaml.safe_dump(dict(digest=digest, code=code)), encoding="utf-8"
+            )
+
+    def chunks(self, name):
+        """List the chunks stored for an observable."""
+        return sorted((self.path / name).glob("*.npz"))
+
+    def load(self):
+        """Load the results already stored.
+
+        Yields
+        ------
+        tuple(str, int, ESFResult)
+            observable name, point index and result
+        """
+        for folder in sorted(self.path.iterdir()):
+            if not folder.is_dir():
+                continue
+            for chunk in self.chunks(folder.name):
+                arrays = cache.load_arrays(self.path, folder.name, chunk.stem)
+                if arrays is None:
+                    continue
+                Result = ESFResult if arrays["kinematics"].shape[1] == 2 else EXSResult
+                for j, idx in enumerate(arrays["indices"]):
+                    res = Result.from_arrays(
+                        dict(
+                            kinematics=arrays["kinematics"][j],
+                            nf=arrays["nf"][j],
+                            orders=arrays["orders"],
+                            values=arrays["values"][j],
+                            errors=arrays["errors"][j],
+                        )
+                    )
+                    yield folder.name, int(idx), res
+
+    def add(self, name, idx, result):
+        """Register a new result, flushing if enough time passed.
+
+        Parameters
+        ----------
+        name : str
+            observable name
+        idx : int
+            point index
+        result : ESFResult
+            result
+        """
+        self.pending.setdefault(name, []).append((idx, result.get_arrays()))
+        if time.time() - self.last_flush > flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Store all the pending results.
+
+        Raises
+        ------
+        ValueError
+            if the points of an observable do not share the same orders
+        """
+        for name, points in self.pending.items():
+            indices, arrays = zip(*points)
+            orders = arrays[0]["orders"]
+            for ar in arrays:
+                if ar["orders"].shape != orders.shape or np.any(ar["orders"] != orders):
+                    raise ValueError(
+                        f"Points of '{name}' with different orders cannot be stored "
+                        "in the same chunk"
+                    )
+            cache.save_arrays(
+                self.path,
+                name,
+                f"{len(self.chunks(name)):06d}",
+                dict(
+                    indices=np.array(indices),
+                    kinematics=np.array([ar["kinematics"] for ar in arrays]),
+                    nf=np.array([ar["nf"] for ar in arrays]),
+                    orders=orders,
+                    values=np.array([ar["values"] for ar in arrays]),
+                    errors=np.array([ar["errors"] for ar in arrays]),
+                ),
+            )
+            logger.debug("Checkpoint: %d points of %s flushed", len(points), name)
+        self.pending = {}
+        self.last_flush = time.time()
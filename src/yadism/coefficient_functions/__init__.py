@@ -175,13 +175,16 @@ class Combiner:
                 ker.partons[sign * 1], ker.partons[sign * 2] = nucl_factors @ ps
 
     @staticmethod
-    def drop_empty(full):
+    def drop_empty(full, keep_weightless=False):
         """Drop kernels with :class:`EmptyPartonicChannel` or its partons with empty weight.
 
         Parameters
         ----------
         elems : list(yadism.kernels.Kernel)
             all participants
+        keep_weightless : bool
+            keep the partons with empty weight, and so the kernels without any
+            weight (e.g. to store all the channels, see :mod:`yadism.channels`)
 
         Returns
         -------
@@ -191,14 +194,23 @@ class Combiner:
         """
         filtered_kernels = []
         for ker in full:
-            ker.partons = {p: w for p, w in ker.partons.items() if w != 0}
-            if len(ker.partons) > 0 and not isinstance(ker.coeff, EmptyPartonicChannel):
-                filtered_kernels.append(ker)
+            if isinstance(ker.coeff, EmptyPartonicChannel):
+                continue
+            if not keep_weightless:
+                ker.partons = {p: w for p, w in ker.partons.items() if w != 0}
+                if len(ker.partons) == 0:
+                    continue
+            filtered_kernels.append(ker)
         return filtered_kernels
 
-    def collect_elems(self):
+    def collect_elems(self, keep_weightless=False):
         """Collect all kernels according to the |FNS|.
 
+        Parameters
+        ----------
+        keep_weightless : bool
+            keep the kernels without weight, see :meth:`drop_empty`
+
         Returns
         -------
         elems : list(yadism.kernels.Kernel)
@@ -208,11 +220,15 @@ class Combiner:
         components = self.collect()
 
         full = []
-        for comp in components:
+        for i, comp in enumerate(components):
+            # label the kernels before dropping any, such that the labels do
+            # not depend on the weights (see yadism.channels)
+            for j, ker in enumerate(comp):
+                ker.label = f"{i}.{j}.{type(ker.coeff).__name__}"
             full.extend(comp)
 
         # add level-0 nuclear correction: apply isospin symmetry
         self.apply_isospin(full, self.target["Z"], self.target["A"])
 
         # drop all kernels with 0 weight, or empty coeffs
-        return self.drop_empty(full)
+        return self.drop_empty(full, keep_weightless)
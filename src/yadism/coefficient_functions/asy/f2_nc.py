@@ -1,5 +1,3 @@
-import adani
-
 from ..light import f2_nc as light
 from ..partonic_channel import RSL
 from . import partonic_channel as pc
@@ -7,11 +5,11 @@ from . import raw_nc
 
 
 class AsyGluon(pc.NeutralCurrentBaseAsy):
-    hs3 = adani.HighScaleSplitLogs(3, "2", "g")
+    hs3_args = ("2", "g")
 
 
 class AsySinglet(pc.NeutralCurrentBaseAsy):
-    hs3 = adani.HighScaleSplitLogs(3, "2", "q")
+    hs3_args = ("2", "q")
 
 
 class AsyLLGluon(AsyGluon):
@@ -1,5 +1,3 @@
-import adani
-
 from ..light import fl_nc as light
 from ..partonic_channel import RSL, EmptyPartonicChannel
 from . import partonic_channel as pc
@@ -11,11 +9,11 @@ class AsyLLGluon(EmptyPartonicChannel):
 
 
 class AsyGluon(pc.NeutralCurrentBaseAsy):
-    hs3 = adani.HighScaleSplitLogs(3, "L", "g")
+    hs3_args = ("L", "g")
 
 
 class AsySinglet(pc.NeutralCurrentBaseAsy):
-    hs3 = adani.HighScaleSplitLogs(3, "L", "q")
+    hs3_args = ("L", "q")
 
 
 class AsyNLLGluon(AsyGluon):
@@ -1,12 +1,38 @@
 """Partonic channels of the massless limit."""
 
+import functools
+
 import numpy as np
 from eko import constants
 
+from ... import lazy
 from .. import partonic_channel as pc
 from .. import splitting_functions as split
 from ..partonic_channel import RSL
 
+adani = lazy.load("adani")
+
+
+@functools.cache
+def high_scale_logs(order, kind, channel):
+    """Build the high scale logarithms, only once per process.
+
+    Parameters
+    ----------
+    order : int
+        perturbative order
+    kind : str
+        structure function kind, i.e. ``"2"`` or ``"L"``
+    channel : str
+        partonic channel, i.e. ``"g"`` or ``"q"``
+
+    Returns
+    -------
+    adani.HighScaleSplitLogs
+        high scale logarithms
+    """
+    return adani.HighScaleSplitLogs(order, kind, channel)
+
 
 class PartonicChannelAsy(pc.PartonicChannel):
     """Massless limit of a coeficient function."""
@@ -126,4 +152,10 @@ class PartonicChannelAsyNLLIntrinsicLight(PartonicChannelAsyLLIntrinsic):
 
 
 class NeutralCurrentBaseAsy(PartonicChannelAsy):
-    pass
+    hs3_args = None
+    """Kind and channel of the high scale logarithms (if any)"""
+
+    @property
+    def hs3(self):
+        r"""High scale logarithms at :math:`\mathcal{O}(a_s^3)`."""
+        return high_scale_logs(3, *self.hs3_args)
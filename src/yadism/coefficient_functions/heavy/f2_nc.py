@@ -1,12 +1,14 @@
 """Massive :math:`F_2^{NC}` components."""
 
-import LeProHQ
 import numpy as np
 
+from ... import lazy
 from ..partonic_channel import RSL
 from . import partonic_channel as pc
 from .n3lo import interpolator
 
+LeProHQ = lazy.load("LeProHQ")
+
 
 class GluonVV(pc.NeutralCurrentBase):
     """Vector-vector gluon component."""
@@ -1,9 +1,11 @@
-import LeProHQ
 import numpy as np
 
+from ... import lazy
 from ..partonic_channel import RSL
 from . import partonic_channel as pc
 
+LeProHQ = lazy.load("LeProHQ")
+
 
 class NonSinglet(pc.NeutralCurrentBase):
     def NNLO(self):
@@ -57,6 +57,8 @@ class Kernel:
         self.coeff = coeff
         self.max_order = max_order
         self.min_order = min_order
+        # identifier within the structure function, see Combiner.collect_elems
+        self.label = None
 
     def has_order(self, order):
         """Is current order active.
@@ -4,9 +4,17 @@ distribution objects in the coefficient function definition and calculation.
 
 """
 
+import warnings
+import weakref
+
+import numba as nb
 import numpy as np
+import scipy
 import scipy.integrate
 from eko import interpolation
+from numba.extending import intrinsic
+
+from .. import profiling
 
 # TODO: don't use any default
 eps_integration_border = 1e-10
@@ -17,6 +25,70 @@ eps_integration_abs = 1e-13
 """Set the integration target absolute error, see
 :ref:`Integration Note<integration-note>`"""
 
+eps_area_border = 2.220446049250313e-15
+"""Tolerance to include the lower border of the first interpolation area, as
+in :func:`eko.interpolation.evaluate_x`"""
+
+engines = ("quad", "fixed", "moments")
+"""Available convolution engines, see :func:`convolve_vector`"""
+
+fixed_max_ratio = np.e
+"""Maximum ratio between the borders of a single segment of the ``fixed``
+engine, both in :math:`z` and in :math:`1-z` (see :func:`fixed_segments`)"""
+
+fixed_eps_rel = 1e-6
+"""Target error of the ``fixed`` engine, relative to the largest convolution"""
+
+fixed_max_refinements = 20
+"""Maximum number of bisection rounds of the ``fixed`` engine"""
+
+convolution_cache_size = 4096
+"""Maximum number of convolutions held by a :class:`ConvolutionCache`"""
+
+# Gauss-Kronrod 7-15 rule on [-1,1], as in QUADPACK's ``qk15``
+_xgk = np.array(
+    [
+        0.991455371120812639206854697526329,
+        0.949107912342758524526189684047851,
+        0.864864423359769072789712788640926,
+        0.741531185599394439863864773280788,
+        0.586087235467691130294144845693013,
+        0.405845151377397166906606412076961,
+        0.207784955007898467600689403773245,
+        0.000000000000000000000000000000000,
+    ]
+)
+_wgk = np.array(
+    [
+        0.022935322010529224963732008058970,
+        0.063092092629978553290700663189204,
+        0.104790010322250183839876322541518,
+        0.140653259715525918745189590510238,
+        0.169004726639267902826583426598550,
+        0.190350578064785409913256402421014,
+        0.204432940075298892414161999234649,
+        0.209482141084727828012999174891714,
+    ]
+)
+_wg = np.array(
+    [
+        0.0,
+        0.129484966168869693270611432679082,
+        0.0,
+        0.279705391489276667901467771423780,
+        0.0,
+        0.381830050505118944950369775488975,
+        0.0,
+        0.417959183673469387755102040816327,
+    ]
+)
+gk_nodes = np.concatenate((-_xgk[:-1], _xgk[::-1]))
+"""Nodes of the Gauss-Kronrod 7-15 rule on :math:`[-1,1]`"""
+gk_weights = np.concatenate((_wgk[:-1], _wgk[::-1]))
+"""Kronrod weights of the Gauss-Kronrod 7-15 rule"""
+gk_gauss_weights = np.concatenate((_wg[:-1], _wg[::-1]))
+"""Gauss weights of the Gauss-Kronrod 7-15 rule (0 on Kronrod-only nodes)"""
+
 
 def quad_ker_reg_sing(z, x, is_log, areas, reg, reg_args, sing, pdf_at_x, sing_args):
     if is_log:
@@ -49,6 +121,279 @@ def quad_ker_sing(z, x, is_log, areas, sing, pdf_at_x, sing_args):
     return sing_integrand
 
 
+kernel_signature = nb.types.float64(nb.types.float64, nb.types.float64[:])
+"""Signature of the compiled regular and singular parts"""
+
+
+@intrinsic
+def _call_kernel(typingctx, address, z, args):  # pylint: disable=unused-argument
+    """Call a compiled kernel given the address of its native implementation.
+
+    The call follows the numba calling convention, as a direct call from
+    another compiled function would; on errors NaN is returned (and reported
+    by :func:`check_finite`).
+    """
+    sig = nb.types.float64(nb.types.intp, nb.types.float64, args)
+
+    def codegen(context, builder, signature, llargs):
+        addr, z, args = llargs
+        arrty = kernel_signature.args[1]
+        # same data, in the (generic) layout of the kernel argument
+        given = context.make_array(signature.args[2])(context, builder, args)
+        passed = context.make_array(arrty)(context, builder)
+        context.populate_array(
+            passed,
+            data=given.data,
+            shape=given.shape,
+            strides=given.strides,
+            itemsize=given.itemsize,
+            meminfo=given.meminfo,
+            parent=given.parent,
+        )
+        fnty = context.call_conv.get_function_type(
+            kernel_signature.return_type, kernel_signature.args
+        )
+        fn = builder.inttoptr(addr, fnty.as_pointer())
+        status, res = context.call_conv.call_function(
+            builder,
+            fn,
+            kernel_signature.return_type,
+            kernel_signature.args,
+            [z, passed._getvalue()],
+        )
+        nan = context.get_constant(nb.types.float64, np.nan)
+        return builder.select(status.is_error, nan, res)
+
+    return sig, codegen
+
+
+_kernel_addresses = {}
+"""Addresses of the compiled kernels, see :func:`kernel_address`"""
+
+
+def kernel_address(kernel):
+    """
+    Address of the native implementation of a compiled kernel.
+
+    Addresses are cached, since the kernels are never unloaded.
+
+    Parameters
+    ----------
+        kernel : numba.core.dispatcher.Dispatcher
+            regular or singular part, compiled with :attr:`kernel_signature`
+
+    Returns
+    -------
+        int
+            address
+    """
+    if kernel not in _kernel_addresses:
+        cres = kernel.overloads[kernel_signature.args]
+        _kernel_addresses[kernel] = cres.library.get_pointer_to_function(
+            cres.fndesc.llvm_func_name
+        )
+    return _kernel_addresses[kernel]
+
+
+def _quad_ker(n, xx):
+    data = nb.carray(xx, n)
+    z = data[0]
+    x = data[1]
+    pdf_at_x = data[2]
+    is_log = data[3] != 0.0
+    reg = int(data[4])
+    sing = int(data[5])
+    n_areas = int(data[6])
+    n_cols = int(data[7])
+    end = 8 + n_areas * n_cols
+    areas = data[8:end].reshape((n_areas, n_cols))
+    n_reg_args = int(data[end])
+    reg_args = data[end + 1 : end + 1 + n_reg_args]
+    sing_args = data[end + 1 + n_reg_args :]
+    if is_log:
+        pdf_at_x_ov_z_div_z = interpolation.log_evaluate_x(x / z, areas) / z
+    else:
+        pdf_at_x_ov_z_div_z = interpolation.evaluate_x(x / z, areas) / z
+    res = 0.0
+    if reg != 0:
+        res += _call_kernel(reg, z, reg_args) * pdf_at_x_ov_z_div_z
+    if sing != 0:
+        res += _call_kernel(sing, z, sing_args) * (pdf_at_x_ov_z_div_z - pdf_at_x)
+    return res
+
+
+quad_ker_cfunc = (
+    None
+    if nb.config.DISABLE_JIT
+    else nb.cfunc(
+        nb.types.float64(nb.types.intc, nb.types.CPointer(nb.types.float64)),
+        cache=True,
+    )(_quad_ker)
+)
+"""Integrand fusing the basis function evaluation and the compiled kernels
+
+It is passed to :func:`scipy.integrate.quad` as a
+:class:`scipy.LowLevelCallable`, never calling back into Python.
+The kernels are called through the addresses of their native implementations
+(see :func:`kernel_address`), so a single integrand serves all of them, and it
+is stored in the numba cache like the kernels themselves.
+Its arguments are passed as a flat sequence of floats, see
+:func:`quad_ker_cfunc_args`.
+
+``None`` if the compilation is disabled by ``NUMBA_DISABLE_JIT``.
+"""
+
+quad_ker_compiled = (
+    None if quad_ker_cfunc is None else scipy.LowLevelCallable(quad_ker_cfunc.ctypes)
+)
+""":data:`quad_ker_cfunc` as a :class:`scipy.LowLevelCallable`"""
+
+
+def quad_ker_cfunc_args(x, pdf_at_x, is_log, areas, reg, reg_args, sing, sing_args):
+    """
+    Pack the arguments of the compiled integrand, see :data:`quad_ker_cfunc`.
+
+    Parameters
+    ----------
+        x : float
+            convolution point
+        pdf_at_x : float
+            basis function evaluated at ``x``
+        is_log : bool
+            logarithmic interpolation?
+        areas : np.ndarray
+            areas representation of the basis function
+        reg : numba.core.dispatcher.Dispatcher or None
+            regular part
+        reg_args : np.ndarray
+            arguments of the regular part
+        sing : numba.core.dispatcher.Dispatcher or None
+            singular part
+        sing_args : np.ndarray
+            arguments of the singular part
+
+    Returns
+    -------
+        tuple
+            flat arguments
+    """
+    # addresses are exactly represented, being below 2^53
+    return (
+        x,
+        pdf_at_x,
+        float(is_log),
+        0.0 if reg is None else float(kernel_address(reg)),
+        0.0 if sing is None else float(kernel_address(sing)),
+        *areas.shape,
+        *areas.flatten(),
+        len(reg_args),
+        *reg_args,
+        *sing_args,
+    )
+
+
+def is_compiled(rsl):
+    """
+    Check whether the regular and singular parts are compiled numba functions
+    (and can thus be called by the compiled integrand).
+
+    Parameters
+    ----------
+        rsl : yadism.coefficient_functions.partonic_channel.RSL
+            kernel
+
+    Returns
+    -------
+        bool
+            compiled?
+    """
+    return all(
+        part is None
+        or (
+            isinstance(part, nb.core.dispatcher.Dispatcher)
+            and kernel_signature.args in part.overloads
+        )
+        for part in (rsl.reg, rsl.sing)
+    )
+
+
+def check_finite(values, rsl, x):
+    """
+    Check the result of the compiled integrands.
+
+    The compiled kernels can not raise (see :func:`_call_kernel`), so their
+    failures are only signaled by non-finite values, which are not scrubbed
+    downstream.
+
+    Parameters
+    ----------
+        values : float or np.ndarray
+            convolution results
+        rsl : yadism.coefficient_functions.partonic_channel.RSL
+            kernel
+        x : float
+            convolution point
+
+    Raises
+    ------
+        FloatingPointError
+            if any value is not finite
+    """
+    if not np.all(np.isfinite(values)):
+        parts = ", ".join(
+            f"{name}={getattr(part, '__name__', part)}"
+            for name, part in (("reg", rsl.reg), ("sing", rsl.sing))
+            if part is not None
+        )
+        raise FloatingPointError(
+            f"Compiled kernel ({parts}) is not finite, convolving at x={x}"
+        )
+
+
+@nb.njit(
+    nb.types.float64[:](nb.types.intp, nb.types.float64[:], nb.types.float64[:]),
+    cache=True,
+)
+def _kernel_on_nodes(address, z, args):
+    res = np.empty_like(z)
+    for i, zi in enumerate(z):
+        res[i] = _call_kernel(address, zi, args)
+    return res
+
+
+def kernel_on_nodes(rsl, part, z, x):
+    """
+    Evaluate the regular or singular part of a kernel on an array of nodes.
+
+    Compiled parts are evaluated by a single compiled loop, calling them
+    through their addresses (see :func:`kernel_address`), otherwise they are
+    called once per node.
+
+    Parameters
+    ----------
+        rsl : yadism.coefficient_functions.partonic_channel.RSL
+            kernel
+        part : str
+            either ``"reg"`` or ``"sing"``
+        z : np.ndarray
+            nodes
+        x : float
+            convolution point (only used to report failures)
+
+    Returns
+    -------
+        np.ndarray
+            values on the nodes
+    """
+    kernel = getattr(rsl, part)
+    args = rsl.args[part]
+    if not nb.config.DISABLE_JIT and is_compiled(rsl):
+        res = _kernel_on_nodes(kernel_address(kernel), z, args)
+        check_finite(res, rsl, x)
+        return res
+    return np.fromiter((kernel(zi, args) for zi in z), dtype=float, count=len(z))
+
+
 def convolution(rsl, x, pdf_func):
     r"""
     Convolve a :py:class:`yadism.coefficient_functions.partonic_channel.RSL`
@@ -117,7 +462,23 @@ def convolution(rsl, x, pdf_func):
 
     quad_ker = None
     quad_args = None
-    if rsl.reg is not None or rsl.sing is not None:
+    if (
+        quad_ker_compiled is not None
+        and (rsl.reg is not None or rsl.sing is not None)
+        and is_compiled(rsl)
+    ):
+        quad_ker = quad_ker_compiled
+        quad_args = quad_ker_cfunc_args(
+            x,
+            pdf_at_x,
+            pdf_func._mode_log,  # pylint: disable=protected-access
+            pdf_func.areas_representation,
+            rsl.reg,
+            rsl.args["reg"],
+            rsl.sing,
+            rsl.args["sing"],
+        )
+    elif rsl.reg is not None or rsl.sing is not None:
         quad_args = (
             x,
             pdf_func._mode_log,
@@ -148,14 +509,21 @@ def convolution(rsl, x, pdf_func):
     if quad_ker is None:
         res, err = 0, 0
     else:
-        res, err = scipy.integrate.quad(
+        res, err, info, *message = scipy.integrate.quad(
             quad_ker,
             z_min * (1 + eps_integration_border),
             z_max * (1 - eps_integration_border),
             args=quad_args,
             epsabs=eps_integration_abs,
             points=breakpoints,
+            full_output=1,
         )
+        profiling.add_subintervals(info["last"])
+        if quad_ker is quad_ker_compiled:
+            check_finite(res, rsl, x)
+        # the full output replaces the warning with a message
+        if len(message) > 0:
+            warnings.warn(message[0], scipy.integrate.IntegrationWarning)
 
     # sum the addends
     if rsl.loc is None:
@@ -168,10 +536,110 @@ def convolution(rsl, x, pdf_func):
     return res, err
 
 
+def uniform_section(interpolator, rtol=1e-8):
+    """
+    Find the logarithmically uniform section of the grid.
+
+    The grids are usually logarithmically uniform at small :math:`x`, and
+    linear at large :math:`x` (see :func:`eko.interpolation.make_grid`), so
+    the longest run of equal logarithmic steps is selected.
+
+    Parameters
+    ----------
+        interpolator : InterpolationDispatcher
+            basis functions
+        rtol : float
+            relative tolerance on the uniformity of the grid
+
+    Returns
+    -------
+        tuple(int, int, float) or None
+            first and last (included) grid points of the section, and its
+            logarithmic step, or ``None`` if the interpolation is not
+            logarithmic
+    """
+    xgrid = interpolator.xgrid.raw
+    if not interpolator.log or len(xgrid) < 3:
+        return None
+    steps = np.diff(np.log(xgrid))
+    best = (0, 0)
+    first = 0
+    for j in range(1, len(steps) + 1):
+        if j == len(steps) or not np.isclose(
+            steps[j], steps[first], rtol=rtol, atol=0.0
+        ):
+            if j - first > best[1] - best[0]:
+                best = (first, j)
+            first = j
+    return best[0], best[1], steps[best[0]]
+
+
+def shift_invariant_basis(interpolator, rtol=1e-8):
+    """
+    Detect the basis functions which are just shifted copies of each other.
+
+    On a logarithmically uniform section of the grid (see
+    :func:`uniform_section`), all the basis functions far enough from its
+    boundaries share the same shape, up to a shift by a multiple of the grid
+    spacing. This is checked numerically, by comparing their values, on a
+    window around their own node, with the ones of the central basis function
+    of the section.
+
+    Parameters
+    ----------
+        interpolator : InterpolationDispatcher
+            basis functions
+        rtol : float
+            relative tolerance on the uniformity of the grid and on the shape
+            of the basis functions
+
+    Returns
+    -------
+        np.ndarray or None
+            mask of the shifted copies, or ``None`` if there are none
+    """
+    section = uniform_section(interpolator, rtol)
+    if section is None:
+        return None
+    first, last, step = section
+    logs = np.log(interpolator.xgrid.raw)
+    # sample a window larger than any support, avoiding the nodes
+    half_width = 4 * (interpolator.polynomial_degree + 2)
+    offsets = (np.arange(-half_width, half_width) + 0.37) * step / 4
+    coefs = area_coefficients(interpolator)
+    shapes = np.array(
+        [
+            basis_matrix(interpolator, np.exp(log + offsets), coefs)[l]
+            for l, log in enumerate(logs)
+        ]
+    )
+    reference = shapes[(first + last) // 2]
+    shifted = np.all(
+        np.isclose(shapes, reference, rtol=rtol, atol=rtol * np.abs(reference).max()),
+        axis=1,
+    )
+    # only the nodes of the section are shifted by multiples of the step
+    shifted[:first] = False
+    shifted[last + 1 :] = False
+    if np.count_nonzero(shifted) < 2:
+        return None
+    return shifted
+
+
 def convolve_operator(fnc, interpolator):
     """
     Convolve function over all basis functions over all grid points.
 
+    On the logarithmically uniform section of the grid, the convolution of
+    the basis functions that are shifted copies of each other (see
+    :func:`shift_invariant_basis`) only depends on the distance between the
+    grid point and the node of the basis function, so it is computed only
+    once per distance (i.e. per band of the operator), for all the grid
+    points in the section.
+    The diagonal, the other basis functions, and the grid points outside of
+    the section (e.g. in the linear part of the grid), are convolved one by
+    one.
+
     Parameters
     ----------
         fnc : RSL
@@ -190,23 +658,556 @@ def convolve_operator(fnc, interpolator):
     grid_size = len(xgrid)
     op_res = np.zeros((grid_size, grid_size))
     op_err = np.zeros((grid_size, grid_size))
+    shifted = shift_invariant_basis(interpolator)
+    if shifted is not None:
+        first, last, _ = uniform_section(interpolator)
+    bands = {}
     # iterate output grid
     for k, xk in enumerate(interpolator.xgrid.raw):
         # iterate basis functions
         for l, bf in enumerate(interpolator):
             if k == l and l == grid_size - 1:
                 continue
-            # iterate sectors
-            res, err = convolution(fnc, xk, bf)
+            # on the diagonal the basis function does not vanish at the grid
+            # point, so the subtraction of the singular part, and the local
+            # part, depend on the grid point itself, not only on the distance;
+            # the last grid point is an empty domain, not a shifted one
+            if (
+                shifted is not None
+                and shifted[l]
+                and k != l
+                and first <= k <= last
+                and k < grid_size - 1
+            ):
+                if k - l not in bands:
+                    bands[k - l] = convolution(fnc, xk, bf)
+                res, err = bands[k - l]
+            else:
+                # iterate sectors
+                res, err = convolution(fnc, xk, bf)
             op_res[l, k] = res
             op_err[l, k] = err
     return op_res, op_err
 
 
-def convolve_vector(cf, interpolator, convolution_point):
+_area_coefficients = {}
+"""Coefficients of the living interpolators, see :func:`area_coefficients`"""
+
+
+def area_coefficients(interpolator):
+    """
+    Collect the polynomial coefficients of all basis functions on all areas.
+
+    The coefficients are cached (read-only) as long as the interpolator is
+    alive, since they are needed for each convolution point.
+
+    Parameters
+    ----------
+        interpolator : InterpolationDispatcher
+            basis functions
+
+    Returns
+    -------
+        np.ndarray
+            coefficients, with shape ``(basis functions, areas, degree + 1)``,
+            where the areas are the intervals between consecutive grid points
+    """
+    key = id(interpolator)
+    if key not in _area_coefficients:
+        grid = interpolator.xgrid.grid
+        coefs = np.zeros((len(grid), len(grid) - 1, interpolator.polynomial_degree + 1))
+        for l, bf in enumerate(interpolator):
+            areas = bf.areas_representation
+            coefs[l, np.searchsorted(grid, areas[:, 0])] = areas[:, 2:]
+        coefs.flags.writeable = False
+        _area_coefficients[key] = coefs
+        weakref.finalize(interpolator, _area_coefficients.pop, key, None)
+    return _area_coefficients[key]
+
+
+def basis_matrix(interpolator, xs, coefs=None):
+    """
+    Evaluate all basis functions on several points at once.
+
+    This is the vectorized counterpart of :meth:`BasisFunction.__call__`.
+
+    Parameters
+    ----------
+        interpolator : InterpolationDispatcher
+            basis functions
+        xs : np.ndarray
+            evaluation points
+        coefs : np.ndarray
+            area coefficients, as returned by :func:`area_coefficients` (computed
+            if not given)
+
+    Returns
+    -------
+        np.ndarray
+            values, with shape ``(len(interpolator.xgrid), len(xs))``
+    """
+    if coefs is None:
+        coefs = area_coefficients(interpolator)
+    grid = interpolator.xgrid.grid
+    ts = np.log(xs) if interpolator.log else np.asarray(xs, dtype=float)
+    # the areas are open on the left, but the very first one
+    areas = np.searchsorted(grid, ts, side="left") - 1
+    areas[np.abs(ts - grid[0]) < eps_area_border] = 0
+    inside = (areas >= 0) & (areas < len(grid) - 1)
+    powers = ts[inside, np.newaxis] ** np.arange(coefs.shape[2])
+    mat = np.zeros((len(grid), len(ts)))
+    # only a few basis functions are supported on each area: gather their
+    # coefficients (padded with other basis functions, vanishing there)
+    supported = np.any(coefs != 0.0, axis=2).T
+    width = supported.sum(axis=1).max()
+    support = np.argsort(~supported, axis=1, kind="stable")[:, :width]
+    blocks = np.take_along_axis(coefs.transpose(1, 0, 2), support[:, :, np.newaxis], 1)
+    areas = areas[inside]
+    mat[support[areas].T, np.flatnonzero(inside)] = np.einsum(
+        "tk,twk->wt", powers, blocks[areas]
+    )
+    return mat
+
+
+def fixed_segments(x, xgrid):
+    r"""
+    Compute the initial integration segments of the ``fixed`` engine.
+
+    The integration domain is split at the images of the interpolation areas'
+    borders, and the segments are further split uniformly in
+    :math:`\ln(z/(1-z))`, such that none is longer than :attr:`fixed_max_ratio`
+    neither in :math:`z` (for :math:`z \to 0`) nor in :math:`1-z` (for
+    :math:`z \to 1`, where the distributions are integrably singular).
+
+    Parameters
+    ----------
+        x : float
+            convolution point
+        xgrid : np.ndarray
+            interpolation grid (not in log space)
+
+    Returns
+    -------
+        np.ndarray
+            segments' borders
+    """
+    z_min = x * (1 + eps_integration_border)
+    z_max = 1 - eps_integration_border
+    breakpoints = x / xgrid[xgrid > x]
+    breakpoints = breakpoints[(breakpoints > z_min) & (breakpoints < z_max)]
+    borders = np.unique(np.concatenate(([z_min], breakpoints, [z_max])))
+    logits = np.log(borders) - np.log1p(-borders)
+    steps = np.diff(logits)
+    pieces = np.maximum(np.ceil(steps / np.log(fixed_max_ratio)).astype(int), 1)
+    starts = np.cumsum(pieces) - pieces
+    # position of each edge inside its segment
+    offsets = np.arange(pieces.sum()) - np.repeat(starts, pieces)
+    logits = np.repeat(logits[:-1], pieces) + offsets * np.repeat(
+        steps / pieces, pieces
+    )
+    edges = np.concatenate((1.0 / (1.0 + np.exp(-logits)), [z_max]))
+    # exactly the original borders
+    edges[starts] = borders[:-1]
+    return edges
+
+
+def gauss_kronrod_nodes(lower, upper):
+    """
+    Map the Gauss-Kronrod 7-15 rule on several segments.
+
+    Parameters
+    ----------
+        lower : np.ndarray
+            lower borders of the segments
+        upper : np.ndarray
+            upper borders of the segments
+
+    Returns
+    -------
+        z : np.ndarray
+            integration nodes, with shape ``(len(lower), 15)``
+        wk : np.ndarray
+            Kronrod weights, with the same shape
+        wg : np.ndarray
+            Gauss weights, with the same shape
+    """
+    centers = ((upper + lower) / 2.0)[:, np.newaxis]
+    half_lengths = ((upper - lower) / 2.0)[:, np.newaxis]
+    return (
+        centers + half_lengths * gk_nodes,
+        half_lengths * gk_weights,
+        half_lengths * gk_gauss_weights,
+    )
+
+
+def last_area(interpolator, coefs, x, pdf_at_x):
+    """
+    Find the interpolation area containing the convolution point.
+
+    On this area (i.e. for :math:`z` close to 1) the basis functions are
+    subtracted their value at ``x``, which is only matched by the polynomial
+    of the area if the support does not end in ``x``.
+
+    Parameters
+    ----------
+        interpolator : InterpolationDispatcher
+            basis functions
+        coefs : np.ndarray
+            area coefficients, see :func:`area_coefficients`
+        x : float
+            convolution point
+        pdf_at_x : np.ndarray
+            basis functions evaluated at ``x``
+
+    Returns
+    -------
+        first : int
+            index of the area
+        mismatch : np.ndarray
+            difference of the polynomials of the area and the basis functions
+            values at ``x``
+    """
+    xgrid = interpolator.xgrid.raw
+    first = max(np.searchsorted(xgrid, x, side="right") - 1, 0)
+    u_at_x = np.log(x) if interpolator.log else x
+    mismatch = coefs[:, first] @ u_at_x ** np.arange(coefs.shape[2]) - pdf_at_x
+    return first, mismatch
+
+
+def subtracted_powers(interpolator, x, z):
+    r"""
+    Compute :math:`u^k(z)/z - u^k(x)`, for all the powers of the polynomials.
+
+    The differences are computed avoiding the cancellation for
+    :math:`z \to 1`, where they are multiplied by the singular part of the
+    kernels: the roundoff of a plain difference would be amplified, and
+    prevent the integration from converging.
+
+    Parameters
+    ----------
+        interpolator : InterpolationDispatcher
+            basis functions
+        x : float
+            convolution point
+        z : np.ndarray
+            nodes
+
+    Returns
+    -------
+        np.ndarray
+            differences, with shape ``(degree + 1, len(z))``
+    """
+    if interpolator.log:
+        u, u_at_x, shift = np.log(x / z), np.log(x), -np.log(z)
+    else:
+        u, u_at_x, shift = x / z, x, x * (1.0 - z) / z
+    # u^k - u_x^k = (u - u_x) sum_j u^j u_x^(k-1-j)
+    sums = np.zeros((interpolator.polynomial_degree + 1, len(z)))
+    u_power = np.ones_like(z)
+    for k in range(1, len(sums)):
+        sums[k] = u_power + u_at_x * sums[k - 1]
+        u_power = u_power * u
+    u_at_x_powers = u_at_x ** np.arange(len(sums))[:, np.newaxis]
+    return (shift * sums + u_at_x_powers * (1.0 - z)) / z
+
+
+def _fixed_integrand(cf, interpolator, coefs, x, z, pdf_at_x, first, mismatch):
+    """Evaluate the integrand for all basis functions on the nodes ``z``."""
+    pdf_at_x_ov_z = basis_matrix(interpolator, x / z, coefs)
+    reg = np.zeros_like(z)
+    if cf.reg is not None:
+        reg = kernel_on_nodes(cf, "reg", z, x)
+    if cf.sing is None:
+        return pdf_at_x_ov_z * (reg / z)
+    sing = kernel_on_nodes(cf, "sing", z, x)
+    integrand = pdf_at_x_ov_z * ((reg + sing) / z)
+    # only the basis functions supported in x are subtracted
+    at_x = pdf_at_x != 0.0
+    integrand[at_x] -= pdf_at_x[at_x, np.newaxis] * sing
+    # on the last area, subtract the polynomials directly
+    last = z > x / interpolator.xgrid.raw[first + 1]
+    subtracted = (
+        coefs[:, first] @ subtracted_powers(interpolator, x, z[last])
+        + mismatch[:, np.newaxis]
+    )
+    integrand[:, last] = (
+        pdf_at_x_ov_z[:, last] * (reg[last] / z[last]) + sing[last] * subtracted
+    )
+    return integrand
+
+
+def _gauss_kronrod_error(integrand, wk, kronrod, gauss):
+    """Estimate the error on each segment, as QUADPACK's ``qk15`` does."""
+    lengths = wk.sum(axis=1)
+    mean = kronrod / lengths[:, np.newaxis]
+    resasc = np.einsum("lsn,sn->sl", np.abs(integrand - mean.T[:, :, np.newaxis]), wk)
+    errors = np.abs(kronrod - gauss)
+    scaled = resasc != 0.0
+    errors[scaled] = resasc[scaled] * np.minimum(
+        1.0, (200.0 * errors[scaled] / resasc[scaled]) ** 1.5
+    )
+    return errors
+
+
+def adaptive_gauss_kronrod(integrand, edges, contract=None):
+    """
+    Integrate a vector valued function, adaptively refining the segments.
+
+    The error is estimated from the difference of the Kronrod and the Gauss
+    rule, as in QUADPACK, and the target accuracy is relative to the largest
+    output (see :attr:`fixed_eps_rel`).
+    Segments failing the target accuracy (e.g. because of a threshold inside
+    the kernel) are bisected, at most :attr:`fixed_max_refinements` times, unless
+    the bisection does not improve their error (i.e. it is limited by round-off).
+
+    Parameters
+    ----------
+        integrand : callable
+            integrand, mapping an array of nodes to an array of shape
+            ``(components, nodes)``
+        edges : np.ndarray
+            initial segments edges
+        contract : callable
+            map from the segments borders ``(lower, upper)`` to the matrices,
+            with shape ``(segments, outputs, components)``, to be applied to
+            the integrated components (if not given, the components are the
+            outputs)
+
+    Returns
+    -------
+        res : np.ndarray
+            values
+        err : np.ndarray
+            errors
+    """
+    lower, upper = edges[:-1], edges[1:]
+    # integrated segments, and their contributions to each output
+    seg_lower, seg_upper = np.zeros(0), np.zeros(0)
+    values, errors = None, None
+    # number of bisections not improving the error (round-off)
+    stalls = np.zeros(0, dtype=int)
+    parent_errors, parent_stalls = None, None
+    for refinement in range(fixed_max_refinements + 1):
+        profiling.add_subintervals(len(lower))
+        z, wk, wg = gauss_kronrod_nodes(lower, upper)
+        components = integrand(z.flatten())
+        components = components.reshape(len(components), *z.shape)
+        new_values = np.einsum("lsn,sn->sl", components, wk)
+        new_errors = _gauss_kronrod_error(
+            components, wk, new_values, np.einsum("lsn,sn->sl", components, wg)
+        )
+        if contract is not None:
+            matrices = contract(lower, upper)
+            new_values = np.einsum("slc,sc->sl", matrices, new_values)
+            new_errors = np.einsum("slc,sc->sl", np.abs(matrices), new_errors)
+        new_stalls = np.zeros(len(lower), dtype=int)
+        if parent_errors is not None:
+            halves = len(lower) // 2
+            children_errors = new_errors[:halves] + new_errors[halves:]
+            stalled = children_errors.max(axis=1) >= 0.9 * parent_errors
+            new_stalls = np.tile(parent_stalls + stalled, 2)
+        seg_lower = np.concatenate((seg_lower, lower))
+        seg_upper = np.concatenate((seg_upper, upper))
+        if values is None:
+            values, errors = new_values, new_errors
+        else:
+            values = np.concatenate((values, new_values))
+            errors = np.concatenate((errors, new_errors))
+        stalls = np.concatenate((stalls, new_stalls))
+        # converged? the error is measured on the whole vector, relative to
+        # its largest entry (the basis functions barely overlapping the
+        # domain would otherwise drive the refinement)
+        tolerance = max(
+            eps_integration_abs, fixed_eps_rel * np.abs(values.sum(axis=0)).max()
+        )
+        if errors.sum(axis=0).max() <= tolerance or refinement == fixed_max_refinements:
+            break
+        # bisect the segments carrying more than their share of the error,
+        # and close to the worst one (to focus on local difficulties)
+        stalled = stalls >= 2
+        segment_errors = errors.max(axis=1)
+        active = segment_errors[~stalled]
+        if len(active) == 0:
+            break
+        bad = (
+            ~stalled
+            & (segment_errors > tolerance / len(errors))
+            & (segment_errors >= 0.1 * active.max())
+        )
+        if not np.any(bad):
+            break
+        parent_errors, parent_stalls = errors[bad].max(axis=1), stalls[bad]
+        centers = (seg_lower[bad] + seg_upper[bad]) / 2.0
+        lower = np.concatenate((seg_lower[bad], centers))
+        upper = np.concatenate((centers, seg_upper[bad]))
+        seg_lower, seg_upper = seg_lower[~bad], seg_upper[~bad]
+        values, errors = values[~bad], errors[~bad]
+        stalls = stalls[~bad]
+    return values.sum(axis=0), errors.sum(axis=0)
+
+
+def convolve_vector_fixed(cf, interpolator, convolution_point):
+    """
+    Convolve function over all basis functions, on shared nodes.
+
+    The kernel is evaluated only once on a set of nodes shared by all basis
+    functions (see :func:`fixed_segments`), and then contracted with all of
+    them at once (see :func:`adaptive_gauss_kronrod`).
+
+    Parameters
+    ----------
+        cf : RSL
+            integration kernel
+        interpolator : InterpolationDispatcher
+            basis functions
+        convolution_point : float
+            convolution point
+
+    Returns
+    -------
+        ls : np.ndarray
+            values
+        els : np.ndarray
+            errors
+    """
+    x = convolution_point
+    ls = np.zeros(len(interpolator.xgrid))
+    els = np.zeros(len(interpolator.xgrid))
+    # empty domain?
+    if x >= (1 - eps_integration_border):
+        return ls, els
+    coefs = area_coefficients(interpolator)
+    pdf_at_x = basis_matrix(interpolator, np.array([x]), coefs)[:, 0]
+    # support below x --> trivially 0, as in `convolution`
+    pdf_at_x[[bf.is_below_x(x) for bf in interpolator]] = 0.0
+
+    if cf.reg is not None or cf.sing is not None:
+        first, mismatch = last_area(interpolator, coefs, x, pdf_at_x)
+        res, err = adaptive_gauss_kronrod(
+            lambda z: _fixed_integrand(
+                cf, interpolator, coefs, x, z, pdf_at_x, first, mismatch
+            ),
+            fixed_segments(x, interpolator.xgrid.raw),
+        )
+        ls += res
+        els += err
+
+    if cf.loc is not None:
+        ls += pdf_at_x * cf.loc(x, cf.args["loc"])
+
+    return ls, els
+
+
+def _moments_integrand(cf, interpolator, x, z, last):
+    """
+    Evaluate the moments integrand on the nodes ``z``.
+
+    The components are the moments on all the powers, followed by the
+    singular part alone on the other areas, and on the last area (the one
+    containing ``x``) respectively.
+    """
+    u = np.log(x / z) if interpolator.log else x / z
+    powers = np.arange(interpolator.polynomial_degree + 1)[:, np.newaxis]
+    u_powers_div_z = u**powers / z
+    integrand = np.zeros((len(powers) + 2, len(z)))
+    if cf.reg is not None:
+        reg = kernel_on_nodes(cf, "reg", z, x)
+        integrand[:-2] += reg * u_powers_div_z
+    if cf.sing is not None:
+        sing = kernel_on_nodes(cf, "sing", z, x)
+        # subtract the value at x on the last area (for convergence)
+        subtracted = u_powers_div_z.copy()
+        subtracted[:, last] = subtracted_powers(interpolator, x, z[last])
+        integrand[:-2] += sing * subtracted
+        integrand[-2] = np.where(last, 0.0, sing)
+        integrand[-1] = np.where(last, sing, 0.0)
+    return integrand
+
+
+def convolve_vector_moments(cf, interpolator, convolution_point):
+    r"""
+    Convolve function over all basis functions, by means of moments.
+
+    On each interpolation area the basis functions are polynomials in
+    :math:`u = \ln(x/z)` (or :math:`u = x/z` for linear interpolation), so
+    only the moments of the kernel (i.e. its integrals against the powers of
+    :math:`u`) are computed on each area. The convolutions are then
+    assembled from the area coefficients of the basis functions.
+
+    The integration itself is performed as in :func:`convolve_vector_fixed`.
+
+    Parameters
+    ----------
+        cf : RSL
+            integration kernel
+        interpolator : InterpolationDispatcher
+            basis functions
+        convolution_point : float
+            convolution point
+
+    Returns
+    -------
+        ls : np.ndarray
+            values
+        els : np.ndarray
+            errors
+    """
+    x = convolution_point
+    ls = np.zeros(len(interpolator.xgrid))
+    els = np.zeros(len(interpolator.xgrid))
+    # empty domain?
+    if x >= (1 - eps_integration_border):
+        return ls, els
+    coefs = area_coefficients(interpolator)
+    pdf_at_x = basis_matrix(interpolator, np.array([x]), coefs)[:, 0]
+    # support below x --> trivially 0, as in `convolution`
+    pdf_at_x[[bf.is_below_x(x) for bf in interpolator]] = 0.0
+
+    if cf.reg is not None or cf.sing is not None:
+        xgrid = interpolator.xgrid.raw
+        first, mismatch = last_area(interpolator, coefs, x, pdf_at_x)
+
+        def contract(lower, upper):
+            areas = np.searchsorted(xgrid, 2.0 * x / (lower + upper)) - 1
+            return np.concatenate(
+                (
+                    coefs[:, areas].transpose(1, 0, 2),
+                    np.broadcast_to(-pdf_at_x[:, np.newaxis], (len(areas), len(ls), 1)),
+                    np.broadcast_to(mismatch[:, np.newaxis], (len(areas), len(ls), 1)),
+                ),
+                axis=2,
+            )
+
+        res, err = adaptive_gauss_kronrod(
+            lambda z: _moments_integrand(
+                cf, interpolator, x, z, z > x / xgrid[first + 1]
+            ),
+            fixed_segments(x, xgrid),
+            contract,
+        )
+        ls += res
+        els += err
+
+    if cf.loc is not None:
+        ls += pdf_at_x * cf.loc(x, cf.args["loc"])
+
+    return ls, els
+
+
+def convolve_vector(cf, interpolator, convolution_point, engine="quad"):
     """
     Convolve function over all basis functions.
 
+    The following engines are available (see :attr:`engines`):
+
+    - ``quad``: each basis function is convolved on its own, by means of an
+      adaptive integration (see :func:`convolution`)
+    - ``fixed``: the kernel is evaluated only once, and contracted with all the
+      basis functions (see :func:`convolve_vector_fixed`)
+    - ``moments``: only the moments of the kernel are integrated on each
+      interpolation area, and combined with the polynomial coefficients of all
+      the basis functions (see :func:`convolve_vector_moments`)
+
     Parameters
     ----------
         cf : RSL
@@ -215,6 +1216,8 @@ def convolve_vector(cf, interpolator, convolution_point):
             basis functions
         convolution_point : float
             convolution point
+        engine : str
+            convolution engine
 
     Returns
     -------
@@ -223,6 +1226,12 @@ def convolve_vector(cf, interpolator, convolution_point):
         els : np.ndarray
             errors
     """
+    if engine not in engines:
+        raise ValueError(f"Unknown convolution engine '{engine}'")
+    if engine == "fixed":
+        return convolve_vector_fixed(cf, interpolator, convolution_point)
+    if engine == "moments":
+        return convolve_vector_moments(cf, interpolator, convolution_point)
     ls = []
     els = []
     # iterate all polynomials
@@ -231,3 +1240,113 @@ def convolve_vector(cf, interpolator, convolution_point):
         ls.append(c)
         els.append(e)
     return np.array(ls), np.array(els)
+
+
+class ConvolutionCache:
+    """
+    Manager for convolutions that do not depend on the kinematics, but the
+    convolution point (e.g. the light coefficient functions, which do not
+    depend on :math:`Q^2`).
+
+    Since it is shared by all the structure functions of a runner, it is not
+    dropped together with them, and it allows to reuse the convolutions across
+    all the :math:`Q^2` values at the same convolution point.
+    In order to bound the memory used, only the most recently used
+    convolutions are held.
+
+    Parameters
+    ----------
+        interpolator : InterpolationDispatcher
+            basis functions
+        engine : str
+            convolution engine, see :func:`convolve_vector`
+        max_size : int or None
+            maximum number of convolutions held, if not given
+            :attr:`convolution_cache_size`
+
+    Raises
+    ------
+        ValueError
+            if the engine is unknown (before any convolution is computed)
+    """
+
+    def __init__(self, interpolator, engine="quad", max_size=None):
+        if engine not in engines:
+            raise ValueError(f"Unknown convolution engine '{engine}'")
+        self.interpolator = interpolator
+        self.engine = engine
+        self.max_size = convolution_cache_size if max_size is None else max_size
+        self.cache = {}
+
+    def __len__(self):
+        return len(self.cache)
+
+    @staticmethod
+    def key(rsl, convolution_point, nf, order):
+        """
+        Identify a convolution.
+
+        Parameters
+        ----------
+            rsl : yadism.coefficient_functions.partonic_channel.RSL
+                integration kernel
+            convolution_point : float
+                convolution point
+            nf : int
+                number of light flavors
+            order : int
+                perturbative order
+
+        Returns
+        -------
+            tuple
+                key
+        """
+        return (
+            rsl.reg,
+            rsl.sing,
+            rsl.loc,
+            *(rsl.args[part].tobytes() for part in ("reg", "sing", "loc")),
+            convolution_point,
+            nf,
+            order,
+        )
+
+    def convolve(self, rsl, convolution_point, nf, order):
+        """
+        Convolve function over all basis functions, or reuse the previous
+        result.
+
+        Parameters
+        ----------
+            rsl : yadism.coefficient_functions.partonic_channel.RSL
+                integration kernel
+            convolution_point : float
+                convolution point
+            nf : int
+                number of light flavors
+            order : int
+                perturbative order
+
+        Returns
+        -------
+            ls : np.ndarray
+                values (read-only)
+            els : np.ndarray
+                errors (read-only)
+        """
+        key = self.key(rsl, convolution_point, nf, order)
+        # move it to the end, i.e. most recently used
+        entry = self.cache.pop(key, None)
+        if entry is None:
+            ls, els = convolve_vector(
+                rsl, self.interpolator, convolution_point, engine=self.engine
+            )
+            ls.flags.writeable = False
+            els.flags.writeable = False
+            entry = (ls, els)
+            # evict the least recently used
+            while len(self.cache) >= self.max_size:
+                del self.cache[next(iter(self.cache))]
+        self.cache[key] = entry
+        return entry
@@ -4,13 +4,14 @@ Function calculation on a given kinematic point (x, Q2) (that is why they are
 called *Evaluated*).
 """
 
-import copy
 import logging
 
 import numpy as np
 from eko import basis_rotation as br
 
 from .. import coefficient_functions as cf
+from .. import profiling, tracing
+from ..coefficient_functions.light.partonic_channel import LightBase
 from . import conv
 from . import scale_variations as sv
 from .result import ESFResult
@@ -115,72 +116,163 @@ class EvaluatedStructureFunction:
         # something to do?
         if self._computed:
             return
-        cfc = cf.Combiner(self)
-        # prepare scale variations
-        sv_manager = self.info.configs.managers["sv_manager"]
-        if sv_manager is not None:
-            full_orders = sv.build_orders(self.info.configs.theory["pto"])
-        else:
-            full_orders = [(o, 0, 0, 0) for o in self.orders]
-        # init orders with 0
-        for o in full_orders:
-            self.res.orders[o] = [self.zeros, self.zeros]
-        # run
-        logger.debug("Compute %s", self)
-        # iterate all partonic channels
-        for cfe in cfc.collect_elems():
-            ker_orders = []
-            # compute raw coefficient functions
-            for o in self.orders:
-                # is order suppressed?
-                if not cfe.has_order(o):
-                    continue
+        with tracing.span(repr(self), "structure function", x=self.x, Q2=self.Q2):
+            channels = self.info.configs.managers["channels"]
+            with profiling.span(self.info.obs_name.name, "combiner", None, None):
+                cfc = cf.Combiner(self)
+                # the channels without weight are stored as well, since they
+                # might get one for other electroweak parameters
+                elems = cfc.collect_elems(keep_weightless=channels is not None)
+            # prepare scale variations
+            sv_manager = self.info.configs.managers["sv_manager"]
+            if sv_manager is not None:
+                full_orders = sv.build_orders(self.info.configs.theory["pto"])
+            else:
+                full_orders = [(o, 0, 0, 0) for o in self.orders]
+            # init orders with 0
+            for o in full_orders:
+                self.res.orders[o] = [self.zeros, self.zeros]
+            # reuse the stored convolutions, if any
+            stored = channels.load(self) if channels is not None else {}
+            computed = {}
+            # run
+            logger.debug("Compute %s", self)
+            # iterate all partonic channels
+            for cfe in elems:
+                with tracing.span(
+                    type(cfe.coeff).__name__, "kernel", channel=cfe.channel
+                ):
+                    weighted = any(w != 0 for w in cfe.partons.values())
+                    raw = stored.get(cfe.label)
+                    if raw is None:
+                        if channels is not None:
+                            if not weighted and channels.strict:
+                                continue
+                            channels.missing(self, cfe.label)
+                        raw = computed[cfe.label] = self._convolve_kernel(cfe)
+                    if not weighted:
+                        continue
+                    ker_orders = self._compute_kernel(cfe, cfc.nf, raw)
+
+                # blow up to flavor space
+                for o, (partons, val, err) in ker_orders:
+                    self.res.orders[o][0] += partons @ val
+                    self.res.orders[o][1] += np.abs(partons) @ err
+
+            if channels is not None and len(computed) > 0:
+                channels.save(self, dict(stored, **computed))
+        self._computed = True
+
+    def _convolve_kernel(self, cfe):
+        """
+        Convolve all the raw orders of a single kernel.
+
+        The result does not depend on the partons weights, i.e. on the
+        couplings (see :mod:`yadism.channels`).
+
+        Parameters
+        ----------
+        cfe : yadism.coefficient_functions.kernels.Kernel
+            kernel
+
+        Returns
+        -------
+        list
+            orders, with values and errors
+        """
+        obs = self.info.obs_name.name
+        coeff_cls = type(cfe.coeff)
+        component = coeff_cls.__module__.split(".")[2]
+        raw = []
+        # compute raw coefficient functions
+        for o in self.orders:
+            # is order suppressed?
+            if not cfe.has_order(o):
+                continue
+            with (
+                profiling.span(obs, component, coeff_cls.__name__, o),
+                tracing.span(f"order {o}", "order"),
+            ):
                 rsl = cfe.coeff[o]()
                 if rsl is None:
                     continue
                 # compute convolution point
                 convolution_point = cfe.coeff.convolution_point()
-                val, err = conv.convolve_vector(
-                    rsl, self.info.configs.managers["interpolator"], convolution_point
-                )
-                # add the factor x from the LHS
-                val, err = convolution_point * val, convolution_point * err
-                partons = np.array(
-                    [cfe.partons.get(pid, 0.0) for pid in br.flavor_basis_pids]
-                )[:, np.newaxis]
-                val = val[np.newaxis, :]
-                err = err[np.newaxis, :]
-                ker_orders.append(((o, 0, 0, 0), (partons, val, err)))
-
-            # apply scale variations
+                with tracing.span("convolution", "convolution", z=convolution_point):
+                    # light coefficient functions do not depend on Q2
+                    if isinstance(cfe.coeff, LightBase):
+                        val, err = self.info.configs.managers["conv_cache"].convolve(
+                            rsl, convolution_point, cfe.coeff.nf, o
+                        )
+                    else:
+                        val, err = conv.convolve_vector(
+                            rsl,
+                            self.info.configs.managers["interpolator"],
+                            convolution_point,
+                            engine=self.info.configs.convolution_engine,
+                        )
+            # add the factor x from the LHS
+            raw.append((o, convolution_point * val, convolution_point * err))
+        return raw
+
+    def _compute_kernel(self, cfe, nf, raw):
+        """
+        Weight all the orders of a single kernel, including scale variations.
+
+        Parameters
+        ----------
+        cfe : yadism.coefficient_functions.kernels.Kernel
+            kernel
+        nf : int
+            number of light flavors
+        raw : list
+            raw orders, with values and errors (see :meth:`_convolve_kernel`)
+
+        Returns
+        -------
+        list
+            orders, with partons weights, values and errors
+        """
+        obs = self.info.obs_name.name
+        sv_manager = self.info.configs.managers["sv_manager"]
+        partons = np.array([cfe.partons.get(pid, 0.0) for pid in br.flavor_basis_pids])[
+            :, np.newaxis
+        ]
+        ker_orders = [
+            ((o, 0, 0, 0), (partons, val[np.newaxis, :], err[np.newaxis, :]))
+            for o, val, err in raw
+        ]
+
+        # apply scale variations
+        with (
+            profiling.span(obs, "scale_variations", None, None),
+            tracing.span("scale variations", "scale_variations"),
+        ):
             # deny factorization scale variation for intrinsic
             if cfe.channel != "intrinsic":
                 ker_orders.extend(
-                    sv_manager.apply_common_scale_variations(ker_orders, cfc.nf)
+                    sv_manager.apply_common_scale_variations(ker_orders, nf)
                 )
                 ker_orders.extend(
-                    sv_manager.apply_diff_scale_variations(ker_orders, cfc.nf)
+                    sv_manager.apply_diff_scale_variations(ker_orders, nf)
                 )
             else:
                 # deny them even as generated from diff
                 ker_orders.extend(
                     filter(
                         lambda e: e[0][3] == 0,
-                        sv_manager.apply_diff_scale_variations(ker_orders, cfc.nf),
+                        sv_manager.apply_diff_scale_variations(ker_orders, nf),
                     )
                 )
-
-            # blow up to flavor space
-            for o, (partons, val, err) in ker_orders:
-                self.res.orders[o][0] += partons @ val
-                self.res.orders[o][1] += np.abs(partons) @ err
-
-        self._computed = True
+        return ker_orders
 
     def get_result(self):
         """
         Compute actual result
 
+        The result is not copied: the caller takes ownership of it, until
+        :meth:`drop_result` is called.
+
         Returns
         -------
         res : ESFResult
@@ -188,7 +280,18 @@ class EvaluatedStructureFunction:
         """
         self.compute_local()
 
-        return copy.deepcopy(self.res)
+        return self.res
+
+    def drop_result(self):
+        """
+        Release the stored result.
+
+        It will be computed again, if asked for once more.
+        """
+        if not self._computed:
+            return
+        self.res = ESFResult(self.x, self.Q2, None)
+        self._computed = False
 
 
 class ESFInfo:
@@ -127,6 +127,9 @@ class EvaluatedCrossSection:
     def alpha_qed_power(self):
         return 0
 
+    def drop_result(self):
+        """Release the stored result (nothing to do, it is never stored)."""
+
     def get_result(self):
         # Collect esfs
         flavor = self.info.obs_name.flavor
@@ -1,8 +1,82 @@
+import copy
 import numbers
 
 import numpy as np
 
 
+def pdf_grid(lhapdf_like, pids, xgrid, muF2):
+    """
+    Evaluate the PDFs on the interpolation grid.
+
+    The grid is requested at once for each flavor, if `lhapdf_like` supports
+    arrays of :math:`x`, otherwise one point at a time.
+
+    Parameters
+    ----------
+        lhapdf_like : object
+            object that provides an xfxQ2 callable (as `lhapdf <https://lhapdf.hepforge.org/>`_
+            and :class:`ekomark.toyLH.toyPDF` do) (and thus is in flavor basis)
+        pids : list(int)
+            list of pids
+        xgrid : list(float)
+            interpolation grid
+        muF2 : float
+            factorization scale
+
+    Returns
+    -------
+        pdfs : np.ndarray
+            PDFs (not multiplied by x), with shape (pids, xgrid)
+    """
+    xgrid = np.asarray(xgrid, dtype=float)
+    pdfs = np.zeros((len(pids), len(xgrid)))
+    for j, pid in enumerate(pids):
+        if not lhapdf_like.hasFlavor(pid):
+            continue
+        try:
+            xfx = np.broadcast_to(
+                np.asarray(lhapdf_like.xfxQ2(pid, xgrid, muF2), dtype=float),
+                xgrid.shape,
+            )
+        except (TypeError, ValueError):
+            # scalar-only implementation
+            xfx = np.array([lhapdf_like.xfxQ2(pid, z, muF2) for z in xgrid])
+        pdfs[j] = xfx / xgrid
+    return pdfs
+
+
+def prefactors(orders, a_s, alpha_qed, xiR, xiF):
+    r"""
+    Compute the couplings and scale logarithms multiplying each order.
+
+    Parameters
+    ----------
+        orders : list(tuple(int))
+            orders, as (strong, electroweak, renormalization log,
+            factorization log) powers
+        a_s : float or np.ndarray
+            strong coupling :math:`a_s = \alpha_s / (4\pi)`, possibly for
+            several points (along the first axis)
+        alpha_qed : float or np.ndarray
+            fine structure constant, possibly for several points
+        xiR : float
+            ratio renormalization scale to |EW| boson virtuality (linear!)
+        xiF : float
+            ratio factorization scale to |EW| boson virtuality (linear!)
+
+    Returns
+    -------
+        np.ndarray
+            prefactors, with shape (orders,) or (points, orders)
+    """
+    orders = np.array(orders, dtype=int).reshape(-1, 4).T
+    a_s = np.asarray(a_s, dtype=float)[..., np.newaxis]
+    alpha_qed = np.asarray(alpha_qed, dtype=float)[..., np.newaxis]
+    lnR = np.log((1 / xiR) ** 2) ** orders[2]
+    lnF = np.log((1 / xiF) ** 2) ** orders[3]
+    return (a_s ** orders[0]) * (alpha_qed ** orders[1]) * lnR * lnF
+
+
 class ESFResult:
     """
     Represents the output tensor for a single kinematic point
@@ -44,6 +118,28 @@ class ESFResult:
             )
         return new_output
 
+    @classmethod
+    def from_arrays(cls, arrays):
+        """
+        Recover element from its array representation
+
+        Parameters
+        ----------
+            arrays : dict
+                arrays, as produced by :meth:`get_arrays`
+
+        Returns
+        -------
+            new_output : cls
+                object representation
+        """
+        x, Q2 = arrays["kinematics"][:2]
+        nf = None if np.isnan(arrays["nf"]) else int(arrays["nf"])
+        new_output = cls(float(x), float(Q2), nf)
+        for o, v, e in zip(arrays["orders"], arrays["values"], arrays["errors"]):
+            new_output.orders[tuple(int(i) for i in o)] = (v, e)
+        return new_output
+
     def apply_pdf(self, lhapdf_like, pids, xgrid, alpha_s, alpha_qed, xiR, xiF):
         r"""
         Compute the observable for the given PDF.
@@ -70,11 +166,7 @@ class ESFResult:
 
         # factorization scale
         muF2 = self.Q2 * xiF**2
-        pdfs = np.zeros((len(pids), len(xgrid)))
-        for j, pid in enumerate(pids):
-            if not lhapdf_like.hasFlavor(pid):
-                continue
-            pdfs[j] = np.array([lhapdf_like.xfxQ2(pid, z, muF2) / z for z in xgrid])
+        pdfs = pdf_grid(lhapdf_like, pids, xgrid, muF2)
 
         # join elements
         res = 0
@@ -82,30 +174,59 @@ class ESFResult:
         # join elements
         a_s = alpha_s(np.sqrt(self.Q2) * xiR) / (4 * np.pi)
         alph_qed = alpha_qed(np.sqrt(self.Q2) * xiR)
-        for o, (v, e) in self.orders.items():
-            lnF = 1.0 if o[3] == 0 else (np.log((1 / xiF) ** 2)) ** o[3]
-            lnR = 1.0 if o[2] == 0 else (np.log((1 / xiR) ** 2)) ** o[2]
-            prefactor = (a_s ** o[0]) * (alph_qed ** o[1]) * lnR * lnF
+        factors = prefactors(list(self.orders.keys()), a_s, alph_qed, xiR, xiF)
+        for prefactor, (v, e) in zip(factors, self.orders.values()):
             res += prefactor * np.einsum("aj,aj", v, pdfs, optimize="optimal")
             err += prefactor * np.einsum("aj,aj", e, pdfs, optimize="optimal")
 
         return dict(x=self.x, Q2=self.Q2, result=res, error=err)
 
-    def get_raw(self):
+    @classmethod
+    def from_kinematics(cls, kinematics, orders=None):
         """
-        Returns the raw data ready for serialization.
+        Recover element from its kinematics
+
+        Parameters
+        ----------
+            kinematics : dict
+                kinematics, as produced by :meth:`get_kinematics`
+            orders : dict
+                orders values and errors
+
+        Returns
+        -------
+            new_output : cls
+                object representation
+        """
+        return cls(kinematics["x"], kinematics["Q2"], kinematics["nf"], orders)
+
+    def get_kinematics(self):
+        """
+        Returns the raw kinematics ready for serialization.
 
         Returns
         -------
             out : dict
-                output dictionary
+                kinematics dictionary
         """
         try:
             nf = int(self.nf)
         except TypeError:
             nf = self.nf
 
-        d = dict(x=float(self.x), Q2=float(self.Q2), nf=nf, orders=[])
+        return dict(x=float(self.x), Q2=float(self.Q2), nf=nf)
+
+    def get_raw(self):
+        """
+        Returns the raw data ready for serialization.
+
+        Returns
+        -------
+            out : dict
+                output dictionary
+        """
+        d = self.get_kinematics()
+        d["orders"] = []
 
         for o, (v, e) in self.orders.items():
             d["orders"].append(
@@ -113,6 +234,70 @@ class ESFResult:
             )
         return d
 
+    def get_arrays(self):
+        """
+        Returns the arrays representation, stacking all the orders.
+
+        Returns
+        -------
+            out : dict
+                kinematics, nf, orders, values and errors arrays
+        """
+        return dict(
+            kinematics=np.array([self.x, self.Q2], dtype=float),
+            nf=np.array(np.nan if self.nf is None else self.nf, dtype=float),
+            orders=np.array(list(self.orders.keys()), dtype=int).reshape(-1, 4),
+            values=np.array([v for v, _ in self.orders.values()]),
+            errors=np.array([e for _, e in self.orders.values()]),
+        )
+
+    def replace_nans(self):
+        """
+        Replace any NaN or infinity with 0, in place.
+
+        Returns
+        -------
+            self : ESFResult
+                the same object
+        """
+        for values in self.orders.values():
+            for ar in values:
+                mask = ~np.isfinite(ar)
+                if mask.any():
+                    ar[mask] = 0.0
+        return self
+
+    def freeze(self):
+        """
+        Make all the arrays read-only, such that they can be shared without
+        copying them.
+
+        Returns
+        -------
+            self : ESFResult
+                the same object
+        """
+        for o, (v, e) in self.orders.items():
+            v.flags.writeable = False
+            e.flags.writeable = False
+            self.orders[o] = (v, e)
+        return self
+
+    def copy(self):
+        """
+        Copy the result, with writable arrays.
+
+        Returns
+        -------
+            new_output : ESFResult
+                independent copy
+        """
+        new_output = copy.copy(self)
+        new_output.orders = {
+            o: (v.copy(), e.copy()) for o, (v, e) in self.orders.items()
+        }
+        return new_output
+
     def __add__(self, other):
         r = ESFResult(self.x, self.Q2, self.nf)
         for o, (v, e) in self.orders.items():
@@ -159,11 +344,32 @@ class EXSResult(ESFResult):
         sup = ESFResult.from_document(raw)
         return cls(sup.x, sup.Q2, raw["y"], sup.nf, sup.orders)
 
+    @classmethod
+    def from_arrays(cls, arrays):
+        sup = ESFResult.from_arrays(arrays)
+        return cls(sup.x, sup.Q2, float(arrays["kinematics"][2]), sup.nf, sup.orders)
+
+    @classmethod
+    def from_kinematics(cls, kinematics, orders=None):
+        return cls(
+            kinematics["x"], kinematics["Q2"], kinematics["y"], kinematics["nf"], orders
+        )
+
+    def get_kinematics(self):
+        d = super().get_kinematics()
+        d["y"] = float(self.y)
+        return d
+
     def get_raw(self):
         d = super().get_raw()
         d["y"] = float(self.y)
         return d
 
+    def get_arrays(self):
+        d = super().get_arrays()
+        d["kinematics"] = np.array([self.x, self.Q2, self.y], dtype=float)
+        return d
+
     def apply_pdf(self, *args):
         res = super().apply_pdf(*args)
         res["y"] = self.y
@@ -8,8 +8,9 @@ from eko import basis_rotation as br
 from eko import beta
 from scipy.special import binom  # pylint: disable=all
 
+from .. import cache, tracing
 from ..coefficient_functions import splitting_functions as split
-from .conv import convolve_operator
+from . import conv
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +40,9 @@ def build_orders(order):
 class ScaleVariations:
     """Manager for scale variations."""
 
-    def __init__(self, order, interpolator, activate_ren, activate_fact):
+    def __init__(
+        self, order, interpolator, activate_ren, activate_fact, cache_dir=None
+    ):
         """Inizialize manager.
 
         Parameters
@@ -52,12 +55,16 @@ class ScaleVariations:
             activate renormalization scale variation
         activate_fact : bool
             activate factorization scale variation
+        cache_dir : pathlib.Path or None
+            persistent cache folder (see :mod:`yadism.cache`), where the
+            operators are stored in the ``operators`` subfolder
         """
         self.order = order
         self.interpolator = interpolator
         self.activate_ren = activate_ren
         self.activate_fact = activate_fact
         self.operators = {}
+        self.cache_dir = cache_dir
         self.raw_labels = split.raw_labels[: self.order]
         logger.info(
             "RenScaleVar: %s, FactScaleVar: %s", self.activate_ren, self.activate_fact
@@ -78,14 +85,49 @@ class ScaleVariations:
                 if (l, nf) in self.operators:
                     logger.debug("using cached %s", l)
                     continue
+                digest = self.cache_key(l, nf)
+                res = cache.load(self.cache_dir, "operators", digest)
+                if res is not None:
+                    logger.debug("loading %s from disk", l)
+                    self.operators[(l, nf)] = res
+                    continue
                 start_time = time.perf_counter()
                 # TODO add error propagation
-                res, _err = convolve_operator(fnc(nf), self.interpolator)
+                with tracing.span(f"operator {l}", "scale_variations", nf=nf):
+                    res, _err = conv.convolve_operator(fnc(nf), self.interpolator)
                 self.operators[(l, nf)] = res
+                cache.save(self.cache_dir, "operators", digest, res)
                 logger.info(
                     "computing %s - took: %f s", l, time.perf_counter() - start_time
                 )
 
+    def cache_key(self, label, nf):
+        """
+        Identify an operator in the persistent cache.
+
+        Parameters
+        ----------
+            label : str
+                operator label
+            nf : int
+                number of active flavors
+
+        Returns
+        -------
+            str
+                cache key
+        """
+        return cache.key(
+            "operator",
+            label,
+            nf,
+            self.interpolator.xgrid.raw,
+            self.interpolator.polynomial_degree,
+            self.interpolator.log,
+            conv.eps_integration_abs,
+            conv.eps_integration_border,
+        )
+
     def fact_matrices(self, nf):
         r"""Compute all matrices related to factorization scale variation, i.e. :math:`\ln(Q^2/\mu_F^2)`.
 
@@ -31,6 +31,7 @@ import abc
 import numba as nb
 import numpy as np
 
+from .. import profiling, tracing
 from ..coefficient_functions.partonic_channel import RSL
 from . import conv
 from .result import ESFResult
@@ -100,6 +101,7 @@ class EvaluatedStructureFunctionTMC(abc.ABC):
         self.xi = 2 * self.x / (1 + self.rho)
         # TMC are mostly determined by shifted kinematics
         self._shifted_kinematics = {"x": self.xi, "Q2": self.Q2}
+        self.res = None
 
     @abc.abstractmethod
     def _get_result_APFEL(self):
@@ -148,6 +150,15 @@ class EvaluatedStructureFunctionTMC(abc.ABC):
 
         """
 
+    def drop_result(self):
+        """
+        Release the stored result.
+
+        It will be assembled again from the (cached) raw structure functions,
+        if asked for once more.
+        """
+        self.res = None
+
     def get_result(self):
         """
         This is the interfaces provided to get the evaluation of the TMC
@@ -162,23 +173,30 @@ class EvaluatedStructureFunctionTMC(abc.ABC):
             an object that stores the details and result of the calculation
 
         """
+        if self.res is not None:
+            return self.res
         if self.sf.runner.configs.TMC == 0:  # no TMC
             raise RuntimeError(
                 "EvaluatedStructureFunctionTMC shouldn't have been created as TMC is disabled."
             )
-        if self.sf.runner.configs.TMC == 1:  # APFEL
-            out = self._get_result_APFEL()
-        elif self.sf.runner.configs.TMC == 2:  # approx
-            out = self._get_result_approx()
-        elif self.sf.runner.configs.TMC == 3:  # exact
-            out = self._get_result_exact()
-        else:
-            raise ValueError(f"Unknown TMC value {self.sf.runner.configs.TMC}")
+        with (
+            profiling.span(self.sf.obs_name.name, "tmc", None, None),
+            tracing.span("target mass corrections", "tmc", x=self.x, Q2=self.Q2),
+        ):
+            if self.sf.runner.configs.TMC == 1:  # APFEL
+                out = self._get_result_APFEL()
+            elif self.sf.runner.configs.TMC == 2:  # approx
+                out = self._get_result_approx()
+            elif self.sf.runner.configs.TMC == 3:  # exact
+                out = self._get_result_exact()
+            else:
+                raise ValueError(f"Unknown TMC value {self.sf.runner.configs.TMC}")
 
         # ensure the correct kinematics is used after the calculations
         out.x = self.x
         out.Q2 = self.Q2
 
+        self.res = out
         return out
 
     def _convolve_FX(self, kind, ker):
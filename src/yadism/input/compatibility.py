@@ -26,6 +26,7 @@ def update(theory, observables):
     update_fns(new_theory)
     update_scale_variations(new_theory)
     update_target(new_obs)
+    update_convolution_engine(new_obs)
     if "alphaqed" in new_theory:
         new_theory["alphaem"] = new_theory.pop("alphaqed")
     # TODO: update Yadism syntax and remove PTO everywhere?
@@ -49,6 +50,19 @@ def update_scale_variations(theory):
         theory["FactScaleVar"] = True
 
 
+def update_convolution_engine(obs):
+    """
+    Set the default convolution engine.
+
+    Parameters
+    ----------
+        obs : dict
+            observable runcard
+    """
+    if obs.get("convolution_engine") is None:
+        obs["convolution_engine"] = "quad"
+
+
 def update_target(obs):
     """
     Map TargetDIS string to a (Z,A) dict.
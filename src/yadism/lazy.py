@@ -0,0 +1,41 @@
+"""Deferred imports of heavy dependencies.
+
+Some dependencies are expensive to import, but only needed by a fraction of
+the calculations (e.g. the massive coefficient functions).
+The modules returned by :func:`load` are only actually imported when one of
+their attributes is first accessed.
+"""
+
+import importlib.util
+import sys
+
+
+def load(name):
+    """Import a module on first use.
+
+    Parameters
+    ----------
+    name : str
+        absolute module name
+
+    Returns
+    -------
+    module
+        module proxy, executed on first attribute access
+
+    Raises
+    ------
+    ModuleNotFoundError
+        if the module is not available
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
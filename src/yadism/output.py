@@ -13,21 +13,20 @@ independent |DIS| operator) three outputs are provided:
 
 """
 
+import collections.abc
 import copy
+import functools
+import io
 import pathlib
 import tarfile
 import tempfile
 
 import numpy as np
-import pandas as pd
 import yaml
-from eko.couplings import Couplings, couplings_mod_ev
-from eko.io import dictlike, runcards, types
-from eko.matchings import Atlas, nf_default
-from eko.quantities.heavy_quarks import MatchingScales
 
+from . import cache
 from . import observable_name as on
-from .esf.result import ESFResult, EXSResult
+from .esf.result import ESFResult, EXSResult, pdf_grid, prefactors
 
 
 class MaskedPDF:
@@ -98,6 +97,34 @@ class Output(dict):
             output dictionary with all structure functions for all x, Q2, result and error
 
         """
+        alpha_s, alpha_qed = self.theory_couplings(theory)
+        return self.apply_pdf_alphas_alphaqed_xir_xif(
+            lhapdf_like, alpha_s, alpha_qed, theory["XIR"], theory["XIF"]
+        )
+
+    @staticmethod
+    def theory_couplings(theory):
+        r"""Determine the running couplings of a theory.
+
+        Parameters
+        ----------
+        theory : dict
+            theory dictionary
+
+        Returns
+        -------
+        alpha_s : callable
+            :math:`\alpha_s(\mu_R)`, the running strong coupling
+        alpha_qed : callable
+            :math:`\alpha(\mu_R)`, the running fine structure constant
+
+        """
+        # pylint: disable=import-outside-toplevel
+        from eko.couplings import Couplings, couplings_mod_ev
+        from eko.io import dictlike, runcards, types
+        from eko.matchings import Atlas, nf_default
+        from eko.quantities.heavy_quarks import MatchingScales
+
         new_eko_theory = runcards.Legacy(theory=theory, operator={}).new_theory
         method = runcards.Legacy.MOD_EV2METHOD.get(theory["ModEv"], theory["ModEv"])
         method = dictlike.load_enum(types.EvolutionMethod, method)
@@ -128,9 +155,7 @@ class Output(dict):
         else:
             raise ValueError(f"Scheme '{fns}' not recognized.")
         alpha_qed = lambda _muR: theory["alphaqed"]
-        return self.apply_pdf_alphas_alphaqed_xir_xif(
-            lhapdf_like, alpha_s, alpha_qed, theory["XIR"], theory["XIF"]
-        )
+        return alpha_s, alpha_qed
 
     def apply_pdf_alphas_alphaqed_xir_xif(
         self, lhapdf_like, alpha_s, alpha_qed, xiR, xiF
@@ -156,13 +181,17 @@ class Output(dict):
         -------
         ret : :class:`PDFOutput`
             output dictionary with all structure functions for all :math:`x`,
-            :math:`Q^2`, result and error
+            :math:`Q^2`, result and error (``None`` for the points not
+            computed, e.g. of other shards)
 
         """
         # iterate
         ret = PDFOutput()
 
         xgrid = self["xgrid"]["grid"]
+        # PDFs and couplings are shared by all the points at the same scale
+        pdfs = {}
+        couplings = {}
 
         # dispatch onto result
         for obs in self:
@@ -170,15 +199,230 @@ class Output(dict):
                 continue
             if self[obs] is None:
                 continue
-            ret[obs] = []
-            for kin in self[obs]:
-                ret[obs].append(
-                    kin.apply_pdf(
-                        lhapdf_like, self["pids"], xgrid, alpha_s, alpha_qed, xiR, xiF
+            points = list(self[obs])
+            present, filled = _filled(points)
+            # unfilled points (e.g. of other shards) stay empty
+            ret[obs] = [None] * len(points)
+            if len(filled) == 0:
+                continue
+
+            values, errors = _coefficients(
+                filled, alpha_s, alpha_qed, xiR, xiF, couplings
+            )
+            for kin in filled:
+                if kin.Q2 not in pdfs:
+                    pdfs[kin.Q2] = pdf_grid(
+                        lhapdf_like, self["pids"], xgrid, kin.Q2 * xiF**2
                     )
+            grids = np.array([pdfs[kin.Q2] for kin in filled])
+            res = np.einsum("paj,paj->p", values, grids, optimize="optimal")
+            err = np.einsum("paj,paj->p", errors, grids, optimize="optimal")
+            for j, kin, r, e in zip(present, filled, res, err):
+                point = dict(x=kin.x, Q2=kin.Q2, result=r, error=e)
+                if isinstance(kin, EXSResult):
+                    point["y"] = kin.y
+                ret[obs][j] = point
+        return ret
+
+    def apply_pdf_set(self, members):
+        r"""Compute all observables for all the members of a PDF set.
+
+        Parameters
+        ----------
+        members : list(object)
+            objects that provide an xfxQ2 callable (as `lhapdf
+            <https://lhapdf.hepforge.org/>`_ and :class:`ekomark.toyLH.toyPDF`
+            do), e.g. all the members of an LHAPDF set
+
+        Returns
+        -------
+        ret : dict
+            for each observable, kinematics and results and errors as arrays
+            with shape (members, points) (NaN for the points not computed,
+            e.g. of other shards)
+
+        """
+        alpha_s, alpha_qed = self.theory_couplings(self.theory)
+        return self.apply_pdf_set_alphas_alphaqed_xir_xif(
+            members, alpha_s, alpha_qed, self.theory["XIR"], self.theory["XIF"]
+        )
+
+    def apply_pdf_set_alphas_alphaqed_xir_xif(
+        self, members, alpha_s, alpha_qed, xiR, xiF
+    ):
+        r"""Compute all observables for all the members of a PDF set.
+
+        The PDFs of all the members are stacked for each scale, and contracted
+        with all the points sharing it at once.
+
+        Parameters
+        ----------
+        members : list(object)
+            objects that provide an xfxQ2 callable (as `lhapdf
+            <https://lhapdf.hepforge.org/>`_ and :class:`ekomark.toyLH.toyPDF`
+            do), e.g. all the members of an LHAPDF set
+        alpha_s : callable
+            :math:`\alpha_s(\mu_R)`, the running strong coupling
+        alpha_qed : callable
+            :math:`\alpha(\mu_R)`, the running fine structure constant
+        xiR : float
+            ratio renormalization scale to |EW| boson virtuality (linear!)
+        xiF : float
+            ratio factorization scale to |EW| boson virtuality (linear!)
+
+        Returns
+        -------
+        ret : dict
+            for each observable, kinematics and results and errors as arrays
+            with shape (members, points) (NaN for the points not computed,
+            e.g. of other shards)
+
+        """
+        xgrid = self["xgrid"]["grid"]
+        couplings = {}
+
+        ret = {}
+        coefficients = {}
+        for obs in self:
+            if not on.ObservableName.is_valid(obs):
+                continue
+            if self[obs] is None:
+                continue
+            points = list(self[obs])
+            present, filled = _filled(points)
+            ret[obs] = _kinematics(points, present, filled, len(members))
+            if len(filled) > 0:
+                coefficients[obs] = (
+                    present,
+                    *_coefficients(filled, alpha_s, alpha_qed, xiR, xiF, couplings),
+                )
+
+        # one scale at a time, to bound the memory used by the PDFs
+        scales = [ret[obs]["Q2"][entry[0]] for obs, entry in coefficients.items()]
+        for Q2 in np.unique(np.concatenate(scales)) if scales else []:
+            grids = np.array(
+                [
+                    pdf_grid(member, self["pids"], xgrid, Q2 * xiF**2)
+                    for member in members
+                ]
+            ).reshape(len(members), -1)
+            for obs, (present, values, errors) in coefficients.items():
+                sel = np.flatnonzero(ret[obs]["Q2"][present] == Q2)
+                if len(sel) == 0:
+                    continue
+                pos = present[sel]
+                ret[obs]["result"][:, pos] = grids @ values[sel].reshape(len(sel), -1).T
+                ret[obs]["error"][:, pos] = grids @ errors[sel].reshape(len(sel), -1).T
+        return ret
+
+    def apply_pdf_scales(self, lhapdf_like, scales):
+        r"""Compute all observables for the given PDF, at several scales.
+
+        Parameters
+        ----------
+        lhapdf_like : object
+            object that provides an xfxQ2 callable (as `lhapdf
+            <https://lhapdf.hepforge.org/>`_ and :class:`ekomark.toyLH.toyPDF`
+            do) (and thus is in flavor basis)
+        scales : list(tuple(float, float))
+            scale variations prescription, as a list of (``xiR``, ``xiF``)
+            ratios
+
+        Returns
+        -------
+        ret : dict
+            for each observable, kinematics and results and errors as arrays
+            with shape (prescriptions, points) (NaN for the points not
+            computed, e.g. of other shards)
+
+        """
+        alpha_s, alpha_qed = self.theory_couplings(self.theory)
+        return self.apply_pdf_scales_alphas_alphaqed(
+            lhapdf_like, alpha_s, alpha_qed, scales
+        )
+
+    def apply_pdf_scales_alphas_alphaqed(self, lhapdf_like, alpha_s, alpha_qed, scales):
+        r"""Compute all observables for the given PDF, at several scales.
+
+        The scale logarithms stored in the orders allow to evaluate all the
+        prescriptions from the same coefficients: the PDFs are evaluated only
+        once for each distinct factorization scale, and the couplings only
+        once for each distinct renormalization scale.
+
+        Parameters
+        ----------
+        lhapdf_like : object
+            object that provides an xfxQ2 callable (as `lhapdf
+            <https://lhapdf.hepforge.org/>`_ and :class:`ekomark.toyLH.toyPDF`
+            do) (and thus is in flavor basis)
+        alpha_s : callable
+            :math:`\alpha_s(\mu_R)`, the running strong coupling
+        alpha_qed : callable
+            :math:`\alpha(\mu_R)`, the running fine structure constant
+        scales : list(tuple(float, float))
+            scale variations prescription, as a list of (``xiR``, ``xiF``)
+            ratios (linear!)
+
+        Returns
+        -------
+        ret : dict
+            for each observable, kinematics and results and errors as arrays
+            with shape (prescriptions, points) (NaN for the points not
+            computed, e.g. of other shards)
+
+        """
+        xgrid = self["xgrid"]["grid"]
+        pdfs = {}
+        couplings = {}
+
+        ret = {}
+        for obs in self:
+            if not on.ObservableName.is_valid(obs):
+                continue
+            if self[obs] is None:
+                continue
+            points = list(self[obs])
+            present, filled = _filled(points)
+            ret[obs] = _kinematics(points, present, filled, len(scales))
+            if len(filled) == 0:
+                continue
+
+            stacked = _stack(filled)
+            for j, (xiR, xiF) in enumerate(scales):
+                values, errors = _coefficients(
+                    filled, alpha_s, alpha_qed, xiR, xiF, couplings, stacked
                 )
+                muF2 = ret[obs]["Q2"][present] * xiF**2
+                for mu2 in muF2:
+                    if mu2 not in pdfs:
+                        pdfs[mu2] = pdf_grid(lhapdf_like, self["pids"], xgrid, mu2)
+                grids = np.array([pdfs[mu2] for mu2 in muF2])
+                ret[obs]["result"][j, present] = np.einsum("paj,paj->p", values, grids)
+                ret[obs]["error"][j, present] = np.einsum("paj,paj->p", errors, grids)
         return ret
 
+    def copy(self):
+        """Copy the whole output.
+
+        The results produced by the runner have read-only arrays, shared by
+        all the consumers; the copy is independent and writable.
+
+        Returns
+        -------
+        :class:`Output`
+            deep copy
+
+        """
+        new = self.__class__()
+        new.theory = copy.deepcopy(self.theory)
+        new.observables = copy.deepcopy(self.observables)
+        for key, value in self.items():
+            if on.ObservableName.is_valid(key) and value is not None:
+                new[key] = [None if kin is None else kin.copy() for kin in value]
+            else:
+                new[key] = copy.deepcopy(value)
+        return new
+
     def get_raw(self):
         """Serialize result as dict.
 
@@ -206,7 +450,8 @@ class Output(dict):
                 continue
             out[obs] = []
             for kin in self[obs]:
-                out[obs].append(kin.get_raw())
+                # missing points (e.g. computed by a different shard)
+                out[obs].append(None if kin is None else kin.get_raw())
         return out
 
     def dump_yaml(self, stream=None):
@@ -248,7 +493,7 @@ class Output(dict):
             ret = self.dump_yaml(f)
         return ret
 
-    def dump_tar(self, tarpath, runcards=True):
+    def dump_tar(self, tarpath, runcards=True, compress=True):
         """Serialize output in a tar archive.
 
         This is the favorite *native* output.
@@ -268,6 +513,12 @@ class Output(dict):
         ----------
         tarpath : str or os.PathLike
             target file path (it has to have the '.tar' extension)
+        runcards : bool
+            whether to include the runcards
+        compress : bool
+            whether to compress the arrays (in ``.npz`` archives), otherwise
+            they are stored as plain ``.npy`` files, that can be memory mapped
+            when loading (see :meth:`load_tar`)
 
         Raises
         ------
@@ -290,42 +541,44 @@ class Output(dict):
                     # and so everything we need (what is safe in yaml)
                     metadata[metafield] = np.array(metavalue).tolist()
                 else:
+                    # missing points (e.g. computed by a different shard)
+                    present = [
+                        j for j, esfres in enumerate(metavalue) if esfres is not None
+                    ]
                     kinematics = {}
-                    for key in metavalue[0].get_raw():
-                        if key != "orders":
-                            kinematics[key] = []
-
                     orders_first = []
-                    values = []
-                    errors = []
-                    for esfres in metavalue:
-                        orders = []
-                        esf_values = []
-                        esf_errors = []
-                        for key, value in esfres.get_raw().items():
-                            if key != "orders":
-                                kinematics[key].append(value)
-                            else:
-                                for order in value:
-                                    orders.append(order["order"])
-                                    esf_values.append(order["values"])
-                                    esf_errors.append(order["errors"])
-
-                        if len(orders_first) == 0:
+                    values = np.array([])
+                    errors = np.array([])
+                    for i, j in enumerate(present):
+                        esfres = metavalue[j]
+                        for key, value in esfres.get_kinematics().items():
+                            kinematics.setdefault(key, []).append(value)
+
+                        orders = [list(o) for o in esfres.orders.keys()]
+                        if i == 0:
                             orders_first = orders
+                            # stack directly in place, avoiding lists of floats
+                            first = [val for val, _ in esfres.orders.values()]
+                            shape = (len(present), len(first))
+                            dtype = float
+                            if len(first) > 0:
+                                shape += np.shape(first[0])
+                                dtype = np.result_type(*first)
+                            values = np.empty(shape, dtype=dtype)
+                            errors = np.empty(shape, dtype=dtype)
                         else:
                             assert orders_first == orders
-                        values.append(esf_values)
-                        errors.append(esf_errors)
+                        for k, (val, err) in enumerate(esfres.orders.values()):
+                            values[i, k] = val
+                            errors[i, k] = err
 
-                    np.savez_compressed(
-                        tmpdir / metafield,
-                        values=np.array(values),
-                        errors=np.array(errors),
-                    )
+                    _save_arrays(tmpdir, metafield, values, errors, compress)
                     metadata[metafield] = dict(
                         orders=orders_first, kinematics=kinematics
                     )
+                    if len(present) < len(metavalue):
+                        metadata[metafield]["indices"] = present
+                        metadata[metafield]["size"] = len(metavalue)
 
             (tmpdir / "metadata.yaml").write_text(
                 yaml.safe_dump(metadata, default_flow_style=None), encoding="utf-8"
@@ -345,7 +598,7 @@ class Output(dict):
                 tar.add(tmpdir, arcname=tarpath.stem)
 
     @classmethod
-    def load_tar(cls, tarpath):
+    def load_tar(cls, tarpath, lazy=False):
         """Deserialize output object from tar.
 
         It loads an :meth:`Output.dump_tar` generated tar file into an
@@ -355,6 +608,10 @@ class Output(dict):
         ----------
         tarpath : str or os.PathLike
             target file path (it has to be a 'tar' archive)
+        lazy : bool
+            if set, the observables are only loaded when accessed (see
+            :class:`LazyResults`), memory mapping the uncompressed arrays
+            directly from the archive
 
         Returns
         -------
@@ -367,51 +624,177 @@ class Output(dict):
         # Initialize output object
         out = cls()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = pathlib.Path(tmpdir)
+        with tarfile.open(tarpath, "r") as tar:
+            members = _members(tar)
+            theory = _read_member(tar, members, "runcards/theory.yaml")
+            observables = _read_member(tar, members, "runcards/observables.yaml")
+            metadata = yaml.safe_load(_read_member(tar, members, "metadata.yaml"))
+        if theory is not None:
+            out.theory = yaml.safe_load(theory)
+            out.observables = yaml.safe_load(observables)
+
+        for metafield, metavalue in metadata.items():
+            if not on.ObservableName.is_valid(metafield) or metavalue is None:
+                ar = np.array(metavalue)
+                if ar.ndim > 0:
+                    out[metafield] = ar
+                else:
+                    out[metafield] = metavalue
+            else:
+                results = LazyResults(
+                    metavalue,
+                    functools.partial(
+                        _load_arrays, tarpath, members, metafield, mmap=lazy
+                    ),
+                )
+                out[metafield] = results if lazy else list(results)
+
+        return out
+
+    @classmethod
+    def merge(cls, *outputs):
+        """Merge the outputs of different shards of the same calculation.
+
+        Parameters
+        ----------
+        outputs : list(:class:`Output`)
+            outputs to be merged, possibly containing only some of the points
 
-            with tarfile.open(tarpath, "r") as tar:
-                tar.extractall(tmpdir)
+        Returns
+        -------
+        :class:`Output`
+            merged object (still missing the points not available in any of
+            the outputs)
 
-            # The internal name is the one that has been used to save, since the
-            # tar could have been renamed in the meanwhile, it might be unknown,
-            # but there is only a single folder
-            innerdir = list(tmpdir.glob("*"))[0]
+        Raises
+        ------
+        ValueError
+            if the outputs do not share runcards, interpolation, and orders, or
+            if a point is contained in more than one of them
 
-            runcards = innerdir / "runcards"
-            out.theory = yaml.safe_load((runcards / "theory.yaml").read_text())
-            out.observables = yaml.safe_load(
-                (runcards / "observables.yaml").read_text()
+        """
+        if len(outputs) == 0:
+            raise ValueError("Nothing to merge")
+        first = outputs[0]
+        for other in outputs[1:]:
+            _check_compatible(
+                (first.theory, first.observables), (other.theory, other.observables)
             )
+            if list(other.keys()) != list(first.keys()):
+                raise ValueError("Outputs with different content can not be merged")
+
+        merged = cls()
+        merged.theory = first.theory
+        merged.observables = first.observables
+        for key, value in first.items():
+            if not on.ObservableName.is_valid(key) or value is None:
+                for other in outputs[1:]:
+                    _check_compatible(value, other[key], key)
+                merged[key] = value
+                continue
+            points = [None] * len(value)
+            orders = None
+            for other in outputs:
+                if len(other[key]) != len(points):
+                    raise ValueError(f"Different number of points for '{key}'")
+                for j, point in enumerate(other[key]):
+                    if point is None:
+                        continue
+                    if points[j] is not None:
+                        raise ValueError(f"Point {j} of '{key}' is not unique")
+                    if orders is None:
+                        orders = list(point.orders.keys())
+                    elif list(point.orders.keys()) != orders:
+                        raise ValueError(f"Different orders for '{key}'")
+                    points[j] = point
+            merged[key] = points
+        return merged
 
-            metadata = yaml.safe_load((innerdir / "metadata.yaml").read_text())
-            for metafield, metavalue in metadata.items():
-                if not on.ObservableName.is_valid(metafield) or metavalue is None:
-                    ar = np.array(metavalue)
-                    if ar.ndim > 0:
-                        out[metafield] = ar
-                    else:
-                        out[metafield] = metavalue
-                else:
-                    op = np.load(innerdir / f"{metafield}.npz")
-                    kinvars, kinvalues = list(zip(*metavalue["kinematics"].items()))
-                    kinematics = [dict(zip(kinvars, kin)) for kin in zip(*kinvalues)]
-                    orders = metavalue["orders"]
+    @classmethod
+    def merge_tar(cls, tarpath, *tarpaths, compress=True):
+        """Merge tar archives of different shards of the same calculation.
 
-                    Result = ESFResult if "y" not in kinvars else EXSResult
-                    results = []
+        It is the equivalent of :meth:`merge` for :meth:`dump_tar` generated
+        archives, but it only loads the arrays of a single observable at a
+        time.
 
-                    for kin, val, err in zip(kinematics, op["values"], op["errors"]):
-                        res = kin.copy()
-                        res["orders"] = [
-                            dict(zip(["order", "values", "errors"], ordvalerr))
-                            for ordvalerr in zip(orders, val, err)
-                        ]
-                        results.append(Result.from_document(res))
+        Parameters
+        ----------
+        tarpath : str or os.PathLike
+            target file path (it has to have the '.tar' extension)
+        tarpaths : list(str or os.PathLike)
+            archives to be merged
+        compress : bool
+            whether to compress the arrays (see :meth:`dump_tar`)
 
-                    out[metafield] = results
+        Raises
+        ------
+        ValueError
+            if the archives do not share runcards, interpolation, and orders,
+            or if a point is contained in more than one of them
 
-        return out
+        """
+        tarpath = pathlib.Path(tarpath)
+        if tarpath.suffix != ".tar":
+            raise ValueError(f"'{tarpath}' is not a valid tar filename, wrong suffix")
+        if len(tarpaths) == 0:
+            raise ValueError("Nothing to merge")
+
+        indices = []
+        metadatas = []
+        runcards = []
+        for path in tarpaths:
+            with tarfile.open(path, "r") as tar:
+                members = _members(tar)
+                indices.append(members)
+                metadatas.append(
+                    yaml.safe_load(_read_member(tar, members, "metadata.yaml"))
+                )
+                runcards.append(
+                    [
+                        _read_member(tar, members, f"runcards/{card}.yaml")
+                        for card in ["theory", "observables"]
+                    ]
+                )
+        for meta, cards in zip(metadatas[1:], runcards[1:]):
+            _check_compatible(
+                [yaml.safe_load(card) for card in runcards[0] if card is not None],
+                [yaml.safe_load(card) for card in cards if card is not None],
+            )
+            if list(meta.keys()) != list(metadatas[0].keys()):
+                raise ValueError("Outputs with different content can not be merged")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = pathlib.Path(tmpdir)
+
+            metadata = {}
+            for metafield, metavalue in metadatas[0].items():
+                if not on.ObservableName.is_valid(metafield) or metavalue is None:
+                    for other in metadatas[1:]:
+                        _check_compatible(metavalue, other[metafield], metafield)
+                    metadata[metafield] = metavalue
+                    continue
+                metadata[metafield] = _merge_observable(
+                    metafield,
+                    [meta[metafield] for meta in metadatas],
+                    [
+                        _load_arrays(path, members, metafield, mmap=True)
+                        for path, members in zip(tarpaths, indices)
+                    ],
+                    tmpdir,
+                    compress,
+                )
+
+            (tmpdir / "metadata.yaml").write_text(
+                yaml.safe_dump(metadata, default_flow_style=None), encoding="utf-8"
+            )
+            if runcards[0][0] is not None:
+                (tmpdir / "runcards").mkdir()
+                (tmpdir / "runcards" / "theory.yaml").write_bytes(runcards[0][0])
+                (tmpdir / "runcards" / "observables.yaml").write_bytes(runcards[0][1])
+
+            with tarfile.open(tarpath, "w") as tar:
+                tar.add(tmpdir, arcname=tarpath.stem)
 
     @classmethod
     def load_yaml(cls, stream):
@@ -438,9 +821,12 @@ class Output(dict):
                 continue
             if obj[obs] is None:
                 continue
-            Result = ESFResult if "y" not in obj[obs][0] else EXSResult
+            first = next((kin for kin in obj[obs] if kin is not None), {})
+            Result = ESFResult if "y" not in first else EXSResult
             for j, kin in enumerate(obj[obs]):
-                obj[obs][j] = Result.from_document(kin)
+                # missing points (e.g. computed by a different shard)
+                if kin is not None:
+                    obj[obs][j] = Result.from_document(kin)
 
         out = cls(obj)
         out.theory = obj["theory"]
@@ -470,6 +856,336 @@ class Output(dict):
         return obj
 
 
+class LazyResults(collections.abc.Sequence):
+    """Results of an observable loaded from a tar archive.
+
+    The arrays are only loaded the first time a point is accessed, and each
+    point is built on top of views of them.
+
+    Parameters
+    ----------
+    metadata : dict
+        observable metadata, as stored by :meth:`Output.dump_tar`
+    load : callable
+        loader of the values and errors arrays
+
+    """
+
+    def __init__(self, metadata, load):
+        self.load = load
+        self.arrays = None
+        self.kinematics = metadata["kinematics"]
+        self.orders = [tuple(o) for o in metadata["orders"]]
+        self.Result = ESFResult if "y" not in self.kinematics else EXSResult
+        kinvalues = list(self.kinematics.values())
+        size = metadata.get("size", len(kinvalues[0]) if len(kinvalues) > 0 else 0)
+        # missing points (e.g. computed by a different shard)
+        self.positions = [None] * size
+        for pos, j in enumerate(metadata.get("indices", range(size))):
+            self.positions[j] = pos
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return [self[i] for i in range(*j.indices(len(self)))]
+        pos = self.positions[j]
+        if pos is None:
+            return None
+        if self.arrays is None:
+            self.arrays = self.load()
+        values, errors = self.arrays
+        kin = {var: vals[pos] for var, vals in self.kinematics.items()}
+        return self.Result.from_kinematics(
+            kin, dict(zip(self.orders, zip(values[pos], errors[pos])))
+        )
+
+
+def _filled(points):
+    """Select the computed points of an observable.
+
+    Parameters
+    ----------
+    points : list(ESFResult or None)
+        points of an observable, ``None`` if not computed (e.g. in a shard)
+
+    Returns
+    -------
+    np.ndarray
+        indices of the computed points
+    list(ESFResult)
+        computed points
+    """
+    present = np.array([j for j, kin in enumerate(points) if kin is not None], int)
+    return present, [points[j] for j in present]
+
+
+def _kinematics(points, present, filled, rows):
+    """Allocate the arrays of the results of an observable.
+
+    The kinematics of the points not computed, and all the results, are NaN.
+
+    Parameters
+    ----------
+    points : list(ESFResult or None)
+        points of an observable
+    present : np.ndarray
+        indices of the computed points (see :func:`_filled`)
+    filled : list(ESFResult)
+        computed points
+    rows : int
+        number of results of each point
+
+    Returns
+    -------
+    dict
+        kinematics, results and errors arrays
+    """
+    fields = ["x", "Q2"]
+    if len(filled) > 0 and isinstance(filled[0], EXSResult):
+        fields.append("y")
+    arrays = {}
+    for field in fields:
+        arrays[field] = np.full(len(points), np.nan)
+        arrays[field][present] = [getattr(kin, field) for kin in filled]
+    arrays["result"] = np.full((rows, len(points)), np.nan)
+    arrays["error"] = np.full((rows, len(points)), np.nan)
+    return arrays
+
+
+def _stack(points):
+    """Stack the orders of the points of an observable.
+
+    Parameters
+    ----------
+    points : list(ESFResult)
+        points of an observable
+
+    Returns
+    -------
+    tuple(list, np.ndarray) or None
+        orders and values and errors, with shape (2, points, orders, pids,
+        xgrid), or ``None`` if not all the points have the same orders
+
+    """
+    orders = list(points[0].orders.keys())
+    if any(list(kin.orders.keys()) != orders for kin in points):
+        return None
+    stacked = np.array([list(kin.orders.values()) for kin in points])
+    return orders, stacked.transpose(2, 0, 1, 3, 4)
+
+
+def _coefficients(points, alpha_s, alpha_qed, xiR, xiF, couplings, stacked=None):
+    """Sum the orders of the points, weighted by couplings and scale logarithms.
+
+    Parameters
+    ----------
+    points : list(ESFResult)
+        points of an observable
+    alpha_s : callable
+        running strong coupling
+    alpha_qed : callable
+        running fine structure constant
+    xiR : float
+        ratio renormalization scale to |EW| boson virtuality (linear!)
+    xiF : float
+        ratio factorization scale to |EW| boson virtuality (linear!)
+    couplings : dict
+        couplings already evaluated, by renormalization scale (updated in
+        place)
+    stacked : tuple or None
+        orders already stacked by :func:`_stack`, if available
+
+    Returns
+    -------
+    tuple(np.ndarray, np.ndarray)
+        values and errors coefficients, with shape (points, pids, xgrid)
+
+    """
+    scales = np.sqrt([kin.Q2 for kin in points]) * xiR
+    for muR in scales:
+        if muR not in couplings:
+            couplings[muR] = (alpha_s(muR) / (4 * np.pi), alpha_qed(muR))
+    a_s, alph_qed = np.array([couplings[muR] for muR in scales]).T
+
+    if stacked is None:
+        stacked = _stack(points)
+    if stacked is not None:
+        orders, tensor = stacked
+        factors = prefactors(orders, a_s, alph_qed, xiR, xiF)
+        return tuple(
+            np.einsum("po,poaj->paj", factors, tensor[k], optimize="optimal")
+            for k in range(2)
+        )
+    # not uniform, one point at a time
+    values = []
+    errors = []
+    for kin, a, alph in zip(points, a_s, alph_qed):
+        factors = prefactors(list(kin.orders.keys()), a, alph, xiR, xiF)
+        val, err = np.array(list(kin.orders.values())).transpose(1, 0, 2, 3)
+        values.append(np.einsum("o,oaj->aj", factors, val))
+        errors.append(np.einsum("o,oaj->aj", factors, err))
+    return np.array(values), np.array(errors)
+
+
+def _members(tar):
+    """Index the content of a :meth:`Output.dump_tar` generated archive."""
+    # The internal name is the one that has been used to save, since the
+    # tar could have been renamed in the meanwhile, it might be unknown,
+    # but there is only a single folder
+    members = {}
+    for member in tar.getmembers():
+        parts = member.name.split("/", 1)
+        if len(parts) == 2:
+            members[parts[1]] = member
+    return members
+
+
+def _read_member(tar, members, name):
+    """Read a file from a :meth:`Output.dump_tar` generated archive."""
+    if name not in members:
+        return None
+    return tar.extractfile(members[name]).read()
+
+
+def _save_arrays(folder, name, values, errors, compress):
+    """Store the arrays of an observable."""
+    if compress:
+        np.savez_compressed(folder / name, values=values, errors=errors)
+        return
+    (folder / name).mkdir()
+    np.save(folder / name / "values.npy", values)
+    np.save(folder / name / "errors.npy", errors)
+
+
+def _load_npy(tarpath, member, mmap):
+    """Load an uncompressed array from an archive, possibly memory mapping it."""
+    with open(tarpath, "rb") as fd:
+        fd.seek(member.offset_data)
+        if not mmap:
+            return np.load(fd)
+        version = np.lib.format.read_magic(fd)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(fd)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(fd)
+        offset = fd.tell()
+    # empty arrays can not be mapped
+    if np.prod(shape) == 0:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(
+        tarpath,
+        dtype=dtype,
+        mode="r",
+        shape=shape,
+        order="F" if fortran_order else "C",
+        offset=offset,
+    )
+
+
+def _load_arrays(tarpath, members, name, mmap=False):
+    """Load the values and errors of an observable from an archive.
+
+    Parameters
+    ----------
+    tarpath : pathlib.Path
+        archive path
+    members : dict
+        archive content, see :func:`_members`
+    name : str
+        observable name
+    mmap : bool
+        whether to memory map uncompressed arrays
+
+    Returns
+    -------
+    tuple(np.ndarray, np.ndarray)
+        values and errors
+
+    """
+    if f"{name}.npz" in members:
+        with tarfile.open(tarpath, "r") as tar:
+            archive = _read_member(tar, members, f"{name}.npz")
+        with np.load(io.BytesIO(archive)) as op:
+            return op["values"], op["errors"]
+    return tuple(
+        _load_npy(tarpath, members[f"{name}/{field}.npy"], mmap)
+        for field in ["values", "errors"]
+    )
+
+
+def _check_compatible(first, other, what="runcards"):
+    """Check that the common content of two outputs coincides."""
+    if cache.key(first) != cache.key(other):
+        raise ValueError(f"Outputs with different {what} can not be merged")
+
+
+def _merge_observable(name, metas, arrays, folder, compress):
+    """Merge the serialized points of an observable from different archives.
+
+    Parameters
+    ----------
+    name : str
+        observable name
+    metas : list(dict)
+        observable metadata from each archive
+    arrays : list(tuple(np.ndarray, np.ndarray))
+        observable values and errors from each archive
+    folder : pathlib.Path
+        target folder, where the merged arrays are stored
+    compress : bool
+        whether to compress the arrays
+
+    Returns
+    -------
+    dict
+        merged observable metadata
+
+    """
+    sizes = set()
+    for meta in metas:
+        kinematics = list(meta["kinematics"].values())
+        sizes.add(meta.get("size", len(kinematics[0]) if len(kinematics) > 0 else 0))
+    if len(sizes) != 1:
+        raise ValueError(f"Different number of points for '{name}'")
+    size = sizes.pop()
+
+    # locate each point: archive and position in it
+    owners = [None] * size
+    orders = None
+    for k, meta in enumerate(metas):
+        indices = meta.get("indices", range(size))
+        if len(indices) == 0:
+            continue
+        if orders is None:
+            orders = meta["orders"]
+        elif meta["orders"] != orders:
+            raise ValueError(f"Different orders for '{name}'")
+        for pos, j in enumerate(indices):
+            if owners[j] is not None:
+                raise ValueError(f"Point {j} of '{name}' is not unique")
+            owners[j] = (k, pos)
+    present = [j for j, owner in enumerate(owners) if owner is not None]
+
+    keys = next((list(meta["kinematics"]) for meta in metas if meta["kinematics"]), [])
+    kinematics = {
+        key: [metas[owners[j][0]]["kinematics"][key][owners[j][1]] for j in present]
+        for key in keys
+    }
+    values, errors = (
+        np.array([arrays[owners[j][0]][field][owners[j][1]] for j in present])
+        for field in range(2)
+    )
+    _save_arrays(folder, name, values, errors, compress)
+
+    merged = dict(orders=[] if orders is None else orders, kinematics=kinematics)
+    if len(present) < size:
+        merged["indices"] = present
+        merged["size"] = size
+    return merged
+
+
 class PDFOutput(Output):
     """Wrapper for the PDF output to help with dumping to file."""
 
@@ -488,6 +1204,9 @@ class PDFOutput(Output):
                 continue
             out[obs] = []
             for kin in self[obs]:
+                if kin is None:
+                    out[obs].append(None)
+                    continue
                 out[obs].append({k: float(v) for k, v in kin.items()})
         return out
 
@@ -512,9 +1231,12 @@ class PDFOutput(Output):
     @property
     def tables(self):
         """Convert data into a mapping structure functions -> :class:`pandas.DataFrame`."""
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
         tables = {}
         for k, v in self.items():
-            tables[k] = pd.DataFrame(v)
+            # skip the points not computed (e.g. of other shards)
+            tables[k] = pd.DataFrame([kin for kin in v if kin is not None])
 
         return tables
 
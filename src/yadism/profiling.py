@@ -0,0 +1,178 @@
+"""Opt-in profiling of the calculation.
+
+When a :class:`Profile` is active (see :func:`activate`), the instrumented
+sections of the calculation accumulate their wall time, number of calls, and
+number of integration subintervals, per (observable, component, partonic
+channel, order), where the component is the family of coefficient functions
+(``light``, ``heavy``, ``asy``, ``intrinsic``).
+
+Some overheads are accounted for separately, with a dedicated component:
+
+- ``combiner``: the collection of the coefficient functions
+- ``scale_variations``: the application of the scale variations
+- ``tmc``: the target mass corrections (the time is inclusive of the
+  structure functions computed on the shifted kinematics)
+
+If no profile is active, the instrumentation has no effect.
+"""
+
+import contextlib
+import json
+import os
+import time
+
+enabled = os.environ.get("YADISM_PROFILE", "0") not in ("", "0")
+"""Profile the runners by default, see :class:`yadism.runner.Runner`"""
+
+report_file = os.environ.get("YADISM_PROFILE_FILE", "yadism-profile.json")
+"""Path of the JSON report written at the end of a profiled run"""
+
+fields = ("observable", "component", "channel", "order")
+"""Fields of the sections keys"""
+
+current = None
+"""Active profile, if any"""
+
+
+class Profile:
+    """Counters of the instrumented sections.
+
+    Each section is identified by a key, i.e. a tuple of values for
+    :attr:`fields`, and it stores the total wall time (in seconds), the
+    number of calls, and the number of integration subintervals.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.stack = []
+
+    @contextlib.contextmanager
+    def span(self, *key):
+        """Time a section.
+
+        Parameters
+        ----------
+        key : tuple
+            section identifier, see :attr:`fields`
+        """
+        entry = self.entries.setdefault(key, [0.0, 0, 0])
+        self.stack.append(entry)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry[0] += time.perf_counter() - start
+            entry[1] += 1
+            self.stack.pop()
+
+    def add_subintervals(self, count):
+        """Account integration subintervals to the innermost open section."""
+        if len(self.stack) > 0:
+            self.stack[-1][2] += count
+
+    def merge(self, entries):
+        """Accumulate the counters of another profile.
+
+        Parameters
+        ----------
+        entries : dict
+            :attr:`entries` of the other profile
+        """
+        for key, (elapsed, calls, subintervals) in entries.items():
+            entry = self.entries.setdefault(key, [0.0, 0, 0])
+            entry[0] += elapsed
+            entry[1] += calls
+            entry[2] += subintervals
+
+    def report(self):
+        """Collect the counters, from the most expensive section.
+
+        Returns
+        -------
+        list(dict)
+            counters of each section
+        """
+        return [
+            dict(
+                zip(fields, key),
+                time=elapsed,
+                calls=calls,
+                subintervals=subintervals,
+            )
+            for key, (elapsed, calls, subintervals) in sorted(
+                self.entries.items(), key=lambda item: -item[1][0]
+            )
+        ]
+
+    def dump(self, path):
+        """Write the report on a JSON file.
+
+        Parameters
+        ----------
+        path : os.PathLike
+            output file
+        """
+        with open(path, "w", encoding="utf-8") as fd:
+            json.dump(self.report(), fd, indent=2)
+
+    def table(self):
+        """Render the report as a table.
+
+        Returns
+        -------
+        rich.table.Table
+            report table
+        """
+        import rich.table  # pylint: disable=import-outside-toplevel
+
+        table = rich.table.Table(title="Profile")
+        for field in fields:
+            table.add_column(field)
+        table.add_column("time [s]", justify="right")
+        table.add_column("calls", justify="right")
+        table.add_column("subintervals", justify="right")
+        for row in self.report():
+            table.add_row(
+                *("" if row[field] is None else str(row[field]) for field in fields),
+                f"{row['time']:.3f}",
+                str(row["calls"]),
+                str(row["subintervals"]),
+            )
+        return table
+
+
+@contextlib.contextmanager
+def activate(profile):
+    """Make a profile the active one.
+
+    Parameters
+    ----------
+    profile : Profile or None
+        profile to activate (if ``None``, profiling is disabled)
+    """
+    global current  # pylint: disable=global-statement
+    previous = current
+    current = profile
+    try:
+        yield profile
+    finally:
+        current = previous
+
+
+def span(*key):
+    """Time a section in the active profile, if any.
+
+    Parameters
+    ----------
+    key : tuple
+        section identifier, see :attr:`fields`
+    """
+    if current is None:
+        return contextlib.nullcontext()
+    return current.span(*key)
+
+
+def add_subintervals(count):
+    """Account integration subintervals in the active profile, if any."""
+    if current is not None:
+        current.add_subintervals(count)
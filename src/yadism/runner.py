@@ -12,28 +12,27 @@ There are two ways of using ``yadism``:
     decide about ``run_dis`` and document it properly in module header
 """
 
+import concurrent.futures
 import copy
 import inspect
 import io
 import logging
+import os
+import pathlib
 import time
 
 import numpy as np
-import rich
-import rich.align
-import rich.box
 import rich.console
-import rich.markdown
-import rich.panel
-import rich.progress
 from eko import basis_rotation as br
 from eko import matchings
 from eko.interpolation import InterpolatorDispatcher, XGrid
 from eko.quantities.heavy_quarks import MatchingScales
 
-from . import log, observable_name
+from . import cache, channels, checkpoint, log, observable_name, profiling, tracing
 from .coefficient_functions.coupling_constants import CouplingConstants
+from .esf import conv
 from .esf import scale_variations as sv
+from .esf.result import ESFResult, EXSResult
 from .input import compatibility
 from .output import Output
 from .sf import StructureFunction as SF
@@ -41,6 +40,35 @@ from .xs import CrossSection as XS
 
 logger = logging.getLogger(__name__)
 
+chunks_per_worker = 4
+"""Number of chunks scheduled on average on each worker process"""
+
+
+def default_workers():
+    """Default number of worker processes, see :meth:`Runner.get_result`.
+
+    It is read from the ``YADISM_WORKERS`` environment variable (if not set,
+    the points are computed serially).
+
+    Returns
+    -------
+    int
+        number of worker processes
+
+    Raises
+    ------
+    ValueError
+        if the variable is not a positive integer
+    """
+    value = os.environ.get("YADISM_WORKERS", "1")
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        raise ValueError(f"YADISM_WORKERS has to be a positive integer, got '{value}'")
+    return workers
+
 
 class Runner:
     """Wrapper to compute a process.
@@ -53,6 +81,33 @@ class Runner:
     observables : dict
         DIS parameters: process description, kinematic specification for the
         requested output.
+    cache_dir : os.PathLike or None
+        persistent cache folder (see :mod:`yadism.cache`), if not given
+        ``YADISM_CACHE_DIR`` is used (if set)
+    checkpoint_dir : os.PathLike or None
+        checkpoint folder (see :mod:`yadism.checkpoint`), if given the
+        computed points are periodically stored in it, and the points already
+        stored are not computed again
+    shard : tuple(int, int) or None
+        shard index and number of shards, if given only the points of the
+        shard are computed (see :func:`split_shards`)
+    profile : bool or None
+        profile the calculation (see :mod:`yadism.profiling`), reporting at
+        the end of :meth:`iter_results` (and so :meth:`get_result`); if not
+        given ``YADISM_PROFILE`` is used
+    trace : os.PathLike or None
+        path of the timeline of the calculation (see :mod:`yadism.tracing`),
+        written at the end of :meth:`get_result`; if not given
+        ``YADISM_TRACE_FILE`` is used (if set)
+    channels_dir : os.PathLike or None
+        folder of the unweighted partonic channels (see
+        :mod:`yadism.channels`), if given the convolutions are stored in it,
+        and the ones already stored (e.g. for different electroweak
+        parameters) are not computed again
+    channels_only : bool
+        only assemble the structure functions from the channels already
+        stored, raising an error if any is missing (see
+        :func:`yadism.channels.reweight`)
 
     Notes
     -----
@@ -64,24 +119,36 @@ class Runner:
         * detailed description of dis_observables entries
     """
 
-    banner = rich.align.Align(
-        rich.panel.Panel.fit(
-            inspect.cleandoc(r"""  __     __       _ _
-                     \ \   / /      | (_)
-                      \ \_/ /_ _  __| |_ ___ _ __ ___
-                       \   / _` |/ _` | / __| '_ ` _ \
-                        | | (_| | (_| | \__ \ | | | | |
-                        |_|\__,_|\__,_|_|___/_| |_| |_|
-                """),
-            rich.box.SQUARE,
-            padding=1,
-            style="magenta",
-        ),
-        "center",
-    )
-
-    def __init__(self, theory: dict, observables: dict):
+    def __init__(
+        self,
+        theory: dict,
+        observables: dict,
+        cache_dir=None,
+        checkpoint_dir=None,
+        shard=None,
+        profile=None,
+        trace=None,
+        channels_dir=None,
+        channels_only=False,
+    ):
         new_theory, new_observables = compatibility.update(theory, observables)
+        self.cache_dir = cache.resolve(cache_dir)
+        self.checkpoint_dir = checkpoint_dir
+        if shard is not None:
+            index, count = shard
+            if count < 1 or not 0 <= index < count:
+                raise ValueError(f"Invalid shard {index} of {count}")
+            shard = (index, count)
+        self.shard = shard
+        self.profile = profiling.enabled if profile is None else profile
+        self.profile_report = None
+        self.trace = tracing.trace_file if trace is None else trace
+        if channels_only and channels_dir is None:
+            raise ValueError("No channels folder to assemble the structure functions")
+        if channels_dir is not None:
+            channels_dir = pathlib.Path(channels_dir)
+        self.channels_dir = channels_dir
+        self.channels_only = channels_only
 
         # Store inputs
         self._theory = new_theory
@@ -105,6 +172,8 @@ class Runner:
             interpolator=interpolator,
             activate_ren=new_theory["RenScaleVar"],
             activate_fact=new_theory["FactScaleVar"],
+            # the operators do not depend on the couplings either
+            cache_dir=self.cache_dir if self.cache_dir is not None else channels_dir,
         )
 
         # Initialize structure functions
@@ -120,6 +189,18 @@ class Runner:
             ),
             coupling_constants=coupling_constants,
             sv_manager=sv_manager,
+            conv_cache=conv.ConvolutionCache(
+                interpolator, new_observables["convolution_engine"]
+            ),
+            channels=(
+                channels.Channels(
+                    channels_dir,
+                    channels.reference(self._theory, self._observables),
+                    strict=channels_only,
+                )
+                if channels_dir is not None
+                else None
+            ),
         )
         # pass theory params
         theory_params = dict(
@@ -136,6 +217,7 @@ class Runner:
             M2target=theory["MP"] ** 2,
             fonllparts=new_theory["FONLLParts"],
             n3lo_cf_variation=theory["n3lo_cf_variation"],
+            convolution_engine=new_observables["convolution_engine"],
         )
         logger.info(
             "PTO: %d, PTO@evolution: %d, process: %s",
@@ -145,6 +227,7 @@ class Runner:
         )
         self.configs = RunnerConfigs(theory=theory_params, managers=managers)
         logger.info("FNS: %s, NfFF: %d", theory["FNS"], theory["NfFF"])
+        logger.info("Convolution engine: %s", new_observables["convolution_engine"])
         logger.info(
             "projectile: %s, target: {Z: %g, A: %g}",
             new_observables["ProjectileDIS"],
@@ -197,7 +280,7 @@ class Runner:
                 obs.drop_cache()
 
     def replace_nans_with_0(self, out):
-        """Replace any NaNs in output with 0.0
+        """Replace any NaNs in output with 0.0, in place.
 
         The small-x (i.e. large eta) limit is not addressed in LeProHQ because
         the high energy limit of the polarized case is not known and that is the
@@ -207,15 +290,14 @@ class Runner:
         Note that the value of x where this plays a role is below the
         experimental regime and thus this does not affect the description of
         data, but only e.g. the grids used for the FIATLUX photon computation.
-        """
-
-        out2 = copy.deepcopy(out)
 
+        The results of :meth:`iter_results` (and so :meth:`get_result`) are
+        already sanitized.
+        """
         # Loop through each observable in the dictionary
-        for observable, points in out2.items():
+        for observable, points in out.items():
             # Skip the keys that are not an observable
             if not observable_name.ObservableName.is_valid(observable):
-                logger.critical("Some NaNs are encountered and set to zero!")
                 continue
 
             # Loop over the kinematic points
@@ -223,17 +305,184 @@ class Runner:
                 # If there is no point, skip it
                 if point is None:
                     continue
-                # Loop over each perturbative order
-                for values in point.orders.values():
-                    # `values` is a tuple containing the computed values and the integration error
-                    for tup in range(2):
-                        # Set any NaN or inf values in the array to 0
-                        values[tup][~np.isfinite(values[tup])] = 0.0
-        return out2
-
-    def get_result(self):
+                point.replace_nans()
+        return out
+
+    def q2_groups(self, observables):
+        """Group the kinematic points sharing the same Q2.
+
+        The groups of all the observables are sorted by Q2, such that the
+        structure functions sharing the same kinematics (e.g. the ones
+        entering cross sections or target mass corrections) are computed
+        once, while the cache is alive, and the cache is dropped only when Q2
+        changes (see :meth:`group_q2`).
+        At the same Q2, the cross sections come first, since they are
+        combining the raw structure functions, which might be requested as
+        well (and whose results are sanitized in place once yielded).
+
+        Parameters
+        ----------
+        observables : dict
+            observables to be computed
+
+        Returns
+        -------
+        list(tuple(str, list(int)))
+            observable name and indices of the points, in computation order
+        """
+        groups = []
+        for name, obs in observables.items():
+            by_q2 = {}
+            for idx, elem in enumerate(obs.elements):
+                by_q2.setdefault(elem.Q2, []).append(idx)
+            groups.extend(
+                ((Q2, not isinstance(obs, XS)), (name, indices))
+                for Q2, indices in by_q2.items()
+            )
+        return [group for _, group in sorted(groups, key=lambda item: item[0])]
+
+    def group_q2(self, group):
+        """Determine the Q2 of a group of points.
+
+        Parameters
+        ----------
+        group : tuple(str, list(int))
+            observable name and indices of the points (see :meth:`q2_groups`)
+
+        Returns
+        -------
+        float
+            Q2 shared by all the points
+        """
+        name, indices = group
+        return self.observables[name].elements[indices[0]].Q2
+
+    def plan(self):
+        """Collect the observables requested by the runcard.
+
+        Returns
+        -------
+        dict
+            requested observables, by name
+        """
+        return {
+            name: obs
+            for name, obs in self.observables.items()
+            if name in self._observables["observables"].keys()
+        }
+
+    def schedule(self):
+        """Select the points to be computed by this runner.
+
+        Returns
+        -------
+        list(tuple(str, list(int)))
+            Q2 groups (see :meth:`q2_groups`), restricted to the current
+            shard (if any)
+        """
+        groups = self.q2_groups(self.plan())
+        if self.shard is None:
+            return groups
+        index, count = self.shard
+        keys = [self.group_q2(group) for group in groups]
+        return split_shards(groups, count, keys)[index]
+
+    def iter_results(self, workers=None):
+        """Compute the requested kinematic points, one at a time.
+
+        The points available in the checkpoint, or in the persistent cache,
+        are yielded first, then the others as soon as they are computed, one
+        group at a time (i.e. the points of an observable sharing the same Q2,
+        see :meth:`q2_groups`).
+        The runner only holds the results sharing the current Q2, in order to
+        reuse them (e.g. in cross sections), so the memory used is bounded by
+        the points in flight.
+
+        Parameters
+        ----------
+        workers : int
+            number of worker processes (see :meth:`get_result`)
+
+        Yields
+        ------
+        tuple(str, int, ESFResult)
+            observable name, point index and result (any NaN replaced by 0,
+            with read-only arrays, see :meth:`ESFResult.copy`)
+        """
+        # keep any profile already active
+        profile = profiling.Profile() if self.profile else profiling.current
+        with profiling.activate(profile):
+            yield from self._iter_results(workers)
+        if self.profile:
+            self.profile_report = profile
+            profile.dump(profiling.report_file)
+            logger.info("Profile written to %s", profiling.report_file)
+
+    def _iter_results(self, workers):
+        """Compute the requested kinematic points, see :meth:`iter_results`."""
+        if workers is None:
+            workers = default_workers()
+        groups = self.schedule()
+        missing = {name: [False] * len(obs) for name, obs in self.plan().items()}
+        for name, indices in groups:
+            for idx in indices:
+                missing[name][idx] = True
+
+        store = None
+        if self.checkpoint_dir is not None:
+            store = checkpoint.Checkpoint(
+                self.checkpoint_dir,
+                # the code version is checked by the checkpoint itself
+                cache.key(self._theory, self._observables, self.shard, versioned=False),
+            )
+            for name, idx, res in store.load():
+                if name in missing and missing[name][idx]:
+                    missing[name][idx] = False
+                    yield name, idx, res.freeze()
+
+        for name, idx, res in self.load_results(groups):
+            if missing[name][idx]:
+                missing[name][idx] = False
+                yield name, idx, res.freeze()
+        # only compute what is missing
+        groups = [
+            (name, [idx for idx in indices if missing[name][idx]])
+            for name, indices in groups
+        ]
+        groups = [(name, indices) for name, indices in groups if len(indices) > 0]
+
+        if workers > 1:
+            computed = self._compute_parallel(groups, workers)
+        else:
+            computed = self._compute_serial(groups)
+        try:
+            for name, idx, res in computed:
+                res.replace_nans().freeze()
+                if self.cache_dir is not None:
+                    cache.save_arrays(
+                        self.cache_dir,
+                        "results",
+                        self.result_key(name, idx),
+                        res.get_arrays(),
+                    )
+                if store is not None:
+                    store.add(name, idx, res)
+                yield name, idx, res
+        finally:
+            if store is not None:
+                store.flush()
+
+    def get_result(self, workers=None):
         """Compute coefficient functions grid for requested kinematic points.
 
+        Parameters
+        ----------
+        workers : int
+            number of worker processes (if not given,
+            :func:`default_workers`, i.e. ``YADISM_WORKERS``); if more than
+            one, the points are distributed over a process pool, in chunks
+            preserving the Q2 groups (see :meth:`q2_groups`)
+
         Returns
         -------
         :obj:`Output`
@@ -241,17 +490,18 @@ class Runner:
             (flavour, interpolation-index) for each requested kinematic
             point (x, Q2)
         """
-        self.console.print(self.banner)
+        # pylint: disable=import-outside-toplevel
+        import rich.markdown
+        import rich.progress
+
+        self.console.print(banner())
 
         # precomputing the plan of calculation
-        precomputed_plan = {}
-        printable_plan = []
-        for name, obs in self.observables.items():
-            if name in self._observables["observables"].keys():
-                precomputed_plan[name] = obs
-                printable_plan.append(
-                    f"- {name} at {len(self._observables['observables'][name])} pts"
-                )
+        precomputed_plan = self.plan()
+        printable_plan = [
+            f"- {name} at {len(self._observables['observables'][name])} pts"
+            for name in precomputed_plan
+        ]
 
         self.console.print(rich.markdown.Markdown("## Plan"))
         self.console.print(rich.markdown.Markdown("\n".join(printable_plan)))
@@ -261,43 +511,327 @@ class Runner:
         self.console.print("yadism took off! please stay tuned ...")
         start = time.time()
 
-        with rich.progress.Progress(transient=True, console=self.console) as progress:
+        # keep any trace already active (the profile is activated by
+        # iter_results itself)
+        trace = tracing.Trace() if self.trace is not None else tracing.current
+        with (
+            tracing.activate(trace),
+            rich.progress.Progress(transient=True, console=self.console) as progress,
+        ):
             task = progress.add_task(
                 "Starting...",
-                total=sum(len(obs) for obs in precomputed_plan.values()),
+                total=sum(len(indices) for _, indices in self.schedule()),
             )
 
-            for name, obs in precomputed_plan.items():
-                # init slots
-                results = [None] * len(obs)
-                Q2 = None
-
-                # compute
-                for idx, elem in sorted(
-                    enumerate(obs.elements), key=lambda indexed: indexed[1].Q2
-                ):
-                    # if we're changing Q2, drop cache
-                    if Q2 is not None and Q2 != elem.Q2:
-                        self.drop_cache()
-                    Q2 = elem.Q2
-
-                    results[idx] = elem.get_result()
-                    progress.update(
-                        task,
-                        description=f"Computing [bold green]{name}",
-                        advance=1,
-                    )
-
-                self.drop_cache()
-                self._output[name] = results
+            results = {
+                name: [None] * len(obs) for name, obs in precomputed_plan.items()
+            }
+            for name, idx, res in self.iter_results(workers):
+                results[name][idx] = res
+                progress.update(
+                    task,
+                    description=f"Computing [bold green]{name}",
+                    advance=1,
+                )
+            self._output.update(results)
 
         end = time.time()
         diff = end - start
         self.console.print(f"[cyan]took {diff:.2f} s")
 
-        out = copy.deepcopy(self._output)
-        out = self.replace_nans_with_0(out)
-        return out
+        if self.profile:
+            self.console.print(self.profile_report.table())
+        if self.trace is not None:
+            trace.dump(self.trace)
+            logger.info("Trace written to %s", self.trace)
+
+        # the results are read-only, so they are shared and not copied (see
+        # Output.copy() for a mutable one)
+        return copy.copy(self._output)
+
+    def result_key(self, name, idx):
+        """Compute the persistent cache address of a kinematic point.
+
+        The address depends on the theory (up to its description), on the
+        observables settings (e.g. the interpolation), and on the point itself,
+        but not on the other points requested.
+
+        Parameters
+        ----------
+        name : str
+            observable name
+        idx : int
+            index of the kinematic point
+
+        Returns
+        -------
+        str
+            cache address, see :func:`yadism.cache.key`
+        """
+        theory = {k: v for k, v in self._theory.items() if k not in ["ID", "Comments"]}
+        settings = {k: v for k, v in self._observables.items() if k != "observables"}
+        kinematics = self._observables["observables"][name][idx]
+        return cache.key(theory, settings, name, kinematics)
+
+    def load_results(self, groups):
+        """Load the results available in the persistent cache.
+
+        Parameters
+        ----------
+        groups : list(tuple(str, list(int)))
+            points to be computed, grouped by Q2 (see :meth:`q2_groups`)
+
+        Yields
+        ------
+        tuple(str, int, ESFResult)
+            observable name, point index and result
+        """
+        if self.cache_dir is None:
+            return
+        for name, indices in groups:
+            for idx in indices:
+                arrays = cache.load_arrays(
+                    self.cache_dir, "results", self.result_key(name, idx)
+                )
+                if arrays is None:
+                    continue
+                Result = ESFResult if len(arrays["kinematics"]) == 2 else EXSResult
+                yield name, idx, Result.from_arrays(arrays)
+
+    def _compute_serial(self, groups):
+        """Compute the observables in the current process.
+
+        Parameters
+        ----------
+        groups : list(tuple(str, list(int)))
+            Q2 groups to be computed (see :meth:`q2_groups`)
+
+        Yields
+        ------
+        tuple(str, int, ESFResult)
+            observable name, point index and result
+        """
+        pending = []
+        current = None
+        for group in groups:
+            # we're changing Q2, drop cache
+            if self.group_q2(group) != current:
+                self.release(pending)
+                pending = []
+                current = self.group_q2(group)
+            name, indices = group
+            obs = self.observables[name]
+            results = []
+            # the results are handed out after the span is closed, so that the
+            # time spent by the consumer is not accounted to the observable
+            with tracing.span(name, "observable", points=len(indices)):
+                for idx in indices:
+                    elem = obs.elements[idx]
+                    with tracing.span(f"{name}[{idx}]", "point", x=elem.x, Q2=elem.Q2):
+                        results.append((name, idx, elem.get_result()))
+                    pending.append(elem)
+            yield from results
+        self.release(pending)
+
+    def release(self, elements):
+        """Release the results of a Q2 group, and drop the cache.
+
+        Besides the given elements, the results of all the structure functions
+        held by the cache are released (see :meth:`StructureFunction.drop_cache`).
+
+        Parameters
+        ----------
+        elements : list
+            computed elements of the group
+        """
+        with tracing.span("drop cache", "cache"):
+            for elem in elements:
+                elem.drop_result()
+            self.drop_cache()
+
+    def _compute_parallel(self, groups, workers):
+        """Compute the observables on a pool of worker processes.
+
+        Each worker rebuilds its own runner from the runcards, so no
+        coefficient function has to be transferred, and only the results are
+        sent back.
+
+        Parameters
+        ----------
+        groups : list(tuple(str, list(int)))
+            Q2 groups to be computed (see :meth:`q2_groups`)
+        workers : int
+            number of worker processes
+
+        Yields
+        ------
+        tuple(str, int, ESFResult)
+            observable name, point index and result, in completion order
+        """
+        # split in contiguous chunks, never breaking the groups sharing Q2
+        size = sum(len(indices) for _, indices in groups)
+        chunk_size = max(size // (workers * chunks_per_worker), 1)
+        chunks = [[]]
+        current = None
+        for group in groups:
+            if (
+                self.group_q2(group) != current
+                and sum(len(indices) for _, indices in chunks[-1]) >= chunk_size
+            ):
+                chunks.append([])
+            current = self.group_q2(group)
+            chunks[-1].append(group)
+
+        logger.info("Computing %d chunks on %d workers", len(chunks), workers)
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(
+                self._output.theory,
+                self._output.observables,
+                self.cache_dir,
+                self.channels_dir,
+                self.channels_only,
+            ),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _compute_chunk,
+                    chunk,
+                    profiling.current is not None,
+                    tracing.current is not None,
+                )
+                for chunk in chunks
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                results, entries, events = future.result()
+                if profiling.current is not None:
+                    profiling.current.merge(entries)
+                if tracing.current is not None:
+                    tracing.current.extend(events)
+                yield from results
+
+
+def banner():
+    """Render the banner, printed at the beginning of the calculation."""
+    # pylint: disable=import-outside-toplevel
+    import rich.align
+    import rich.box
+    import rich.panel
+
+    return rich.align.Align(
+        rich.panel.Panel.fit(
+            inspect.cleandoc(r"""  __     __       _ _
+                     \ \   / /      | (_)
+                      \ \_/ /_ _  __| |_ ___ _ __ ___
+                       \   / _` |/ _` | / __| '_ ` _ \
+                        | | (_| | (_| | \__ \ | | | | |
+                        |_|\__,_|\__,_|_|___/_| |_| |_|
+                """),
+            rich.box.SQUARE,
+            padding=1,
+            style="magenta",
+        ),
+        "center",
+    )
+
+
+def split_shards(groups, count, keys=None):
+    """Split the Q2 groups in shards of balanced cost.
+
+    The groups are assigned by decreasing cost to the least loaded shard
+    (*longest processing time* scheduling), where the cost is estimated as
+    the number of structure functions to be computed.
+    The split is deterministic, so it can be reproduced independently on
+    each node.
+
+    Parameters
+    ----------
+    groups : list(tuple(str, list(int)))
+        Q2 groups, see :meth:`Runner.q2_groups`
+    count : int
+        number of shards
+    keys : list or None
+        Q2 of each group (see :meth:`Runner.group_q2`), if given the
+        consecutive groups sharing it are assigned to the same shard, in
+        order to share their structure functions
+
+    Returns
+    -------
+    list(list(tuple(str, list(int))))
+        groups of each shard, in the original order
+    """
+
+    def cost(group):
+        name, indices = group
+        kind = observable_name.ObservableName(name).kind
+        # cross sections are combining F2, FL, and F3
+        return len(indices) * (3 if kind in observable_name.xs else 1)
+
+    units = []
+    for j in range(len(groups)):
+        if keys is None or j == 0 or keys[j] != keys[j - 1]:
+            units.append([])
+        units[-1].append(j)
+    costs = [sum(cost(groups[j]) for j in unit) for unit in units]
+
+    loads = [0] * count
+    assigned = [[] for _ in range(count)]
+    for u in sorted(range(len(units)), key=lambda u: (-costs[u], u)):
+        shard = min(range(count), key=lambda k: (loads[k], k))
+        loads[shard] += costs[u]
+        assigned[shard].extend(units[u])
+    return [[groups[j] for j in sorted(shard)] for shard in assigned]
+
+
+_worker_runner = None
+"""Runner of the current worker process"""
+
+
+def _init_worker(theory, observables, cache_dir, channels_dir, channels_only):
+    """Build the runner of a worker process."""
+    global _worker_runner  # pylint: disable=global-statement
+    log.silent_mode = True
+    _worker_runner = Runner(
+        theory,
+        observables,
+        cache_dir=cache_dir,
+        channels_dir=channels_dir,
+        channels_only=channels_only,
+    )
+
+
+def _compute_chunk(chunk, profile, trace):
+    """Compute a chunk of Q2 groups in a worker process.
+
+    Parameters
+    ----------
+    chunk : list(tuple(str, list(int)))
+        Q2 groups to be computed
+    profile : bool
+        whether to profile the calculation
+    trace : bool
+        whether to trace the calculation
+
+    Returns
+    -------
+    list(tuple(str, int, ESFResult))
+        computed results
+    dict
+        profile counters of the chunk (empty if not profiling)
+    list(dict)
+        trace events of the chunk (empty if not tracing)
+    """
+    prof = profiling.Profile()
+    tr = tracing.Trace()
+    with (
+        profiling.activate(prof if profile else None),
+        tracing.activate(tr if trace else None),
+    ):
+        results = list(
+            _worker_runner._compute_serial(chunk)  # pylint: disable=protected-access
+        )
+    return results, prof.entries, tr.events
 
 
 class RunnerConfigs:
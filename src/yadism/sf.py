@@ -34,6 +34,7 @@ class StructureFunction:
         self.runner = runner
         self.esfs = []
         self.cache = {}
+        self.loaded = {}
         logger.debug("Init %s", self)
 
     def __repr__(self):
@@ -55,6 +56,8 @@ class StructureFunction:
         # iterate F* configurations
         for kinematics in kinematic_configs:
             self.esfs.append(self.get_esf(self.obs_name, kinematics, use_raw=False))
+        # keep the requested points, to share them with other observables
+        self.loaded = dict(self.cache)
 
     def get_esf(self, obs_name, kinematics, *args, use_raw=True, force_local=False):
         """Return a :py:class:`EvaluatedStructureFunction` instance.
@@ -65,7 +68,10 @@ class StructureFunction:
         - heavy quark matching schemes to access their light counter parts
 
         It also implements an internal caching system, to speed up the integrals
-        in TMC.
+        in TMC, and to share the structure functions among observables (e.g.
+        cross sections).
+        The instances are identified by :math:`(x, Q^2)` (any other
+        kinematic variable is irrelevant), and whether TMC are applied.
 
         Parameters
         ----------
@@ -95,11 +101,8 @@ class StructureFunction:
         # else we're happy to cache
         # is it us or do we need to delegate?
         if obs_name == self.obs_name:
-            # convert to tuple
-            key = list(kinematics.values())
             use_tmc_if_available = not use_raw and self.runner.configs.TMC != 0
-            key.append(use_tmc_if_available)
-            key = tuple(key)
+            key = (kinematics["x"], kinematics["Q2"], use_tmc_if_available)
             # TODO how to incorporate args?
             # search
             try:
@@ -136,7 +139,14 @@ class StructureFunction:
     def drop_cache(self):
         """Drop temporary cache.
 
-        This preserves final results, since they are not part of the cache.
+        The results of all the instances held are released, including the
+        requested points, since they might have been computed for other
+        observables (e.g. cross sections) even when their own result is not
+        needed (e.g. because already stored).
+        The instances of the requested points are kept, in order to share them
+        with other observables.
 
         """
-        self.cache = {}
+        for obj in self.cache.values():
+            obj.drop_result()
+        self.cache = dict(self.loaded)
@@ -0,0 +1,134 @@
+"""Timeline of the calculation, in the Chrome trace event format.
+
+When a :class:`Trace` is active (see :func:`activate`), the instrumented
+sections of the calculation are recorded as nested spans:
+observable, kinematic point, kernel, order, and convolution, together with
+the scale variations operators and the target mass corrections.
+
+The spans of the worker processes are collected as well, and the timestamps
+are taken from the system clock, so they can be compared across processes.
+The dumped file can be loaded directly in ``chrome://tracing`` or in
+`Perfetto <https://ui.perfetto.dev>`_.
+
+If no trace is active, the instrumentation has no effect.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+
+trace_file = os.environ.get("YADISM_TRACE_FILE")
+"""Default path of the trace written by the runners, if any (see
+:class:`yadism.runner.Runner`)"""
+
+current = None
+"""Active trace, if any"""
+
+
+class Trace:
+    """Collection of trace events of a process."""
+
+    def __init__(self):
+        self.events = []
+
+    @contextlib.contextmanager
+    def span(self, name, cat, **args):
+        """Record a section.
+
+        Parameters
+        ----------
+        name : str
+            span name
+        cat : str
+            span category
+        args : dict
+            additional details, shown when selecting the span
+        """
+        ts = time.time_ns() / 1e3
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.events.append(
+                dict(
+                    name=name,
+                    cat=cat,
+                    ph="X",
+                    ts=ts,
+                    dur=(time.perf_counter_ns() - start) / 1e3,
+                    pid=os.getpid(),
+                    tid=threading.get_ident(),
+                    args=args,
+                )
+            )
+
+    def extend(self, events):
+        """Collect the events of another trace (e.g. of a worker process).
+
+        Parameters
+        ----------
+        events : list(dict)
+            :attr:`events` of the other trace
+        """
+        self.events.extend(events)
+
+    def dump(self, path):
+        """Write the trace on a JSON file.
+
+        Parameters
+        ----------
+        path : os.PathLike
+            output file
+        """
+        main = os.getpid()
+        pids = sorted({event["pid"] for event in self.events} | {main})
+        metadata = [
+            dict(
+                name="process_name",
+                ph="M",
+                pid=pid,
+                args=dict(name="runner" if pid == main else f"worker {pid}"),
+            )
+            for pid in pids
+        ]
+        with open(path, "w", encoding="utf-8") as fd:
+            json.dump(
+                dict(traceEvents=metadata + self.events, displayTimeUnit="ms"), fd
+            )
+
+
+@contextlib.contextmanager
+def activate(trace):
+    """Make a trace the active one.
+
+    Parameters
+    ----------
+    trace : Trace or None
+        trace to activate (if ``None``, tracing is disabled)
+    """
+    global current  # pylint: disable=global-statement
+    previous = current
+    current = trace
+    try:
+        yield trace
+    finally:
+        current = previous
+
+
+def span(name, cat, **args):
+    """Record a section in the active trace, if any.
+
+    Parameters
+    ----------
+    name : str
+        span name
+    cat : str
+        span category
+    args : dict
+        additional details
+    """
+    if current is None:
+        return contextlib.nullcontext()
+    return current.span(name, cat, **args)
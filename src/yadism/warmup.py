@@ -0,0 +1,193 @@
+"""Ahead-of-time compilation of the numba kernels.
+
+The kernels (coefficient functions, splitting functions, target mass
+corrections, ...) are compiled with explicit signatures, i.e. when their
+module is first imported, and stored in the numba cache.
+If the cache is empty (e.g. in a fresh container) or not writable (e.g. in a
+read-only installation), every process compiles them again.
+
+:func:`warmup` imports all the modules defining kernels, in parallel
+processes, storing the compiled kernels in a given cache folder, and reports
+the kernels which could not be cached (including the ones without an explicit
+signature, which would only be compiled on their first call).
+The folder should then be exported as ``NUMBA_CACHE_DIR`` in the environment
+of the actual runs.
+"""
+
+import argparse
+import concurrent.futures
+import importlib
+import multiprocessing
+import os
+import pathlib
+import re
+import sys
+import warnings
+
+kernel_pattern = re.compile(
+    r"^\s*@(nb|numba)\.njit\(.*cache=True|(nb|numba)\.cfunc\(", re.MULTILINE
+)
+"""Decorator of the cached kernels (and of the compiled integrands)"""
+
+
+def kernel_modules():
+    """List the modules defining cached kernels.
+
+    The modules are found scanning the sources, in order not to compile
+    anything in the current process.
+
+    Returns
+    -------
+    list(str)
+        absolute modules names
+    """
+    root = pathlib.Path(__file__).parent
+    modules = []
+    for path in sorted(root.rglob("*.py")):
+        if kernel_pattern.search(path.read_text(encoding="utf-8")) is None:
+            continue
+        parts = path.relative_to(root.parent).with_suffix("").parts
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        modules.append(".".join(parts))
+    return modules
+
+
+def _init_worker(cache_dir):
+    """Set the numba cache folder, before numba is imported."""
+    if cache_dir is not None:
+        os.environ["NUMBA_CACHE_DIR"] = str(cache_dir)
+
+
+def _compile(module):
+    """Compile the kernels of a module, in a worker process.
+
+    Parameters
+    ----------
+    module : str
+        absolute module name
+
+    Returns
+    -------
+    list(str)
+        kernels loaded from the cache
+    list(str)
+        kernels compiled and stored in the cache
+    list(tuple(str, str))
+        kernels (or module) which could not be cached, and reason
+    """
+    # pylint: disable=import-outside-toplevel,protected-access
+    import numba
+    import numba.core.ccallback
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", numba.NumbaWarning)
+        try:
+            mod = importlib.import_module(module)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            return [], [], [(module, f"{type(err).__name__}: {err}")]
+    messages = [str(w.message) for w in caught]
+
+    loaded, compiled, failed = [], [], []
+    for obj in vars(mod).values():
+        if isinstance(obj, numba.core.dispatcher.Dispatcher):
+            py_func, targetctx = obj.py_func, obj.targetctx
+            # keyed by the signatures as given to the decorator
+            hits, misses = obj.stats.cache_hits, obj.stats.cache_misses
+        elif isinstance(obj, numba.core.ccallback.CFunc):
+            py_func, targetctx = obj.__wrapped__, obj._targetdescr.target_context
+            hits = [obj._sig] * obj.cache_hits
+            misses = [obj._sig] if obj.cache_hits == 0 else []
+        else:
+            continue
+        if py_func.__module__ != module:
+            continue
+        name = f"{module}.{py_func.__qualname__}"
+        cache = obj._cache
+        if not isinstance(cache, numba.core.caching.FunctionCache):
+            failed.append((name, "caching not enabled"))
+        elif len(hits) + len(misses) == 0:
+            # compiled lazily, on the first call of the actual run
+            failed.append((name, "no explicit signature"))
+        elif any(cache.load_overload(sig, targetctx) is None for sig in misses):
+            reasons = [m for m in messages if py_func.__name__ in m]
+            failed.append((name, "; ".join(reasons) or "not stored"))
+        elif len(misses) == 0 and len(hits) > 0:
+            loaded.append(name)
+        else:
+            compiled.append(name)
+    return loaded, compiled, failed
+
+
+def warmup(cache_dir=None, modules=None, workers=None):
+    """Compile all the kernels, storing them in the cache.
+
+    Parameters
+    ----------
+    cache_dir : os.PathLike or None
+        numba cache folder, if not given ``NUMBA_CACHE_DIR`` is used (if set),
+        otherwise the numba default (i.e. next to the sources)
+    modules : list(str) or None
+        modules to compile, if not given all of them (see
+        :func:`kernel_modules`)
+    workers : int or None
+        number of worker processes, if not given as many as the processors
+
+    Returns
+    -------
+    dict
+        kernels ``"loaded"`` from the cache, ``"compiled"``, and ``"failed"``
+        (with the reason)
+
+    Raises
+    ------
+    ValueError
+        if the compilation is disabled with ``NUMBA_DISABLE_JIT``
+    """
+    if os.environ.get("NUMBA_DISABLE_JIT", "0") not in ("", "0"):
+        raise ValueError("JIT compilation is disabled by NUMBA_DISABLE_JIT")
+    if modules is None:
+        modules = kernel_modules()
+    if cache_dir is None:
+        cache_dir = os.environ.get("NUMBA_CACHE_DIR")
+    if cache_dir is not None:
+        pathlib.Path(cache_dir).mkdir(parents=True, exist_ok=True)
+
+    report = dict(loaded=[], compiled=[], failed={})
+    # fresh processes, since numba reads its configuration once imported
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(cache_dir,),
+    ) as executor:
+        for loaded, compiled, failed in executor.map(_compile, modules):
+            report["loaded"].extend(loaded)
+            report["compiled"].extend(compiled)
+            report["failed"].update(failed)
+    return report
+
+
+def main(argv=None):
+    """Command line interface, exiting with a non-zero status on failures."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", help="modules (default: all)")
+    parser.add_argument(
+        "--cache-dir", type=pathlib.Path, help="numba cache folder (NUMBA_CACHE_DIR)"
+    )
+    parser.add_argument("--workers", type=int, help="number of worker processes")
+    args = parser.parse_args(argv)
+
+    report = warmup(args.cache_dir, args.modules or None, args.workers)
+    for name, reason in sorted(report["failed"].items()):
+        print(f"FAILED {name}: {reason}", file=sys.stderr)
+    print(
+        f"{len(report['compiled'])} kernels compiled, "
+        f"{len(report['loaded'])} already cached, "
+        f"{len(report['failed'])} failed"
+    )
+    return 1 if len(report["failed"]) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
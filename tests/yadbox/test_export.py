@@ -1,11 +1,14 @@
 import copy
 import pathlib
+import subprocess
+import sys
 
 import numpy as np
 import pineappl
+from banana import toy
 from banana.data.theories import default_card as theory_card
 
-from yadbox.export import dump_pineappl_to_file
+from yadbox.export import dump_pineappl_to_file, dump_pineappl_to_folder
 from yadism import run_yadism
 from yadmark.data.observables import default_card as obs_card
 
@@ -62,3 +65,42 @@ def test_pineappl_pol(tmp_path: pathlib.Path):
     dump_pineappl_to_file(out, pl, "F2_total")
     f = pineappl.grid.Grid.read(pl)
     assert not f.convolutions[0].convolution_types.polarized
+
+
+def test_pineappl_folder(tmp_path: pathlib.Path):
+    oo = copy.deepcopy(obs_card)
+    oo["observables"] = {
+        "F2_light": [{"x": 0.1, "Q2": 10.0}, {"x": 0.2, "Q2": 20.0}],
+        "XSCHORUSCC": [{"x": 0.1, "Q2": 10.0, "y": 0.3}],
+    }
+    out = run_yadism(theory_card, oo)
+    paths = dump_pineappl_to_folder(out, tmp_path / "grids", workers=2)
+    assert sorted(paths) == ["F2_light", "XSCHORUSCC"]
+    for obsname, path in paths.items():
+        single = tmp_path / f"{obsname}.pineappl.lz4"
+        dump_pineappl_to_file(out, single, obsname)
+        g = pineappl.grid.Grid.read(path)
+        ref = pineappl.grid.Grid.read(single)
+        assert g.bin_dimensions() == ref.bin_dimensions()
+        np.testing.assert_allclose(g.bin_limits(), ref.bin_limits())
+        assert g.metadata == ref.metadata
+        # same subgrids, in the same bins
+        pdf = toy.mkPDF("", 0)
+        predictions = [
+            grid.convolve(grid.convolutions, [pdf.xfxQ2], lambda _q2: 0.118)
+            for grid in [g, ref]
+        ]
+        assert np.all(predictions[1] != 0.0)
+        np.testing.assert_allclose(predictions[0], predictions[1], rtol=1e-14)
+
+
+def test_lazy_imports():
+    code = (
+        "import sys, yadbox.export; "
+        "print(*[m for m in ['eko', 'numba', 'pandas', 'yadism.runner']"
+        " if m in sys.modules])"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    assert out.stdout.strip() == ""
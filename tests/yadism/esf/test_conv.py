@@ -2,10 +2,16 @@
 Test the DistributionVec class and its methods.
 """
 
+import os
+import subprocess
+import sys
+
+import numba as nb
 import numpy as np
 import pytest
-from eko.interpolation import InterpolatorDispatcher, XGrid
+from eko.interpolation import InterpolatorDispatcher, XGrid, make_grid
 
+from yadism.coefficient_functions.partonic_channel import RSL
 from yadism.esf import conv
 
 
@@ -185,3 +191,333 @@ class TestConvnd:
         for x in np.exp([-2.0, -1.5, -1.0, -0.5, 0.0]):
             assert dvec0.convolution(x, f) == (0, 0)
             assert dvec1.convolution(x, f) == (0, 0)
+
+
+class TestConvolveVector:
+    interpolator = InterpolatorDispatcher(
+        XGrid(np.geomspace(1e-3, 1.0, 10), True), 3, mode_N=False
+    )
+
+    def test_basis_matrix(self):
+        xs = np.geomspace(1e-3, 1.0, 17)
+        lin_interpolator = InterpolatorDispatcher(
+            XGrid(np.linspace(1e-2, 1.0, 8), False), 2, mode_N=False
+        )
+        for interpolator in [self.interpolator, lin_interpolator]:
+            mat = conv.basis_matrix(interpolator, xs)
+            for bf, row in zip(interpolator, mat):
+                np.testing.assert_allclose(row, [bf(x) for x in xs], atol=1e-12)
+        # cached
+        assert conv.area_coefficients(self.interpolator) is conv.area_coefficients(
+            self.interpolator
+        )
+
+    def test_fixed_segments(self):
+        x = 0.02
+        edges = conv.fixed_segments(x, self.interpolator.xgrid.raw)
+        np.testing.assert_allclose(edges[0], x * (1 + conv.eps_integration_border))
+        np.testing.assert_allclose(edges[-1], 1 - conv.eps_integration_border)
+        assert np.all(np.diff(edges) > 0)
+        # the images of all the grid points are included
+        breakpoints = x / self.interpolator.xgrid.raw
+        for bp in breakpoints[(breakpoints > edges[0]) & (breakpoints < edges[-1])]:
+            assert bp in edges
+        # graded towards both ends
+        ratio = conv.fixed_max_ratio * (1 + 1e-12)
+        assert np.all(edges[1:] / edges[:-1] <= ratio)
+        assert np.all((1 - edges[:-1]) / (1 - edges[1:]) <= ratio)
+
+    def test_subtracted_powers(self):
+        lin_interpolator = InterpolatorDispatcher(
+            XGrid(np.linspace(1e-2, 1.0, 8), False), 2, mode_N=False
+        )
+        x = 0.02
+        for interpolator in [self.interpolator, lin_interpolator]:
+            powers = np.arange(interpolator.polynomial_degree + 1)[:, np.newaxis]
+            u_at_x = np.log(x) if interpolator.log else x
+            # away from 1, as the plain difference
+            z = np.linspace(0.1, 0.9, 5)
+            u = np.log(x / z) if interpolator.log else x / z
+            np.testing.assert_allclose(
+                conv.subtracted_powers(interpolator, x, z),
+                u**powers / z - u_at_x**powers,
+                rtol=1e-12,
+            )
+            # close to 1, as the first order expansion (the plain difference
+            # would be dominated by roundoff)
+            z = np.array([1.0 - 1e-12])
+            d = 1.0 - z[0]
+            if interpolator.log:
+                expected = d * (powers * u_at_x ** (powers - 1.0) + u_at_x**powers)
+            else:
+                expected = d * (powers + 1) * u_at_x**powers
+            np.testing.assert_allclose(
+                conv.subtracted_powers(interpolator, x, z),
+                expected,
+                rtol=1e-6,
+            )
+
+    def test_fixed_against_quad(self):
+        from yadism.coefficient_functions.light import nlo, nnlo
+
+        rsls = [
+            RSL(nlo.f2.gluon_reg, args=[3]),
+            RSL.from_distr_coeffs(
+                nlo.f2.ns_reg, (nlo.f2.ns_delta, nlo.f2.ns_omx, nlo.f2.ns_logomx)
+            ),
+            RSL.from_delta(1.0),
+            # up to log(1-z)^3/(1-z)
+            RSL(nnlo.xc2ns2p.c2nn2a, nnlo.xc2ns2p.c2ns2b, nnlo.xc2ns2p.c2nn2c, [4]),
+        ]
+        for rsl in rsls:
+            for x in [1e-3, 0.0215, 0.1, 0.5, 1.0]:
+                quad, _ = conv.convolve_vector(rsl, self.interpolator, x)
+                fixed, fixed_err = conv.convolve_vector(
+                    rsl, self.interpolator, x, engine="fixed"
+                )
+                # the accuracy is relative to the largest convolution
+                atol = 1e-6 * max(np.abs(quad).max(), 1e-4)
+                np.testing.assert_allclose(fixed, quad, rtol=1e-6, atol=atol)
+                assert np.all(fixed_err >= 0.0)
+
+    def test_moments_against_quad(self):
+        from yadism.coefficient_functions.light import nlo
+
+        rsls = [
+            RSL(nlo.f2.gluon_reg, args=[3]),
+            RSL.from_distr_coeffs(
+                nlo.f2.ns_reg, (nlo.f2.ns_delta, nlo.f2.ns_omx, nlo.f2.ns_logomx)
+            ),
+        ]
+        lin_interpolator = InterpolatorDispatcher(
+            XGrid(np.linspace(1e-2, 1.0, 8), False), 2, mode_N=False
+        )
+        for interpolator in [self.interpolator, lin_interpolator]:
+            # including a grid point
+            for x in [2e-2, 0.1, interpolator.xgrid.raw[4], 0.5]:
+                for rsl in rsls:
+                    quad, _ = conv.convolve_vector(rsl, interpolator, x)
+                    moments, moments_err = conv.convolve_vector(
+                        rsl, interpolator, x, engine="moments"
+                    )
+                    np.testing.assert_allclose(moments, quad, rtol=1e-6, atol=1e-10)
+                    assert np.all(moments_err >= 0.0)
+
+    def test_moments_log_singular(self):
+        from yadism.coefficient_functions.light import nnlo
+        from yadism.coefficient_functions.splitting_functions import lo
+        from yadism.coefficient_functions.splitting_functions import nlo as sf_nlo
+
+        # plus distributions up to log(1-z)^3/(1-z), with local parts
+        rsls = [
+            lo.pqq(4),
+            sf_nlo.pgg0(4),
+            RSL(nnlo.xc2ns2p.c2nn2a, nnlo.xc2ns2p.c2ns2b, nnlo.xc2ns2p.c2nn2c, [4]),
+        ]
+        lin_interpolator = InterpolatorDispatcher(
+            XGrid(np.linspace(1e-2, 1.0, 8), False), 2, mode_N=False
+        )
+        for interpolator in [self.interpolator, lin_interpolator]:
+            for x in [2e-2, 0.1, interpolator.xgrid.raw[4], 0.5, 0.9]:
+                for rsl in rsls:
+                    assert rsl.sing is not None and rsl.loc is not None
+                    quad, _ = conv.convolve_vector(rsl, interpolator, x)
+                    moments, _ = conv.convolve_vector(
+                        rsl, interpolator, x, engine="moments"
+                    )
+                    np.testing.assert_allclose(moments, quad, rtol=1e-6, atol=1e-8)
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError):
+            conv.convolve_vector(RSL.from_delta(1.0), self.interpolator, 0.1, "void")
+
+
+class TestCompiledIntegrand:
+    interpolator = InterpolatorDispatcher(
+        XGrid(np.geomspace(1e-3, 1.0, 10), True), 3, mode_N=False
+    )
+
+    def test_is_compiled(self):
+        from yadism.coefficient_functions.light import nlo
+
+        assert conv.is_compiled(RSL.from_delta(1.0))
+        assert not conv.is_compiled(RSL(lambda z, _args: z))
+        assert conv.is_compiled(RSL(nlo.f2.gluon_reg)) is not nb.config.DISABLE_JIT
+
+    def test_args(self):
+        areas = np.arange(12.0).reshape(2, 6)
+        args = conv.quad_ker_cfunc_args(
+            0.1, 0.5, True, areas, None, np.array([3.0]), None, np.ones(2)
+        )
+        assert args[:7] == (0.1, 0.5, 1.0, 0.0, 0.0, 2, 6)
+        np.testing.assert_allclose(args[7:19], areas.flatten())
+        assert args[19:] == (1, 3.0, 1.0, 1.0)
+
+    def test_against_python(self, tmp_path):
+        # the test suite disables numba, so compile in a separate process
+        code = """
+import itertools
+
+import numpy as np
+from eko.interpolation import InterpolatorDispatcher, XGrid
+from yadism.coefficient_functions.light import nlo
+from yadism.coefficient_functions.partonic_channel import RSL
+from yadism.coefficient_functions.splitting_functions import lo
+from yadism.esf import conv
+
+is_compiled = conv.is_compiled
+for log in [True, False]:
+    interpolator = InterpolatorDispatcher(
+        XGrid(np.geomspace(1e-3, 1.0, 10), log), 3, mode_N=False
+    )
+    for rsl in [
+        RSL.from_distr_coeffs(
+            nlo.f2.ns_reg, (nlo.f2.ns_delta, nlo.f2.ns_omx, nlo.f2.ns_logomx)
+        ),
+        RSL(nlo.f2.gluon_reg),
+        lo.pqq(4),
+    ]:
+        assert is_compiled(rsl)
+        for x, engine in itertools.product([1e-3, 0.1, 0.5], conv.engines):
+            conv.is_compiled = is_compiled
+            compiled = conv.convolve_vector(rsl, interpolator, x, engine)
+            conv.is_compiled = lambda _rsl: False
+            python = conv.convolve_vector(rsl, interpolator, x, engine)
+            np.testing.assert_allclose(compiled, python, rtol=1e-12, atol=1e-14)
+"""
+        env = dict(os.environ, NUMBA_DISABLE_JIT="0", NUMBA_CACHE_DIR=str(tmp_path))
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+        # the integrands are cached, as the kernels
+        assert len(list(tmp_path.rglob("conv._quad_ker-*.nbi"))) == 1
+        assert len(list(tmp_path.rglob("conv._kernel_on_nodes-*.nbi"))) == 1
+
+    @pytest.mark.parametrize("engine", conv.engines)
+    def test_not_finite(self, tmp_path, engine):
+        code = f"""
+import numba as nb
+import numpy as np
+import pytest
+from eko.interpolation import InterpolatorDispatcher, XGrid
+from yadism.coefficient_functions.partonic_channel import RSL
+from yadism.esf import conv
+
+interpolator = InterpolatorDispatcher(
+    XGrid(np.geomspace(1e-3, 1.0, 10), True), 3, mode_N=False
+)
+# the kernel fails in part of the domain
+broken = nb.njit(conv.kernel_signature)(lambda z, _args: np.log(0.5 - z))
+with pytest.raises(FloatingPointError, match="reg=<lambda>"):
+    conv.convolve_vector(RSL(broken), interpolator, 0.1, "{engine}")
+"""
+        env = dict(os.environ, NUMBA_DISABLE_JIT="0", NUMBA_CACHE_DIR=str(tmp_path))
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+class TestConvolutionCache:
+    interpolator = InterpolatorDispatcher(
+        XGrid(np.geomspace(1e-3, 1.0, 10), True), 3, mode_N=False
+    )
+
+    def test_convolve(self):
+        from yadism.coefficient_functions.light import nlo
+
+        cache = conv.ConvolutionCache(self.interpolator)
+        rsl = RSL(nlo.f2.gluon_reg, args=[3])
+        ls, els = cache.convolve(rsl, 0.1, 3, 1)
+        np.testing.assert_allclose(
+            ls, conv.convolve_vector(rsl, self.interpolator, 0.1)[0]
+        )
+        assert not ls.flags.writeable
+        assert not els.flags.writeable
+        # a new, but equivalent, kernel is reused
+        assert cache.convolve(RSL(nlo.f2.gluon_reg, args=[3]), 0.1, 3, 1)[0] is ls
+        assert len(cache) == 1
+        # anything else is recomputed
+        cache.convolve(RSL(nlo.f2.gluon_reg, args=[4]), 0.1, 3, 1)
+        cache.convolve(rsl, 0.2, 3, 1)
+        cache.convolve(rsl, 0.1, 4, 1)
+        cache.convolve(rsl, 0.1, 3, 2)
+        assert len(cache) == 5
+
+    def test_max_size(self):
+        from yadism.coefficient_functions.light import nlo
+
+        cache = conv.ConvolutionCache(self.interpolator, max_size=2)
+        rsl = RSL(nlo.f2.gluon_reg, args=[3])
+        first = cache.convolve(rsl, 0.1, 3, 1)[0]
+        cache.convolve(rsl, 0.2, 3, 1)
+        # reusing the first makes the second the least recently used
+        assert cache.convolve(rsl, 0.1, 3, 1)[0] is first
+        cache.convolve(rsl, 0.3, 3, 1)
+        assert len(cache) == 2
+        assert cache.convolve(rsl, 0.1, 3, 1)[0] is first
+        assert cache.key(rsl, 0.2, 3, 1) not in cache.cache
+
+
+class TestConvolveOperator:
+    interpolator = InterpolatorDispatcher(
+        XGrid(np.geomspace(1e-3, 1.0, 12), True), 3, mode_N=False
+    )
+
+    def test_shift_invariant_basis(self):
+        shifted = conv.shift_invariant_basis(self.interpolator)
+        # the boundary basis functions are different, the bulk is not
+        assert not shifted[0] and not shifted[-1]
+        assert shifted[len(shifted) // 2]
+        # non uniform, or linear, grids are never detected
+        for interpolator in [
+            InterpolatorDispatcher(
+                XGrid(np.geomspace(1e-3, 1.0, 12) ** np.linspace(1.0, 1.1, 12), True),
+                3,
+                mode_N=False,
+            ),
+            InterpolatorDispatcher(
+                XGrid(np.linspace(1e-2, 1.0, 12), False), 3, mode_N=False
+            ),
+        ]:
+            assert conv.shift_invariant_basis(interpolator) is None
+
+    @staticmethod
+    def kernels():
+        from yadism.coefficient_functions.light import nlo
+        from yadism.coefficient_functions.splitting_functions import lo
+        from yadism.coefficient_functions.splitting_functions import nlo as sf_nlo
+
+        return [
+            RSL.from_distr_coeffs(
+                nlo.f2.ns_reg, (nlo.f2.ns_delta, nlo.f2.ns_omx, nlo.f2.ns_logomx)
+            ),
+            # the scale variations kernels, whose local part does not cancel
+            # the dependence on x
+            lo.pqq(4),
+            sf_nlo.pqq0_2(4),
+            sf_nlo.pgg0(4),
+        ]
+
+    def test_against_brute_force(self, monkeypatch):
+        for rsl in self.kernels():
+            bands, bands_err = conv.convolve_operator(rsl, self.interpolator)
+            with monkeypatch.context() as m:
+                m.setattr(conv, "shift_invariant_basis", lambda _interp: None)
+                brute, brute_err = conv.convolve_operator(rsl, self.interpolator)
+            np.testing.assert_allclose(bands, brute, rtol=1e-8, atol=1e-10)
+            # error estimates are only comparable in size
+            np.testing.assert_allclose(bands_err, brute_err, atol=1e-6)
+
+    def test_mixed_grid(self, monkeypatch):
+        # logarithmic at small x, linear at large x
+        interpolator = InterpolatorDispatcher(
+            XGrid(make_grid(10, 5), True), 3, mode_N=False
+        )
+        first, last, _step = conv.uniform_section(interpolator)
+        assert (first, last) == (0, 9)
+        shifted = conv.shift_invariant_basis(interpolator)
+        # only the bulk of the logarithmic section is detected
+        assert shifted[4:7].all()
+        assert not shifted[last:].any()
+        for rsl in self.kernels():
+            bands, _ = conv.convolve_operator(rsl, interpolator)
+            with monkeypatch.context() as m:
+                m.setattr(conv, "shift_invariant_basis", lambda _interp: None)
+                brute, _ = conv.convolve_operator(rsl, interpolator)
+            np.testing.assert_allclose(bands, brute, rtol=1e-8, atol=1e-10)
@@ -54,6 +54,37 @@ class TestESFResult:
             for k in [0, 1]:
                 assert pytest.approx(aa[k]) == bb[k]
 
+    def test_get_arrays(self):
+        orders = {
+            lo: tuple(np.random.rand(2, 2, 2)),
+            (1, 0, 1, 0): tuple(np.random.rand(2, 2, 2)),
+        }
+        for nf in [4, None]:
+            ra = ESFResult(0.5, 10, nf, orders)
+            rb = ESFResult.from_arrays(ra.get_arrays())
+            assert (rb.x, rb.Q2, rb.nf) == (ra.x, ra.Q2, ra.nf)
+            assert list(rb.orders.keys()) == list(ra.orders.keys())
+            for aa, bb in zip(ra.orders.values(), rb.orders.values()):
+                for k in [0, 1]:
+                    np.testing.assert_allclose(aa[k], bb[k])
+
+    def test_freeze_copy(self):
+        v, e = np.random.rand(2, 2, 2)
+        v[0, 0] = np.nan
+        e[1, 1] = np.inf
+        r = ESFResult(0.1, 10, 5, {lo: (v, e)}).replace_nans().freeze()
+        assert r.orders[lo][0][0, 0] == 0.0
+        assert r.orders[lo][1][1, 1] == 0.0
+        with pytest.raises(ValueError):
+            r.orders[lo][0][0, 0] = 1.0
+        rc = r.copy()
+        assert (rc.x, rc.Q2, rc.nf) == (r.x, r.Q2, r.nf)
+        rc.orders[lo][0][0, 0] = 1.0
+        assert r.orders[lo][0][0, 0] == 0.0
+        rx = EXSResult(0.1, 10, 0.3, 5, {lo: (v, e)}).freeze().copy()
+        assert isinstance(rx, EXSResult)
+        assert rx.y == 0.3
+
     def test_mul(self):
         v, e = np.random.rand(2, 2, 2)
         r = ESFResult(**dict(x=0.1, Q2=10, orders={lo: (v, e)}, nf=5))
@@ -161,3 +192,9 @@ class TestEXSResult:
         rr = EXSResult.from_document(r.get_raw())
         assert len(list(rr.orders.values())[0]) == len(d["orders"][0]["values"])
         assert rr.y == 0.123
+
+    def test_get_arrays(self):
+        r = EXSResult(0.5, 10, 0.123, 3, {lo: tuple(np.random.rand(2, 2, 2))})
+        rr = EXSResult.from_arrays(r.get_arrays())
+        assert (rr.x, rr.Q2, rr.y, rr.nf) == (r.x, r.Q2, r.y, r.nf)
+        np.testing.assert_allclose(rr.orders[lo][0], r.orders[lo][0])
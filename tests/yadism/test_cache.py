@@ -0,0 +1,121 @@
+"""Test the persistent cache."""
+
+import numpy as np
+from eko.interpolation import InterpolatorDispatcher, XGrid
+
+import yadism
+from yadism import cache, version
+from yadism.esf import conv
+from yadism.esf import scale_variations as sv
+
+from .utils import assert_same_results, plain_output, record_compute_groups, runcards
+
+
+def test_key():
+    assert cache.key("a", 1, np.arange(3)) == cache.key("a", 1, [0, 1, 2])
+    assert cache.key("a", 1) != cache.key("a", 2)
+    assert cache.key({"b": 1, "c": 2}) == cache.key({"c": 2, "b": 1})
+
+
+def test_code_version(monkeypatch):
+    current = cache.key("a")
+    cache.code_version.cache_clear()
+    monkeypatch.setattr(version, "__version__", "1.2.3")
+    try:
+        assert cache.code_version() == "1.2.3"
+        assert cache.key("a") != current
+    finally:
+        cache.code_version.cache_clear()
+    # checkouts are identified by their sources
+    monkeypatch.setattr(version, "__version__", cache.placeholder_version)
+    assert len(cache.code_version()) == 64
+    assert cache.key("a") == current
+
+
+def test_resolve(tmp_path, monkeypatch):
+    assert cache.resolve(tmp_path) == tmp_path
+    monkeypatch.setattr(cache, "default_cache_dir", None)
+    assert cache.resolve() is None
+    monkeypatch.setattr(cache, "default_cache_dir", str(tmp_path))
+    assert cache.resolve() == tmp_path
+
+
+def test_load_save(tmp_path):
+    digest = cache.key("test")
+    assert cache.load(tmp_path, "arrays", digest) is None
+    array = np.random.rand(3, 4)
+    cache.save(tmp_path, "arrays", digest, array)
+    np.testing.assert_allclose(cache.load(tmp_path, "arrays", digest), array)
+    # no leftovers
+    assert len(list((tmp_path / "arrays").iterdir())) == 1
+    # corrupted entries are ignored
+    (tmp_path / "arrays" / f"{digest}.npy").write_bytes(b"void")
+    assert cache.load(tmp_path, "arrays", digest) is None
+    # disabled cache
+    cache.save(None, "arrays", digest, array)
+    assert cache.load(None, "arrays", digest) is None
+
+
+def test_load_save_arrays(tmp_path):
+    digest = cache.key("test")
+    assert cache.load_arrays(tmp_path, "collections", digest) is None
+    arrays = dict(a=np.random.rand(3, 4), b=np.arange(2))
+    cache.save_arrays(tmp_path, "collections", digest, arrays)
+    loaded = cache.load_arrays(tmp_path, "collections", digest)
+    assert loaded.keys() == arrays.keys()
+    for name, array in arrays.items():
+        np.testing.assert_allclose(loaded[name], array)
+    # corrupted entries are ignored
+    (tmp_path / "collections" / f"{digest}.npz").write_bytes(b"void")
+    assert cache.load_arrays(tmp_path, "collections", digest) is None
+
+
+def test_scale_variations_operators(tmp_path, monkeypatch):
+    interpolator = InterpolatorDispatcher(
+        XGrid(np.linspace(0.2, 1.0, 5), False), 1, False
+    )
+    first = sv.ScaleVariations(1, interpolator, True, True, cache_dir=tmp_path)
+    first.compute_raw(3)
+    assert len(list((tmp_path / "operators").iterdir())) == len(first.operators)
+
+    def fail(*_args):
+        raise AssertionError("operators should be loaded from the cache")
+
+    monkeypatch.setattr(conv, "convolve_operator", fail)
+    second = sv.ScaleVariations(1, interpolator, True, True, cache_dir=tmp_path)
+    second.compute_raw(3)
+    for k, op in first.operators.items():
+        np.testing.assert_allclose(second.operators[k], op)
+
+
+def test_runner_results(tmp_path, monkeypatch):
+    theory, obs = runcards(
+        {
+            "F2_total": [{"Q2": 2.0, "x": 0.01}, {"Q2": 10.0, "x": 0.1}],
+            "XSHERANC": [{"Q2": 2.0, "x": 0.01, "y": 0.1}],
+        }
+    )
+    first = yadism.runner.Runner(theory, obs, cache_dir=tmp_path).get_result()
+    assert_same_results(first, plain_output(theory, obs), obs["observables"])
+    assert len(list((tmp_path / "results").iterdir())) == 3
+    # a new point is computed, the others are loaded
+    obs["observables"]["F2_total"].append({"Q2": 5.0, "x": 0.1})
+    computed = record_compute_groups(monkeypatch)
+    hits = []
+    load_arrays = cache.load_arrays
+
+    def spy_load(path, kind, digest):
+        arrays = load_arrays(path, kind, digest)
+        if kind == "results" and arrays is not None:
+            hits.append(digest)
+        return arrays
+
+    monkeypatch.setattr(cache, "load_arrays", spy_load)
+    second = yadism.runner.Runner(
+        dict(theory, ID=42), obs, cache_dir=tmp_path
+    ).get_result()
+    assert computed == [("F2_total", [2])]
+    assert len(hits) == len(set(hits)) == 3
+    assert len(list((tmp_path / "results").iterdir())) == 4
+    assert_same_results(second, first, ["XSHERANC"])
+    assert_same_results(dict(F2_total=second["F2_total"][:2]), first, ["F2_total"])
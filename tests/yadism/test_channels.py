@@ -0,0 +1,119 @@
+"""Test the store of the unweighted channels."""
+
+import numpy as np
+import pytest
+
+import yadism
+from yadism import channels
+from yadism.esf import esf
+
+from .utils import assert_same_results, kinematics, runcards
+
+
+class MockObj:
+    pass
+
+
+def mock_esf(x, Q2, size):
+    esf = MockObj()
+    esf.x = x
+    esf.Q2 = Q2
+    esf.info = MockObj()
+    esf.info.obs_name = MockObj()
+    esf.info.obs_name.name = "F2_total"
+    esf.info.configs = MockObj()
+    esf.info.configs.interpolator = MockObj()
+    esf.info.configs.interpolator.xgrid = np.zeros(size)
+    return esf
+
+
+def test_reference():
+    theory = dict(PTO=1, SIN2TW=0.23, MZ=91.0, ID=3)
+    observables = dict(prDIS="NC", PolarizationDIS=0.0, observables={})
+    ref = channels.reference(theory, observables)
+    # electroweak parameters and the observables themselves are ignored
+    assert ref == channels.reference(
+        dict(theory, SIN2TW=0.25, MZ=90.0, ID=4),
+        dict(observables, PolarizationDIS=0.5, observables={"F2_total": []}),
+    )
+    assert ref != channels.reference(dict(theory, PTO=2), observables)
+    assert ref != channels.reference(theory, dict(observables, prDIS="CC"))
+
+
+def test_roundtrip(tmp_path):
+    store = channels.Channels(tmp_path, "abc")
+    esf = mock_esf(0.1, 10.0, 5)
+    assert store.load(esf) == {}
+    stored = {
+        "0.0.NonSinglet": [(0, *np.random.rand(2, 5)), (1, *np.random.rand(2, 5))],
+        "0.1.Gluon": [(1, *np.random.rand(2, 5))],
+        "1.0.Singlet": [],
+    }
+    store.save(esf, stored)
+    loaded = store.load(esf)
+    assert sorted(loaded) == sorted(stored)
+    for label, raw in stored.items():
+        assert len(loaded[label]) == len(raw)
+        for (o1, val1, err1), (o2, val2, err2) in zip(raw, loaded[label]):
+            assert o1 == o2
+            np.testing.assert_allclose(val1, val2)
+            np.testing.assert_allclose(err1, err2)
+    # other points and runcards are separated
+    assert store.load(mock_esf(0.2, 10.0, 5)) == {}
+    assert channels.Channels(tmp_path, "def").load(esf) == {}
+
+
+def test_missing(tmp_path):
+    esf = mock_esf(0.1, 10.0, 5)
+    channels.Channels(tmp_path, "abc").missing(esf, "0.0.Gluon")
+    with pytest.raises(KeyError):
+        channels.Channels(tmp_path, "abc", strict=True).missing(esf, "0.0.Gluon")
+
+
+def no_convolution(*_args, **_kwargs):
+    raise AssertionError("no convolution expected")
+
+
+def test_reweight(tmp_path, monkeypatch):
+    points = kinematics([2.0, 10.0])
+    names = ["F2_total", "XSHERANC"]
+    theory, obs = runcards({name: points for name in names}, theory=dict(PTO=1))
+    yadism.runner.Runner(theory, obs, channels_dir=tmp_path).get_result()
+    # F2, FL, and F3 at each point
+    assert len(list((tmp_path / "channels").iterdir())) == 3 * len(points)
+    updates = dict(SIN2TW=0.24, MZ=90.0, PolarizationDIS=0.3)
+    full = yadism.runner.Runner(
+        dict(theory, SIN2TW=0.24, MZ=90.0), dict(obs, PolarizationDIS=0.3)
+    ).get_result()
+    monkeypatch.setattr(
+        esf.EvaluatedStructureFunction, "_convolve_kernel", no_convolution
+    )
+    out = channels.reweight(theory, obs, tmp_path, updates)
+    assert out.theory["SIN2TW"] == 0.24
+    assert_same_results(out, full, names, atol=1e-15)
+    # the other parameters need a new calculation
+    with pytest.raises(ValueError):
+        channels.reweight(theory, obs, tmp_path, dict(PTO=0))
+    with pytest.raises(KeyError):
+        channels.reweight(dict(theory, XIR=2.0), obs, tmp_path, updates)
+
+
+def test_reweight_zero_weight(tmp_path, monkeypatch):
+    points = kinematics([2.0, 10.0])
+    names = ["F2_total", "F3_total", "XSHERANC"]
+    # the neutrinos only couple to the Z, with no weight at all for the
+    # opposite polarization
+    theory, obs = runcards(
+        {name: points for name in names},
+        theory=dict(PTO=1),
+        ProjectileDIS="neutrino",
+        PolarizationDIS=-1.0,
+    )
+    yadism.runner.Runner(theory, obs, channels_dir=tmp_path).get_result()
+    updates = dict(PolarizationDIS=0.0)
+    full = yadism.runner.Runner(theory, dict(obs, **updates)).get_result()
+    monkeypatch.setattr(
+        esf.EvaluatedStructureFunction, "_convolve_kernel", no_convolution
+    )
+    out = channels.reweight(theory, obs, tmp_path, updates)
+    assert_same_results(out, full, names, atol=1e-15)
@@ -0,0 +1,105 @@
+"""Test the checkpoints."""
+
+import numpy as np
+import pytest
+
+import yadism
+from yadism import cache, checkpoint, version
+from yadism.esf.result import ESFResult, EXSResult
+
+from .utils import assert_same_results, plain_output, record_compute_groups, runcards
+
+lo = (0, 0, 0, 0)
+
+
+def test_roundtrip(tmp_path, monkeypatch):
+    store = checkpoint.Checkpoint(tmp_path, "abc")
+
+    def orders():
+        return {lo: tuple(np.random.rand(2, 3, 5))}
+
+    results = [
+        ("F2_total", 3, ESFResult(0.1, 10.0, 4, orders())),
+        ("F2_total", 0, ESFResult(0.2, 10.0, 4, orders())),
+        ("XSHERANC", 1, EXSResult(0.1, 5.0, 0.3, 3, orders())),
+    ]
+    # nothing is flushed before the interval
+    monkeypatch.setattr(checkpoint, "flush_interval", 1e6)
+    store.add(*results[0])
+    assert list(store.load()) == []
+    # everything is flushed afterwards
+    monkeypatch.setattr(checkpoint, "flush_interval", -1.0)
+    store.add(*results[1])
+    store.add(*results[2])
+    assert len(store.chunks("F2_total")) == 1
+    assert len(store.chunks("XSHERANC")) == 1
+
+    # resume
+    loaded = list(checkpoint.Checkpoint(tmp_path, "abc").load())
+    assert sorted((name, idx) for name, idx, _ in loaded) == sorted(
+        (name, idx) for name, idx, _ in results
+    )
+    for name, idx, res in loaded:
+        ref = next(r for n, i, r in results if (n, i) == (name, idx))
+        assert type(res) is type(ref)
+        assert res.get_raw() == ref.get_raw()
+
+
+def test_different_runcards(tmp_path):
+    checkpoint.Checkpoint(tmp_path, "abc")
+    with pytest.raises(ValueError, match="different runcards"):
+        checkpoint.Checkpoint(tmp_path, "def")
+
+
+def test_different_code(tmp_path, monkeypatch):
+    checkpoint.Checkpoint(tmp_path, "abc")
+    cache.code_version.cache_clear()
+    monkeypatch.setattr(version, "__version__", "1.2.3")
+    try:
+        with pytest.raises(ValueError, match="different version of the code"):
+            checkpoint.Checkpoint(tmp_path, "abc")
+    finally:
+        cache.code_version.cache_clear()
+
+
+def test_inconsistent_orders(tmp_path):
+    store = checkpoint.Checkpoint(tmp_path, "abc")
+    store.add("F2_total", 0, ESFResult(0.1, 10.0, 4, {lo: tuple(np.ones((2, 3, 5)))}))
+    nlo = (1, 0, 0, 0)
+    store.add("F2_total", 1, ESFResult(0.2, 10.0, 4, {nlo: tuple(np.ones((2, 3, 5)))}))
+    with pytest.raises(ValueError):
+        store.flush()
+
+
+def test_resume(tmp_path, monkeypatch):
+    theory, obs = runcards(
+        {"F2_total": [{"Q2": q2, "x": 0.1} for q2 in [2.0, 5.0, 10.0]]}
+    )
+    monkeypatch.setattr(checkpoint, "flush_interval", 1e6)
+    # interrupted run
+    interrupted = yadism.runner.Runner(theory, obs, checkpoint_dir=tmp_path)
+    stream = interrupted.iter_results()
+    next(stream)
+    next(stream)
+    stream.close()
+    # the points computed are flushed on interruption
+    chunks = [chunk.name for chunk in (tmp_path / "F2_total").iterdir()]
+    assert len(chunks) == 1
+    loaded = []
+    load = checkpoint.Checkpoint.load
+
+    def spy_load(store):
+        for name, idx, res in load(store):
+            loaded.append((name, idx))
+            yield name, idx, res
+
+    # resumed run
+    computed = record_compute_groups(monkeypatch)
+    monkeypatch.setattr(checkpoint.Checkpoint, "load", spy_load)
+    resumed = yadism.runner.Runner(theory, obs, checkpoint_dir=tmp_path)
+    out = resumed.get_result()
+    assert sorted(loaded) == [("F2_total", 0), ("F2_total", 1)]
+    assert computed == [("F2_total", [2])]
+    # the new point is appended as a new chunk
+    assert len(list((tmp_path / "F2_total").iterdir())) == 2
+    assert_same_results(out, plain_output(theory, obs), ["F2_total"])
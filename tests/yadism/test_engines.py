@@ -0,0 +1,37 @@
+"""Test the convolution engines selected by the observables runcard."""
+
+import pytest
+
+import yadism
+from yadism.esf import conv
+
+from .utils import assert_same_results, kinematics, plain_output, runcards
+
+
+@pytest.mark.parametrize("engine", ["fixed", "moments"])
+def test_runner(monkeypatch, engine):
+    names = ["F2_total", "FL_total"]
+    theory, obs = runcards(
+        {name: kinematics([10.0], [0.01, 0.1, 0.5]) for name in names},
+        dict(PTO=1),
+    )
+    convolve = getattr(conv, f"convolve_vector_{engine}")
+    calls = []
+
+    def spy(*args):
+        calls.append(args)
+        return convolve(*args)
+
+    monkeypatch.setattr(conv, f"convolve_vector_{engine}", spy)
+    runner = yadism.runner.Runner(theory, dict(obs, convolution_engine=engine))
+    assert runner.configs.conv_cache.engine == engine
+    out = runner.get_result()
+    assert len(calls) > 0
+    # the default engine is quad
+    assert_same_results(out, plain_output(theory, obs), names, atol=1e-8)
+
+
+def test_unknown():
+    theory, obs = runcards({"F2_total": kinematics([10.0])})
+    with pytest.raises(ValueError, match="Unknown convolution engine 'void'"):
+        yadism.runner.Runner(theory, dict(obs, convolution_engine="void"))
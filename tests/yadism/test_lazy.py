@@ -0,0 +1,29 @@
+"""Test the deferred imports of the heavy dependencies."""
+
+import subprocess
+import sys
+
+import pytest
+
+import yadism
+
+heavy = ["eko", "pandas", "rich", "LeProHQ", "adani"]
+"""Heavy dependencies, only imported on first use"""
+
+
+def loaded(code):
+    """List the heavy dependencies loaded by some code, in a fresh interpreter."""
+    code += f"; import sys; print(*[m for m in {heavy!r} if m in sys.modules])"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    return out.stdout.split()
+
+
+def test_import():
+    assert loaded("import yadism") == []
+    # the dependencies are imported on first use, though
+    assert "eko" in loaded("import yadism; yadism.Runner")
+    assert yadism.Runner is yadism.runner.Runner
+    with pytest.raises(AttributeError):
+        yadism.not_a_module  # pylint: disable=pointless-statement
@@ -122,3 +122,277 @@ class TestOutput:
         np.testing.assert_almost_equal(o1["pids"], r1["pids"])
         np.testing.assert_equal(len(o1), len(r1))
         np.testing.assert_equal(type(o1), type(r1))
+
+    def fake_shards(self):
+        out, obs = self.fake_output()
+        shards = [output.Output(out), output.Output(out)]
+        for o in obs:
+            shards[0][o] = [out[o][0], None, out[o][2]]
+            shards[1][o] = [None, out[o][1], None]
+        return out, obs, shards
+
+    def test_apply_pdf_shard(self):
+        out, obs, shards = self.fake_shards()
+        full = output.Output(out)
+        args = (lambda _muR: 1, lambda _muR: 1)
+        ref = full.apply_pdf_alphas_alphaqed_xir_xif(MockPDFgonly(), *args, 1.0, 1.0)
+        ret = shards[0].apply_pdf_alphas_alphaqed_xir_xif(
+            MockPDFgonly(), *args, 1.0, 1.0
+        )
+        scales = shards[0].apply_pdf_scales_alphas_alphaqed(
+            MockPDFgonly(), *args, [(1.0, 1.0)]
+        )
+        members = shards[0].apply_pdf_set_alphas_alphaqed_xir_xif(
+            [MockPDFgonly()], *args, 1.0, 1.0
+        )
+        for o in obs:
+            # the points of the other shard are left empty
+            assert ret[o][1] is None
+            for j in [0, 2]:
+                assert ret[o][j] == ref[o][j]
+            for arrays in [scales[o], members[o]]:
+                assert np.isnan(arrays["Q2"][1])
+                assert np.isnan(arrays["result"][0, 1])
+                np.testing.assert_allclose(
+                    arrays["result"][0, [0, 2]], [ref[o][j]["result"] for j in [0, 2]]
+                )
+        # and skipped when dumping
+        assert ret.get_raw()["F2_total"][1] is None
+        assert len(ret.tables["F2_total"]) == 2
+
+    def test_merge(self):
+        out, obs, shards = self.fake_shards()
+        merged = output.Output.merge(*shards)
+        assert list(merged.keys()) == list(out.keys())
+        for o in obs:
+            assert merged[o] == out[o]
+        assert merged["xgrid"] == out["xgrid"]
+        # partial
+        partial = output.Output.merge(shards[1])
+        assert partial["F2_total"][0] is None
+        # overlapping
+        with pytest.raises(ValueError, match="unique"):
+            output.Output.merge(shards[0], shards[0])
+        # incompatible
+        shards[1]["xgrid"] = {"grid": [0.1, 1.0], "log": False}
+        with pytest.raises(ValueError, match="xgrid"):
+            output.Output.merge(*shards)
+
+    def test_merge_tar(self, tmp_path):
+        out, obs, shards = self.fake_shards()
+        paths = []
+        for j, shard in enumerate(shards):
+            paths.append(tmp_path / f"shard{j}.tar")
+            shard.dump_tar(paths[-1])
+        # partial archives
+        r0 = output.Output.load_tar(paths[0])
+        assert r0["F2_total"][1] is None
+        np.testing.assert_allclose(
+            r0["F2_total"][2].orders[lo][0], out["F2_total"][2].orders[lo][0]
+        )
+        # merged archive
+        output.Output.merge_tar(tmp_path / "merged.tar", *paths)
+        merged = output.Output.load_tar(tmp_path / "merged.tar")
+        output.Output(out).dump_tar(tmp_path / "full.tar")
+        full = output.Output.load_tar(tmp_path / "full.tar")
+        assert merged.get_raw() == full.get_raw()
+        with pytest.raises(ValueError, match="unique"):
+            output.Output.merge_tar(tmp_path / "overlap.tar", paths[0], paths[0])
+
+    def test_tar_arrays(self, tmp_path):
+        out, obs = self.fake_output()
+        o1 = output.Output(out)
+        o1.dump_tar(tmp_path / "test.tar")
+        r1 = output.Output.load_tar(tmp_path / "test.tar")
+        for o in obs:
+            for p1, p2 in zip(o1[o], r1[o]):
+                assert p1.get_raw() == p2.get_raw()
+            # all the points are views on the same arrays
+            values = [p.orders[lo][0] for p in r1[o]]
+            assert values[0].base is not None
+            assert all(np.shares_memory(v, values[0].base) for v in values)
+
+    def test_lazy_tar(self, tmp_path):
+        out, obs, shards = self.fake_shards()
+        for compress in [True, False]:
+            path = tmp_path / f"lazy{compress}.tar"
+            output.Output(out).dump_tar(path, compress=compress)
+            lazy = output.Output.load_tar(path, lazy=True)
+            eager = output.Output.load_tar(path)
+            for o in obs:
+                assert isinstance(lazy[o], output.LazyResults)
+                # nothing loaded until accessed
+                assert lazy[o].arrays is None
+                assert len(lazy[o]) == len(eager[o])
+                for p1, p2 in zip(lazy[o], eager[o]):
+                    assert p1.get_raw() == p2.get_raw()
+                assert [p.Q2 for p in lazy[o][1:]] == [10, 100]
+            # uncompressed arrays are mapped from the archive
+            assert isinstance(lazy[obs[0]].arrays[0], np.memmap) is not compress
+        # partial, uncompressed archives can be merged
+        paths = []
+        for j, shard in enumerate(shards):
+            paths.append(tmp_path / f"shard{j}.tar")
+            shard.dump_tar(paths[-1], compress=False)
+        assert output.Output.load_tar(paths[1], lazy=True)["F2_total"][0] is None
+        output.Output.merge_tar(tmp_path / "merged.tar", *paths, compress=False)
+        merged = output.Output.load_tar(tmp_path / "merged.tar", lazy=True)
+        for o in obs:
+            for p1, p2 in zip(merged[o], out[o]):
+                assert p1.get_raw() == p2.get_raw()
+
+    def test_copy(self):
+        out, _obs = self.fake_output()
+        outp = output.Output()
+        outp.update(out)
+        outp.theory = {"PTO": 0}
+        for kin in outp["F2_total"]:
+            kin.freeze()
+        out2 = outp.copy()
+        assert isinstance(out2, output.Output)
+        assert out2.theory == outp.theory
+        assert out2["F2_light"] is None
+        assert out2["xgrid"] == outp["xgrid"]
+        assert out2["xgrid"] is not outp["xgrid"]
+        out2["F2_total"][0].orders[lo][0][0, 0] = 5
+        assert outp["F2_total"][0].orders[lo][0][0, 0] == 1
+
+    def test_apply_pdf_batched(self):
+        class ScalarPDF:
+            calls = 0
+
+            def hasFlavor(self, pid):
+                return pid in [21, 1]
+
+            def xfxQ2(self, pid, x, Q2):
+                if not isinstance(x, float):
+                    raise TypeError("scalar only")
+                self.calls += 1
+                return x * (1 - x) * np.log(Q2) * (2 if pid == 21 else 1)
+
+        orders = [lo, (1, 0, 0, 0), (1, 0, 1, 0), (1, 0, 0, 1)]
+        out = output.Output()
+        out["xgrid"] = {"grid": np.array([0.1, 0.5, 1.0]), "log": False}
+        out["pids"] = [21, 1, 2]
+        rng = np.random.default_rng(42)
+        out["F2_total"] = [
+            result.ESFResult(
+                0.1, Q2, 4, {o: tuple(rng.random((2, 3, 3))) for o in orders}
+            )
+            for Q2 in [10.0, 20.0, 10.0]
+        ]
+        out["XSHERANC"] = [
+            result.EXSResult(
+                0.1, 20.0, 0.3, 4, {o: tuple(rng.random((2, 3, 3))) for o in orders}
+            )
+        ]
+        args = (lambda muR: 0.1 * muR, lambda _muR: 1 / 137, 0.5, 2.0)
+        pdf = ScalarPDF()
+        ret = out.apply_pdf_alphas_alphaqed_xir_xif(pdf, *args)
+        # the PDFs are evaluated once per scale
+        assert pdf.calls == 2 * 2 * 3
+        for obs in ["F2_total", "XSHERANC"]:
+            for kin, point in zip(out[obs], ret[obs]):
+                ref = kin.apply_pdf(pdf, out["pids"], out["xgrid"]["grid"], *args)
+                assert point.keys() == ref.keys()
+                for key in ref:
+                    np.testing.assert_allclose(point[key], ref[key], rtol=1e-13)
+
+    def test_apply_pdf_scales(self):
+        class ScalarPDF:
+            calls = 0
+
+            def hasFlavor(self, pid):
+                return pid in [21, 1]
+
+            def xfxQ2(self, pid, x, Q2):
+                if not isinstance(x, float):
+                    raise TypeError("scalar only")
+                self.calls += 1
+                return x * (1 - x) * np.log(Q2) * (2 if pid == 21 else 1)
+
+        orders = [lo, (1, 0, 0, 0), (1, 0, 1, 0), (1, 0, 0, 1)]
+        out = output.Output()
+        out["xgrid"] = {"grid": np.array([0.1, 0.5, 1.0]), "log": False}
+        out["pids"] = [21, 1, 2]
+        rng = np.random.default_rng(42)
+        out["F2_total"] = [
+            result.ESFResult(
+                0.1, Q2, 4, {o: tuple(rng.random((2, 3, 3))) for o in orders}
+            )
+            for Q2 in [10.0, 20.0, 10.0]
+        ]
+        out["XSHERANC"] = [
+            result.EXSResult(
+                0.1, 20.0, 0.3, 4, {o: tuple(rng.random((2, 3, 3))) for o in orders}
+            )
+        ]
+        scales = [
+            (xiR, xiF)
+            for xiR in [0.5, 1.0, 2.0]
+            for xiF in [0.5, 1.0, 2.0]
+            if 0.5 <= xiR / xiF <= 2.0
+        ]
+        alpha_s = mock.Mock(side_effect=lambda muR: 0.1 * muR)
+        alpha_qed = lambda _muR: 1 / 137
+        pdf = ScalarPDF()
+        ret = out.apply_pdf_scales_alphas_alphaqed(pdf, alpha_s, alpha_qed, scales)
+        # PDFs once per factorization scale, couplings once per renormalization
+        assert pdf.calls == 2 * 3 * 2 * 3
+        assert alpha_s.call_count == 2 * 3
+        assert ret["F2_total"]["result"].shape == (len(scales), 3)
+        for j, (xiR, xiF) in enumerate(scales):
+            ref = out.apply_pdf_alphas_alphaqed_xir_xif(
+                pdf, alpha_s, alpha_qed, xiR, xiF
+            )
+            for obs in ["F2_total", "XSHERANC"]:
+                for key in ["result", "error"]:
+                    np.testing.assert_allclose(
+                        ret[obs][key][j],
+                        [point[key] for point in ref[obs]],
+                        rtol=1e-13,
+                    )
+
+    def test_apply_pdf_set(self):
+        class ReplicaPDF:
+            def __init__(self, replica):
+                self.replica = replica
+
+            def hasFlavor(self, pid):
+                return pid in [21, 1]
+
+            def xfxQ2(self, pid, x, Q2):
+                return x * (1 - x) ** self.replica * np.log(Q2) * (pid % 3 + 1)
+
+        orders = [lo, (1, 0, 0, 0), (1, 0, 1, 0)]
+        out = output.Output()
+        out["xgrid"] = {"grid": np.array([0.1, 0.5, 1.0]), "log": False}
+        out["pids"] = [21, 1, 2]
+        rng = np.random.default_rng(42)
+        out["F2_total"] = [
+            result.ESFResult(
+                0.1, Q2, 4, {o: tuple(rng.random((2, 3, 3))) for o in orders}
+            )
+            for Q2 in [10.0, 20.0, 10.0]
+        ]
+        out["XSHERANC"] = [
+            result.EXSResult(
+                0.1, 20.0, 0.3, 4, {o: tuple(rng.random((2, 3, 3))) for o in orders}
+            )
+        ]
+        out["FL_total"] = []
+        args = (lambda muR: 0.1 * muR, lambda _muR: 1 / 137, 0.5, 2.0)
+        members = [ReplicaPDF(r) for r in range(1, 5)]
+        ret = out.apply_pdf_set_alphas_alphaqed_xir_xif(members, *args)
+        assert ret["FL_total"]["result"].shape == (4, 0)
+        assert ret["F2_total"]["result"].shape == (4, 3)
+        np.testing.assert_allclose(ret["XSHERANC"]["y"], [0.3])
+        for member, pdf in enumerate(members):
+            ref = out.apply_pdf_alphas_alphaqed_xir_xif(pdf, *args)
+            for obs in ["F2_total", "XSHERANC"]:
+                for key in ["result", "error"]:
+                    np.testing.assert_allclose(
+                        ret[obs][key][member],
+                        [point[key] for point in ref[obs]],
+                        rtol=1e-13,
+                    )
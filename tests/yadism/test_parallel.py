@@ -0,0 +1,47 @@
+"""Test the computation of the kinematic points on a process pool."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import yadism
+from yadism import tracing
+
+from .utils import assert_same_results, kinematics, plain_output, runcards
+
+
+def test_workers():
+    names = ["F2_total", "XSHERANC"]
+    theory, obs = runcards(
+        {name: kinematics([2.0, 10.0], [0.01, 0.1]) for name in names}
+    )
+    trace = tracing.Trace()
+    with tracing.activate(trace):
+        out = yadism.runner.Runner(theory, obs).get_result(workers=2)
+    assert_same_results(out, plain_output(theory, obs), names, atol=0.0)
+    # all the points are computed by the workers
+    points = [ev for ev in trace.events if ev["cat"] == "point"]
+    assert sorted(ev["name"] for ev in points) == sorted(
+        f"{name}[{j}]" for name in names for j in range(4)
+    )
+    assert all(ev["pid"] != os.getpid() for ev in points)
+
+
+@pytest.mark.parametrize("value, workers", [(None, 1), ("1", 1), ("3", 3)])
+def test_default_workers(monkeypatch, value, workers):
+    if value is None:
+        monkeypatch.delenv("YADISM_WORKERS", raising=False)
+    else:
+        monkeypatch.setenv("YADISM_WORKERS", value)
+    assert yadism.runner.default_workers() == workers
+
+
+@pytest.mark.parametrize("value", ["", "auto", "0", "-2", "1.5"])
+def test_default_workers_invalid(monkeypatch, value):
+    monkeypatch.setenv("YADISM_WORKERS", value)
+    # only refused when used, not on import
+    subprocess.run([sys.executable, "-c", "import yadism.runner"], check=True)
+    with pytest.raises(ValueError, match="YADISM_WORKERS"):
+        yadism.runner.default_workers()
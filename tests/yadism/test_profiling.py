@@ -0,0 +1,115 @@
+import importlib
+import json
+
+import pytest
+
+import yadism
+from yadism import profiling
+
+from .utils import runcards
+
+
+def test_span():
+    # nothing happens without an active profile
+    with profiling.span("F2_total", "light", "NonSinglet", 0):
+        profiling.add_subintervals(3)
+    profile = profiling.Profile()
+    with profiling.activate(profile):
+        for _ in range(2):
+            with profiling.span("F2_total", "light", "NonSinglet", 0):
+                profiling.add_subintervals(3)
+                with profiling.span("F2_total", "scale_variations", None, None):
+                    profiling.add_subintervals(1)
+    assert profiling.current is None
+    elapsed, calls, subintervals = profile.entries[
+        ("F2_total", "light", "NonSinglet", 0)
+    ]
+    assert calls == 2
+    assert subintervals == 6
+    assert profile.entries[("F2_total", "scale_variations", None, None)][1:] == [2, 2]
+    assert elapsed >= profile.entries[("F2_total", "scale_variations", None, None)][0]
+
+
+def test_report(tmp_path):
+    profile = profiling.Profile()
+    profile.merge({("F2_total", "light", "Gluon", 1): [1.0, 2, 30]})
+    profile.merge(
+        {
+            ("F2_total", "light", "Gluon", 1): [1.0, 1, 10],
+            ("F2_total", "tmc", None, None): [5.0, 1, 0],
+        }
+    )
+    report = profile.report()
+    assert report[0]["component"] == "tmc"
+    assert report[1] == dict(
+        observable="F2_total",
+        component="light",
+        channel="Gluon",
+        order=1,
+        time=2.0,
+        calls=3,
+        subintervals=40,
+    )
+    path = tmp_path / "profile.json"
+    profile.dump(path)
+    assert json.loads(path.read_text(encoding="utf-8")) == report
+    assert profile.table().row_count == 2
+
+
+def test_runner(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, "report_file", tmp_path / "prof.json")
+    theory, obs = runcards(
+        {"F2_light": [{"Q2": q2, "x": 0.1} for q2 in [2.0, 5.0]]},
+        theory=dict(PTO=1),
+        prDIS="EM",
+    )
+    runner = yadism.runner.Runner(theory, obs, profile=True)
+    runner.get_result()
+    report = runner.profile_report.report()
+    assert (tmp_path / "prof.json").exists()
+    components = {row["component"] for row in report}
+    assert {"light", "combiner", "scale_variations"} <= components
+    kernels = [row for row in report if row["component"] == "light"]
+    assert {row["order"] for row in kernels} == {0, 1}
+    assert sum(row["subintervals"] for row in kernels) > 0
+    # the workers report their counters as well
+    parallel = yadism.runner.Runner(theory, obs, profile=True)
+    parallel.get_result(workers=2)
+    serial = runner.profile_report.entries
+    assert parallel.profile_report.entries.keys() == serial.keys()
+    # the light convolutions are only shared within each worker
+    for entry, (_, calls, _) in serial.items():
+        assert parallel.profile_report.entries[entry][1] == calls
+
+
+def test_iter_results(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, "report_file", tmp_path / "prof.json")
+    theory, obs = runcards(
+        {"F2_light": [{"Q2": q2, "x": 0.1} for q2 in [2.0, 5.0]]},
+        theory=dict(PTO=1),
+        prDIS="EM",
+    )
+    runner = yadism.runner.Runner(theory, obs, profile=True)
+    # streaming runs are profiled as well
+    for _ in runner.iter_results():
+        assert profiling.current is not None
+    assert profiling.current is None
+    kernels = [
+        row for row in runner.profile_report.report() if row["component"] == "light"
+    ]
+    assert sum(row["calls"] for row in kernels) > 0
+    assert json.loads((tmp_path / "prof.json").read_text(encoding="utf-8")) == (
+        runner.profile_report.report()
+    )
+
+
+@pytest.mark.parametrize(
+    "value, enabled", [("", False), ("0", False), ("1", True), ("yes", True)]
+)
+def test_enabled(monkeypatch, value, enabled):
+    monkeypatch.setenv("YADISM_PROFILE", value)
+    try:
+        assert importlib.reload(profiling).enabled is enabled
+    finally:
+        monkeypatch.undo()
+        importlib.reload(profiling)
@@ -10,6 +10,7 @@ from hypothesis import strategies as st
 
 import yadism.input.compatibility
 from yadism import log, runner, sf
+from yadism.esf.result import ESFResult
 
 
 class DropRunner(runner.Runner):
@@ -38,6 +39,11 @@ class ResultsRunner(runner.Runner):
         self.observables = observables
         self._observables = dict(observables={obs: [] for obs in observables})
         self._output = {}
+        self.cache_dir = None
+        self.checkpoint_dir = None
+        self.shard = None
+        self.profile = False
+        self.trace = None
 
         class FakeConsole:
             def __init__(self):
@@ -96,6 +102,7 @@ class TestRunner:
             PolarizationDIS=0.0,
             PropagatorCorrection=0.0,
             NCPositivityCharge=None,
+            convolution_engine="quad",
             observables={
                 "F2_charm": [dict(x=0.1, Q2=10.0)],
                 "XSCHORUSCC": [dict(x=0.1, y=0.5, Q2=10.0)],
@@ -135,9 +142,13 @@ class TestRunner:
         @dataclasses.dataclass
         class FakeESF:
             Q2: float
+            x: float = 0.1
 
             def get_result(self):
-                return None
+                return ESFResult(self.x, self.Q2, None)
+
+            def drop_result(self):
+                pass
 
         class FakeSF:
             def __init__(self, name):
@@ -165,6 +176,26 @@ class TestRunner:
         assert results_runner.get_result() is not None
 
 
+def test_split_shards():
+    groups = [("F2_total", [0, 1, 2]), ("F2_total", [3]), ("XSHERANC", [0, 1])]
+    groups += [("FL_total", [j]) for j in range(5)]
+    shards = runner.split_shards(groups, 3)
+    # deterministic, exhaustive, and order preserving
+    assert shards == runner.split_shards(groups, 3)
+    assert sorted(sum(shards, []), key=groups.index) == groups
+    for shard in shards:
+        assert shard == sorted(shard, key=groups.index)
+    # balanced: the cross section is the most expensive
+    assert shards[0] == [("XSHERANC", [0, 1])]
+    assert shards[1] == [("F2_total", [0, 1, 2]), ("FL_total", [2]), ("FL_total", [4])]
+    # more shards than groups
+    assert runner.split_shards(groups[:1], 2) == [groups[:1], []]
+    # the groups sharing the same key are kept together
+    keys = [1.0, 2.0, 2.0] + [3.0] * 5
+    shards = runner.split_shards(groups, 2, keys)
+    assert shards == [groups[1:3], groups[:1] + groups[3:]]
+
+
 class TestConfig:
     @given(st.text(), st.text())
     def test_init(self, theory, managers):
@@ -0,0 +1,41 @@
+"""Test the sharded runs, and the merge of their outputs."""
+
+import yadism
+
+from .utils import assert_same_results, plain_output, runcards
+
+
+def test_shards(tmp_path):
+    theory, obs = runcards(
+        {
+            "F2_total": [{"Q2": q2, "x": 0.1} for q2 in [2.0, 5.0, 10.0, 5.0]],
+            "XSHERANC": [{"Q2": 2.0, "x": 0.01, "y": 0.1}],
+        }
+    )
+    names = list(obs["observables"])
+    full = plain_output(theory, obs)
+    runners = [yadism.runner.Runner(theory, obs, shard=(j, 2)) for j in range(2)]
+    # the scheduled points are disjoint, and they cover all the points
+    scheduled = [
+        [(name, idx) for name, indices in runner.schedule() for idx in indices]
+        for runner in runners
+    ]
+    assert all(len(points) > 0 for points in scheduled)
+    assert set(scheduled[0]).isdisjoint(scheduled[1])
+    assert sorted(scheduled[0] + scheduled[1]) == sorted(
+        (name, idx) for name in names for idx in range(len(obs["observables"][name]))
+    )
+    shards = [runner.get_result() for runner in runners]
+    # each point is computed exactly once, by the shard it is scheduled on
+    for points, shard in zip(scheduled, shards):
+        for name in names:
+            for idx, res in enumerate(shard[name]):
+                assert (res is not None) == ((name, idx) in points)
+    assert yadism.output.Output.merge(*shards).get_raw() == full.get_raw()
+    # through archives
+    paths = [tmp_path / f"shard{j}.tar" for j in range(2)]
+    for shard, path in zip(shards, paths):
+        shard.dump_tar(path)
+    yadism.output.Output.merge_tar(tmp_path / "merged.tar", *paths)
+    merged = yadism.output.Output.load_tar(tmp_path / "merged.tar")
+    assert_same_results(merged, full, names)
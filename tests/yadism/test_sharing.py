@@ -0,0 +1,51 @@
+"""Test the structure functions shared across observables at the same Q2."""
+
+import pytest
+
+import yadism
+
+from .utils import (
+    assert_same_results,
+    kinematics,
+    plain_output,
+    record_computed,
+    runcards,
+)
+
+
+@pytest.fixture
+def computed(monkeypatch):
+    """Record the structure functions actually computed."""
+    return record_computed(monkeypatch)
+
+
+def test_shared_structure_functions(computed):
+    points = kinematics([2.0, 10.0], [0.01, 0.1])
+    theory, obs = runcards({"XSHERANC": points})
+    alone = plain_output(theory, obs)
+    computed.clear()
+    obs["observables"] = {name: points for name in ["F2_total", "XSHERANC", "FL_total"]}
+    out = yadism.runner.Runner(theory, obs).get_result()
+    # F2, FL, and F3 are computed once per point
+    assert len(computed) == len(set(computed)) == 3 * len(points)
+    assert {name for name, _, _ in computed} == {"F2_total", "FL_total", "F3_total"}
+    assert_same_results(out, alone, ["XSHERANC"])
+
+
+def test_release_loaded(tmp_path, computed):
+    points = kinematics([2.0, 10.0])
+    theory, obs = runcards({"F2_total": points})
+    yadism.runner.Runner(theory, obs, cache_dir=tmp_path).get_result()
+    # F2 is loaded, but computed again for the cross section
+    computed.clear()
+    obs["observables"] = {"F2_total": points, "XSHERANC": points}
+    runner = yadism.runner.Runner(theory, obs, cache_dir=tmp_path)
+    for _ in runner.iter_results():
+        pass
+    assert sorted(name for name, _, _ in computed) == sorted(
+        ["F2_total", "FL_total", "F3_total"] * len(points)
+    )
+    # and released afterwards
+    for sf in runner.observables.values():
+        if isinstance(sf, yadism.sf.StructureFunction):
+            assert all(not elem._computed for elem in sf.cache.values())
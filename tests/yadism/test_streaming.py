@@ -0,0 +1,35 @@
+"""Test the streaming of the results, see :meth:`yadism.runner.Runner.iter_results`."""
+
+import yadism
+
+from .utils import plain_output, record_computed, runcards
+
+
+def test_iter_results(monkeypatch):
+    theory, obs = runcards(
+        {
+            "F2_total": [{"Q2": q2, "x": 0.1} for q2 in [10.0, 2.0, 10.0]],
+            "XSHERANC": [{"Q2": 2.0, "x": 0.01, "y": 0.1}],
+        }
+    )
+    out = plain_output(theory, obs)
+    computed = record_computed(monkeypatch)
+    runner = yadism.runner.Runner(theory, obs)
+    stream = runner.iter_results()
+    # the results are computed on demand, one Q2 group at a time
+    assert computed == []
+    streamed = [next(stream)]
+    assert len(computed) > 0
+    assert all(Q2 == 2.0 for _, _, Q2 in computed)
+    streamed.extend(stream)
+    # grouped by Q2 across observables, cross sections first
+    assert [(name, idx) for name, idx, _ in streamed] == [
+        ("XSHERANC", 0),
+        ("F2_total", 1),
+        ("F2_total", 0),
+        ("F2_total", 2),
+    ]
+    for name, idx, res in streamed:
+        assert res.get_raw() == out[name][idx].get_raw()
+    # nothing is retained
+    assert all(not elem._computed for elem in runner.observables["F2_total"].elements)
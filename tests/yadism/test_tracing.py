@@ -0,0 +1,87 @@
+import json
+import os
+
+import pytest
+
+import yadism
+from yadism import tracing
+
+from .utils import runcards
+
+
+def test_span(tmp_path):
+    # nothing happens without an active trace
+    with tracing.span("F2_total", "observable"):
+        pass
+    trace = tracing.Trace()
+    with tracing.activate(trace):
+        with tracing.span("F2_total", "observable", points=2):
+            with tracing.span("F2_total[0]", "point", x=0.1, Q2=10.0):
+                pass
+    assert tracing.current is None
+    # the spans are recorded when closed, so the inner ones come first
+    assert [ev["cat"] for ev in trace.events] == ["point", "observable"]
+    inner, outer = trace.events
+    assert inner["args"] == dict(x=0.1, Q2=10.0)
+    assert outer["args"] == dict(points=2)
+    assert all(ev["dur"] >= 0 for ev in trace.events)
+    # events of another process
+    trace.extend([dict(inner, pid=-1)])
+    path = tmp_path / "trace.json"
+    trace.dump(path)
+    content = json.loads(path.read_text(encoding="utf-8"))
+    metadata = [ev for ev in content["traceEvents"] if ev["ph"] == "M"]
+    assert {ev["pid"] for ev in metadata} == {os.getpid(), -1}
+    assert len(content["traceEvents"]) == 5
+
+
+def nesting(events, outer, inner):
+    """Collect the inner spans closed within each outer span.
+
+    The spans are recorded when closed, so the inner spans of an outer one are
+    the ones (of the same process) recorded since the previous outer span.
+    """
+    nested = []
+    pending = {}
+    for ev in events:
+        if ev["cat"] == inner:
+            pending.setdefault(ev["pid"], []).append(ev["name"])
+        elif ev["cat"] == outer:
+            nested.append((ev["name"], pending.pop(ev["pid"], [])))
+    assert len(pending) == 0
+    return nested
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_runner(tmp_path, workers):
+    theory, obs = runcards(
+        {"F2_total": [{"Q2": q2, "x": 0.1} for q2 in [2.0, 5.0, 10.0]]},
+        theory=dict(PTO=1, TMC=1),
+    )
+    path = tmp_path / "trace.json"
+    yadism.runner.Runner(theory, obs, trace=path).get_result(workers=workers)
+    events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+    spans = [ev for ev in events if ev["ph"] == "X"]
+    assert all(ev["dur"] >= 0 for ev in spans)
+    cats = {ev["cat"] for ev in spans}
+    assert {"observable", "point", "tmc", "kernel", "convolution"} <= cats
+    # each point is nested in its observable, in order
+    observables = nesting(spans, "observable", "point")
+    assert [name for name, _ in observables] == ["F2_total"] * 3
+    assert [points for _, points in observables] == [
+        [f"F2_total[{j}]"] for j in range(3)
+    ]
+    if workers > 1:
+        assert all(ev["pid"] != os.getpid() for ev in spans if ev["cat"] == "point")
+
+
+def test_runner_consumer():
+    theory, obs = runcards(
+        {"F2_total": [{"Q2": q2, "x": 0.1} for q2 in [2.0, 5.0, 10.0]]}
+    )
+    # the time spent by the consumer is not accounted to the observables, i.e.
+    # each observable span is closed before its results are handed out
+    with tracing.activate(tracing.Trace()) as trace:
+        for name, idx, _ in yadism.runner.Runner(theory, obs).iter_results():
+            closed = [ev["name"] for ev in trace.events if ev["cat"] == "observable"]
+            assert closed == [name] * (idx + 1)
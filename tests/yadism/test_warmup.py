@@ -0,0 +1,61 @@
+import textwrap
+
+import pytest
+
+from yadism import warmup
+
+
+def test_kernel_modules():
+    modules = warmup.kernel_modules()
+    assert "yadism.esf.tmc" in modules
+    assert "yadism.coefficient_functions.special" in modules
+    assert "yadism.esf.conv" in modules
+    assert "yadism.warmup" not in modules
+
+
+def test_warmup(tmp_path, monkeypatch):
+    monkeypatch.setenv("NUMBA_DISABLE_JIT", "1")
+    with pytest.raises(ValueError):
+        warmup.warmup(tmp_path)
+    monkeypatch.setenv("NUMBA_DISABLE_JIT", "0")
+    modules = ["yadism.esf.tmc", "yadism.not_a_module"]
+    report = warmup.warmup(tmp_path, modules, workers=1)
+    assert sorted(report["compiled"]) == [
+        f"yadism.esf.tmc.{name}_ker" for name in ["g2", "h2", "h3", "k2"]
+    ]
+    assert list(report["failed"]) == ["yadism.not_a_module"]
+    # the second time they are already cached
+    report = warmup.warmup(tmp_path, modules[:1], workers=1)
+    assert len(report["loaded"]) == 4
+    assert len(report["compiled"]) == 0
+    assert len(list(tmp_path.rglob("tmc.*.nbi"))) == 4
+
+
+def test_integrands(tmp_path, monkeypatch):
+    monkeypatch.setenv("NUMBA_DISABLE_JIT", "0")
+    report = warmup.warmup(tmp_path, ["yadism.esf.conv"], workers=1)
+    assert sorted(report["compiled"]) == [
+        "yadism.esf.conv._kernel_on_nodes",
+        "yadism.esf.conv._quad_ker",
+    ]
+    assert len(report["failed"]) == 0
+    assert len(list(tmp_path.rglob("conv._kernel_on_nodes-*.nbi"))) == 1
+
+
+def test_lazy(tmp_path, monkeypatch):
+    (tmp_path / "lazy_kernels.py").write_text(
+        textwrap.dedent("""
+            import numba as nb
+
+            @nb.njit(cache=True)
+            def lazy(z):
+                return z
+            """),
+        encoding="utf-8",
+    )
+    # the worker processes inherit the import path
+    monkeypatch.syspath_prepend(tmp_path)
+    monkeypatch.setenv("NUMBA_DISABLE_JIT", "0")
+    report = warmup.warmup(tmp_path / "cache", ["lazy_kernels"], workers=1)
+    assert report["compiled"] == []
+    assert report["failed"] == {"lazy_kernels.lazy": "no explicit signature"}
@@ -0,0 +1,175 @@
+"""Runcards and helpers shared by the end-to-end tests of the runner."""
+
+import copy
+import json
+
+import numpy as np
+
+import yadism
+from yadism.esf import esf
+
+theory_dict = {
+    "Q0": 1,
+    "nf0": 3,
+    "PTO": 0,
+    "alphas": 0.118,
+    "Qref": 91.2,
+    "CKM": "0.97428 0.22530 0.003470 0.22520 0.97345 0.041000 0.00862 0.04030 0.999152",
+    "XIF": 1,
+    "XIR": 1,
+    "TMC": 0,
+    "FNS": "FFNS",
+    "NfFF": 5,
+    "DAMP": 0,
+    "MP": 0.938,
+    "HQ": "POLE",
+    "mc": 2,
+    "mb": 4,
+    "mt": 173.07,
+    "Qmc": 2,
+    "Qmb": 4,
+    "Qmt": 173.07,
+    "kcThr": 1.0,
+    "kbThr": 1.0,
+    "ktThr": 1.0,
+    "MaxNfPdf": 6,
+    "MaxNfAs": 6,
+    "MZ": 91.1876,
+    "MW": 90.398,
+    "GF": 1.1663787e-05,
+    "SIN2TW": 0.23126,
+    "ModEv": "EXA",
+    "n3lo_cf_variation": 0,
+}
+
+obs_dict = {
+    "observables": {"": []},
+    "interpolation_xgrid": [0.001, 0.01, 0.1, 0.5, 1.0],
+    "prDIS": "EM",
+    "PolarizationDIS": 0.0,
+    "ProjectileDIS": "electron",
+    "TargetDIS": "proton",
+    "PropagatorCorrection": 0.0,
+    "interpolation_is_log": 1.0,
+    "interpolation_polynomial_degree": 4,
+    "NCPositivityCharge": None,
+}
+
+
+def kinematics(Q2s, xs=(0.1,), y=0.1):
+    """Kinematic points, on all the combinations of ``Q2s`` and ``xs``."""
+    return [{"Q2": Q2, "x": x, "y": y} for Q2 in Q2s for x in xs]
+
+
+def runcards(observables, theory=None, **updates):
+    """Runcards of a NC calculation.
+
+    Parameters
+    ----------
+    observables : dict
+        kinematic points, by observable name
+    theory : dict
+        updates of :data:`theory_dict`
+    updates : dict
+        updates of :data:`obs_dict`
+
+    Returns
+    -------
+    dict
+        theory runcard
+    dict
+        observables runcard
+    """
+    th = dict(copy.deepcopy(theory_dict), **(theory or {}))
+    obs = dict(
+        copy.deepcopy(obs_dict),
+        prDIS="NC",
+        observables=copy.deepcopy(observables),
+    )
+    obs.update(updates)
+    return th, obs
+
+
+_plain_outputs = {}
+"""Outputs of :func:`plain_output`, by runcards"""
+
+
+def plain_output(theory, observables):
+    """Compute the output of a plain run, without any optional feature.
+
+    The outputs are computed once per runcards, and shared by all the tests
+    (the results are read-only).
+    """
+    key = json.dumps([theory, observables], sort_keys=True)
+    if key not in _plain_outputs:
+        runner = yadism.runner.Runner(theory, observables)
+        _plain_outputs[key] = runner.get_result()
+    return _plain_outputs[key]
+
+
+def assert_same_results(out, ref, names, atol=None):
+    """Check that two outputs contain the same results.
+
+    Parameters
+    ----------
+    out : dict
+        results, by observable name
+    ref : dict
+        reference results, by observable name
+    names : list(str)
+        observables to compare
+    atol : float or None
+        absolute tolerance on the values, if not given the results have to be
+        identical (errors included)
+    """
+    for name in names:
+        assert len(out[name]) == len(ref[name])
+        for res, res_ref in zip(out[name], ref[name]):
+            assert (res.x, res.Q2) == (res_ref.x, res_ref.Q2)
+            if atol is None:
+                assert res.get_raw() == res_ref.get_raw()
+                continue
+            assert res.orders.keys() == res_ref.orders.keys()
+            for o, (val, _err) in res_ref.orders.items():
+                np.testing.assert_allclose(res.orders[o][0], val, atol=atol)
+
+
+def record_computed(monkeypatch):
+    """Record the structure functions actually computed.
+
+    Returns
+    -------
+    list(tuple)
+        observable name, ``x``, and ``Q2`` of each computed structure function,
+        filled while the runner computes them
+    """
+    records = []
+    compute_local = esf.EvaluatedStructureFunction.compute_local
+
+    def spy(self):
+        if not self._computed:
+            records.append((self.info.obs_name.name, self.x, self.Q2))
+        compute_local(self)
+
+    monkeypatch.setattr(esf.EvaluatedStructureFunction, "compute_local", spy)
+    return records
+
+
+def record_compute_groups(monkeypatch):
+    """Record the groups of points actually computed by the runner.
+
+    Returns
+    -------
+    list(tuple)
+        groups passed to :meth:`yadism.runner.Runner._compute_serial`, filled
+        while the runner computes them
+    """
+    records = []
+    compute_serial = yadism.runner.Runner._compute_serial
+
+    def spy(runner, groups):
+        records.extend(groups)
+        return compute_serial(runner, groups)
+
+    monkeypatch.setattr(yadism.runner.Runner, "_compute_serial", spy)
+    return records